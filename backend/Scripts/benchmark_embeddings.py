@@ -0,0 +1,111 @@
+"""
+Benchmark embedding backends: PyTorch vs ONNX Runtime (fp32 / int8)
+
+Each backend runs in a fresh process so peak memory is measured in isolation.
+
+Usage:
+    python Scripts/benchmark_embeddings.py [--texts 512] [--batch-size 32]
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+SAMPLE_TEXTS = [
+    "How to become a software engineer after 12th?",
+    "IIT Bombay computer science fees and average package",
+    "JEE Main exam eligibility, syllabus and important dates",
+    "Career options after BCom in India with good salary",
+    "NEET cutoff for government MBBS colleges in Maharashtra",
+    "Difference between BTech and BSc Computer Science",
+    "What skills does a data scientist need?",
+    "Best colleges for BBA in Delhi",
+]
+
+
+def _peak_rss_mb() -> float:
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS bytes
+        return round(peak / 1024 / (1024 if sys.platform == "darwin" else 1), 1)
+    except ImportError:
+        return float("nan")
+
+
+def _run_backend(variant: str, texts, batch_size: int) -> dict:
+    import numpy as np
+    from ai_career_advisor.RAG.embeddings import EmbeddingService
+    from ai_career_advisor.RAG.onnx_embedder import OnnxEmbedder
+    from ai_career_advisor.RAG.rag_config import get_embedding_config, resolve_repo_path
+
+    onnx_config = get_embedding_config().get("onnx") or {}
+    model_dir = resolve_repo_path(onnx_config.get("model_dir", f"backend/models/embeddings/{EmbeddingService.MODEL_NAME}-onnx"))
+    max_seq_length = onnx_config.get("max_seq_length", 256)
+
+    start = time.perf_counter()
+    if variant == "torch":
+        model = EmbeddingService._load_torch_model()
+    else:
+        quantized = variant == "onnx-int8"
+        if not OnnxEmbedder.is_exported(model_dir, quantized):
+            OnnxEmbedder.export(EmbeddingService.MODEL_NAME, model_dir, quantize=quantized, max_seq_length=max_seq_length)
+        model = OnnxEmbedder(model_dir, quantized=quantized, max_seq_length=max_seq_length)
+    load_seconds = time.perf_counter() - start
+
+    model.encode(texts[:batch_size])  # warm-up
+
+    start = time.perf_counter()
+    for text in texts[:64]:
+        model.encode([text])
+    single_rate = 64 / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    vectors = np.asarray(model.encode(texts, batch_size=batch_size), dtype=np.float32)
+    batch_rate = len(texts) / (time.perf_counter() - start)
+
+    return {
+        "variant": variant,
+        "load_s": round(load_seconds, 2),
+        "single_per_s": round(single_rate, 1),
+        "batch_per_s": round(batch_rate, 1),
+        "peak_rss_mb": _peak_rss_mb(),
+        "vectors": vectors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--variants", default="torch,onnx-fp32,onnx-int8")
+    args = parser.parse_args()
+
+    texts = [f"{SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)]} ({i})" for i in range(args.texts)]
+    ctx = multiprocessing.get_context("spawn")
+
+    results = []
+    for variant in args.variants.split(","):
+        with ctx.Pool(1) as pool:
+            results.append(pool.apply(_run_backend, (variant.strip(), texts, args.batch_size)))
+
+    reference = next((r["vectors"] for r in results if r["variant"] == "torch"), None)
+
+    print(f"\n{'variant':<12}{'load s':>8}{'1-text/s':>10}{'batch/s':>10}{'peak MB':>10}{'min cos':>10}")
+    for r in results:
+        min_cos = ""
+        if reference is not None:
+            min_cos = f"{float((reference * r['vectors']).sum(axis=1).min()):.4f}"
+        print(
+            f"{r['variant']:<12}{r['load_s']:>8}{r['single_per_s']:>10}"
+            f"{r['batch_per_s']:>10}{r['peak_rss_mb']:>10}{min_cos:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark intent classification: one forward pass per query vs batched inference
+
+Compares IntentClassifier.predict() in a loop (the old /intent/classify/batch path)
+with predict_batch() at several batch sizes, and checks both agree.
+
+Usage:
+    python Scripts/benchmark_intent_batch.py [--texts 2000] [--batch-sizes 8,32,64]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir / "src"))
+
+SAMPLE_QUERIES = [
+    "hi",
+    "best iit for computer science",
+    "jee mains cutoff for nit trichy",
+    "How to become a data scientist after 12th commerce?",
+    "What is the difference between BTech and BE, and which one has better placements in India?",
+    "suggest me a career based on my interest in biology and drawing",
+    "neet exam date",
+    "what is the weather today",
+    "Which degree should I choose if I want to work in investment banking and later do an MBA abroad?",
+    "thanks, bye",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--batch-sizes", default="8,32,64")
+    args = parser.parse_args()
+
+    from ai_career_advisor.ml_models.intent_classifier import get_intent_classifier
+
+    classifier = get_intent_classifier()
+    texts = [SAMPLE_QUERIES[i % len(SAMPLE_QUERIES)] + f" ({i})" for i in range(args.texts)]
+
+    classifier.predict_batch(texts[:64])  # warm-up
+
+    start = time.perf_counter()
+    reference = [classifier.predict(text) for text in texts]
+    loop_seconds = time.perf_counter() - start
+
+    print(f"\n{'path':<18}{'seconds':>10}{'queries/s':>12}{'speedup':>10}{'agree':>8}")
+    print(f"{'predict() loop':<18}{loop_seconds:>10.2f}{len(texts) / loop_seconds:>12.1f}{'1.0x':>10}{'-':>8}")
+
+    for batch_size in (int(b) for b in args.batch_sizes.split(",")):
+        start = time.perf_counter()
+        batched = classifier.predict_batch(texts, batch_size=batch_size)
+        seconds = time.perf_counter() - start
+
+        agree = sum(a[0] == b[0] for a, b in zip(reference, batched)) / len(texts)
+        print(
+            f"{f'batch={batch_size}':<18}{seconds:>10.2f}{len(texts) / seconds:>12.1f}"
+            f"{f'{loop_seconds / seconds:.1f}x':>10}{agree:>8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
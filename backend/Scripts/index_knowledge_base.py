@@ -5,7 +5,7 @@ from pathlib import Path
 backend_dir = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(backend_dir / "src"))
 
-from ai_career_advisor.RAG.knowledge_loader import KnowledgeLoader
+from ai_career_advisor.RAG.index_sync import KnowledgeIndexSync
 from ai_career_advisor.RAG.embeddings import EmbeddingService
 from ai_career_advisor.RAG.vector_store import VectorStore
 from ai_career_advisor.core.logger import logger
@@ -17,55 +17,20 @@ async def index_knowledge_base():
     logger.info("🚀 KNOWLEDGE BASE INDEXING STARTED")
     logger.info("=" * 60)
     
-    logger.info("\n Step 1: Loading documents from database...")
-    documents = await KnowledgeLoader.load_all()
-    
-    if not documents:
-        logger.error(" No documents found to index!")
-        return
-    
-    logger.success(f" Loaded {len(documents)} documents\n")
-    
-    
-    logger.info(" Step 2: Generating embeddings...")
-    logger.info(" This may take 5-15 minutes depending on data size...")
-    logger.info(" Tip: Go grab a coffee! \n")
-    
-    texts = [doc["content"] for doc in documents]
-    embeddings = await EmbeddingService.generate_batch_embeddings(texts)
-    
-    valid_count = len([e for e in embeddings if e is not None])
-    logger.success(f" Generated {valid_count}/{len(texts)} embeddings\n")
-    
-
-    logger.info(" Step 3: Storing in ChromaDB...")
+    logger.info("\n Step 1-3: Syncing database documents into ChromaDB...")
+    logger.info(" First run embeds everything (5-15 minutes), later runs only changed docs\n")
     
     vs = VectorStore()
+    collection = vs.get_or_create_collection(vs.resolve_alias("career_knowledge"))
     
+    # Full hash comparison: unchanged docs are skipped, learned llm_* docs are kept
+    stats = await KnowledgeIndexSync.sync(vs, collection, full=True)
     
-    try:
-        vs.delete_collection("career_knowledge")
-        logger.info("  Deleted old index (if existed)")
-    except:
-        logger.info("  No old index found (first run)")
-    
-    # Create fresh collection
-    collection = vs.get_or_create_collection("career_knowledge")
-    
-    # Prepare data
-    ids = [doc["id"] for doc in documents]
-    metadatas = [doc["metadata"] for doc in documents]
-    
-    # Add to collection
-    vs.add_documents(
-        collection=collection,
-        documents=texts,
-        embeddings=embeddings,
-        metadatas=metadatas,
-        ids=ids
-    )
+    if not stats["loaded"]:
+        logger.error(" No documents found to index!")
+        return
     
-    logger.success(f" Stored {valid_count} documents in ChromaDB\n")
+    logger.success(f" Upserted {stats['upserted']} documents ({stats['unchanged']} unchanged, {stats['deleted']} deleted)\n")
     
     # Step 4: Test search
     logger.info(" Step 4: Testing semantic search...\n")
@@ -90,10 +55,10 @@ async def index_knowledge_base():
     logger.success(" KNOWLEDGE BASE INDEXING COMPLETE!")
     logger.info("=" * 60)
     logger.info(f"\n Summary:")
-    logger.info(f"   Total documents loaded: {len(documents)}")
-    logger.info(f"   Embeddings generated: {valid_count}")
+    logger.info(f"   Total documents loaded: {stats['loaded']}")
+    logger.info(f"   Embeddings generated: {stats['upserted']}")
     logger.info(f"   Storage location: {vs.persist_directory}")
-    logger.info(f"   Collection name: career_knowledge")
+    logger.info(f"   Collection name: {collection.name}")
     logger.info(f"\n Your chatbot knowledge base is ready!")
     logger.info("=" * 60)
 
@@ -0,0 +1,65 @@
+"""add unique guards for shared roadmaps and program cache
+
+Revision ID: a7c3e9d21f04
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9d21f04'
+down_revision: Union[str, Sequence[str], None] = 'f1a2b3c4d5e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Only one shared roadmap per career and one cache row per program check."""
+    # Keep the newest shared roadmap per career (the one get_by_career returns)
+    op.execute("""
+        DELETE FROM backward_roadmaps
+        WHERE user_id IS NULL
+          AND id NOT IN (
+              SELECT MAX(id) FROM backward_roadmaps
+              WHERE user_id IS NULL
+              GROUP BY lower(normalized_career)
+          )
+    """)
+    op.create_index(
+        'uq_backward_roadmaps_shared_career',
+        'backward_roadmaps',
+        [sa.text('lower(normalized_career)')],
+        unique=True,
+        sqlite_where=sa.text('user_id IS NULL'),
+        postgresql_where=sa.text('user_id IS NULL')
+    )
+
+    # college_program_cache is created via metadata.create_all on some setups
+    inspector = sa.inspect(op.get_bind())
+    if 'college_program_cache' in inspector.get_table_names():
+        op.execute("""
+            DELETE FROM college_program_cache
+            WHERE id NOT IN (
+                SELECT MAX(id) FROM college_program_cache
+                GROUP BY college_id, degree, branch
+            )
+        """)
+        op.create_index(
+            'uq_program_cache_college_degree_branch',
+            'college_program_cache',
+            ['college_id', 'degree', 'branch'],
+            unique=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the unique guards."""
+    inspector = sa.inspect(op.get_bind())
+    if 'college_program_cache' in inspector.get_table_names():
+        op.drop_index('uq_program_cache_college_degree_branch', table_name='college_program_cache')
+    op.drop_index('uq_backward_roadmaps_shared_career', table_name='backward_roadmaps')
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -69,3 +69,45 @@ class BackwardPlannerSuccessResponse(BaseModel):
     success: bool = True
     source: str  # "template", "llm_generated", or "cache"
     roadmap: BackwardRoadmapResponse
+
+
+# =============================
+# LLM OUTPUT SCHEMAS (structured output validation)
+# =============================
+
+class RoadmapLLMOutput(BaseModel):
+    """
+    Roadmap JSON produced by the planner LLM
+    Mandatory fields must be non-empty; optional sections stay flexible
+    """
+    career_name: str = Field(..., min_length=1)
+    career_description: str = Field(..., min_length=1)
+    required_education: Any
+    entrance_exams: Any
+
+    stream_recommendation: Optional[Any] = None
+    skills_required: Optional[Any] = None
+    timeline: Optional[Any] = None
+    projects_to_build: Optional[Any] = None
+    certifications: Optional[Any] = None
+    internships: Optional[Any] = None
+    top_colleges: Optional[Any] = None
+    career_prospects: Optional[Any] = None
+
+    model_config = {"extra": "allow"}
+
+    @field_validator("required_education", "entrance_exams")
+    @classmethod
+    def not_empty(cls, value):
+        if not value:
+            raise ValueError("must not be empty")
+        return value
+
+
+class CareerNormalizationLLMOutput(BaseModel):
+    """Normalizer LLM verdict"""
+    is_valid: bool
+    normalized_career: Optional[str] = None
+    category: Optional[str] = None
+    confidence: float = Field(0.0, ge=0.0, le=1.0)
+    reason: Optional[str] = None
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from typing import List, Dict, Optional  
 
 
@@ -11,3 +11,25 @@ class CareerInsightResponse(BaseModel):
     top_salary: Optional[str] = None  
     class Config:
         from_attributes = True
+
+
+class InsightProjects(BaseModel):
+    production: List[str] = []
+    research: List[str] = []
+
+
+class CareerInsightLLMOutput(BaseModel):
+    """Structured-output schema for the insight LLM call"""
+    skills: List[str]
+    internships: List[str]
+    projects: InsightProjects
+    programs: List[str]
+    top_salary: str
+
+    @field_validator("projects", mode="before")
+    @classmethod
+    def normalize_projects(cls, value):
+        # Older prompts/models return a flat list of projects
+        if isinstance(value, list):
+            return {"production": value[:2], "research": value[2:3]}
+        return value
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from typing import Optional, List
 
 
@@ -17,3 +17,36 @@ class CollegeResponse(BaseModel):
 class CollegeListResponse(BaseModel):
     count: int
     colleges: List[CollegeResponse]
+
+
+# =============================
+# LLM OUTPUT SCHEMA (college details extraction)
+# =============================
+
+class CollegeDetailField(BaseModel):
+    """One extracted value with its source ("Not available" is a valid value)"""
+    value: str
+    source_url: Optional[str] = None
+    note: Optional[str] = None
+
+    @field_validator("value")
+    @classmethod
+    def not_blank(cls, value):
+        if not value.strip() or value.strip().lower() in ("null", "none", "n/a"):
+            raise ValueError("must not be empty")
+        return value
+
+
+class CollegeDetailsLLMOutput(BaseModel):
+    """Program details produced by the college extractor (Perplexity web search)"""
+    college_name: str
+    degree: str
+    branch: str
+    data_year: Optional[str] = None
+
+    college_website: Optional[CollegeDetailField] = None
+    fees: CollegeDetailField
+    avg_package: CollegeDetailField
+    highest_package: CollegeDetailField
+    entrance_exam: CollegeDetailField
+    cutoff: CollegeDetailField
@@ -71,9 +71,10 @@ class CareerAgent:
         """Classify user intent using existing DistilBERT classifier"""
         try:
             from ai_career_advisor.services.intentfilter import IntentFilter
+            from ai_career_advisor.services import query_keywords
             
             last_message = state["messages"][-1].content
-            intent_result = IntentFilter.is_career_related(last_message)
+            intent_result = await IntentFilter.is_career_related_async(last_message)
             
             # Determine intent
             if intent_result.get("is_greeting"):
@@ -81,13 +82,8 @@ class CareerAgent:
             elif not intent_result["is_career"]:
                 state["intent"] = "rejected"
             else:
-                # Check for roadmap keywords
-                query_lower = last_message.lower()
-                roadmap_keywords = [
-                    "want to become", "how to become", "kaise bane",
-                    "roadmap", "path to become", "steps to become"
-                ]
-                if any(kw in query_lower for kw in roadmap_keywords):
+                # Check for roadmap keywords (same list as ChatbotService)
+                if "roadmap" in query_keywords.scan_query(last_message):
                     state["intent"] = "roadmap_request"
                 else:
                     state["intent"] = intent_result.get("intent", "career_query")
@@ -199,7 +195,7 @@ Please ask a career or education-related question! 😊"""
             
             # For general career queries, try RAG first
             from ai_career_advisor.RAG.retriever import retriever
-            rag_result = await retriever.search_and_build_context(user_query, top_k=5)
+            rag_result = await retriever.search_and_build_context(user_query, intent=intent)
             
             if rag_result["found"]:
                 tool_outputs["rag"] = {
@@ -267,6 +263,7 @@ INSTRUCTIONS:
             
         except Exception as e:
             logger.error(f"LLM synthesis error: {e}")
+            state["tool_outputs"] = {**tool_outputs, "error": str(e)}
             fallback = f"I cannot generate a response right now. Error: {str(e)}"
             state["messages"].append(AIMessage(content=fallback))
         
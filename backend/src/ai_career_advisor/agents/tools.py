@@ -110,7 +110,8 @@ async def search_web_tool(query: str) -> Dict[str, Any]:
     """
     try:
         from ai_career_advisor.core.config import settings
-        import httpx
+        from ai_career_advisor.core.http_client import get_http_client, PERPLEXITY_CHAT_URL
+        from ai_career_advisor.core.rate_limiter import RateLimiter
         
         PERPLEXITY_API_KEY = settings.PERPLEXITY_API_KEY
         
@@ -130,9 +131,10 @@ INSTRUCTIONS:
 - Keep response under 250 words
 - Be factual and cite official sources"""
 
-        async with httpx.AsyncClient(timeout=45.0) as client:
+        client = get_http_client(PERPLEXITY_CHAT_URL)
+        async with RateLimiter.permit("perplexity", PERPLEXITY_API_KEY, "sonar") as permit:
             response = await client.post(
-                "https://api.perplexity.ai/chat/completions",
+                PERPLEXITY_CHAT_URL,
                 headers={
                     "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
                     "Content-Type": "application/json"
@@ -143,25 +145,27 @@ INSTRUCTIONS:
                         {"role": "system", "content": "You are an expert Indian education and career counselor."},
                         {"role": "user", "content": prompt}
                     ]
-                }
+                },
+                timeout=45.0
             )
+            permit.observe_status(response.status_code, response.headers.get("retry-after"))
+        
+        if response.status_code == 200:
+            data = response.json()
+            answer = data["choices"][0]["message"]["content"].strip()
+            citations = data.get("citations", [])
+            
+            return {
+                "success": True,
+                "answer": answer,
+                "sources": citations[:5] if citations else ["Web Search"]
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"API error: {response.status_code}"
+            }
             
-            if response.status_code == 200:
-                data = response.json()
-                answer = data["choices"][0]["message"]["content"].strip()
-                citations = data.get("citations", [])
-                
-                return {
-                    "success": True,
-                    "answer": answer,
-                    "sources": citations[:5] if citations else ["Web Search"]
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"API error: {response.status_code}"
-                }
-                
     except Exception as e:
         logger.error(f"Web search tool error: {e}")
         return {
@@ -1,32 +1,186 @@
 from fastapi import APIRouter
 from ai_career_advisor.services.scheduler import scheduler
 from ai_career_advisor.core.logger import logger
+from ai_career_advisor.core.http_client import HTTPClientPool
+from ai_career_advisor.core.llm_cache import LLMCache
+from ai_career_advisor.core.rate_limiter import RateLimiter
+from ai_career_advisor.core.circuit_breaker import CircuitBreakerRegistry
+from ai_career_advisor.core.hedging import Hedger
+from ai_career_advisor.services.answer_cache import SemanticAnswerCache
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
 @router.post("/reindex-knowledge-base")
-async def trigger_reindex():
-    logger.info("Manual re-index triggered by admin")
-    scheduler.trigger_manual_reindex()
+async def trigger_reindex(full: bool = False):
+    logger.info(f"Manual {'full ' if full else ''}re-index triggered by admin")
+    started = scheduler.trigger_manual_reindex(full=full)
     
     return {
-        "message": "Re-indexing started in background",
-        "status": "processing"
+        "message": "Re-indexing started in background" if started else "Re-indexing already in progress",
+        "mode": "blue_green" if full else "incremental",
+        "status": "processing",
+        "progress": scheduler.progress
     }
 
 
+@router.get("/reindex-knowledge-base")
+async def get_reindex_progress():
+    from ai_career_advisor.RAG.vector_store import vector_store
+    
+    return {
+        "progress": scheduler.progress,
+        "last_result": scheduler.last_result,
+        "alias": vector_store.get_alias_info("career_knowledge")
+    }
+
+
+@router.post("/reindex-knowledge-base/rollback")
+async def rollback_reindex():
+    from ai_career_advisor.RAG.vector_store import vector_store
+    
+    previous = vector_store.rollback_alias("career_knowledge")
+    if not previous:
+        return {"status": "noop", "message": "No previous collection to roll back to"}
+    
+    logger.warning(f"Knowledge base rolled back to {previous} by admin")
+    SemanticAnswerCache.invalidate("knowledge base rolled back")
+    return {"status": "rolled_back", "collection": previous}
+
+
 @router.get("/scheduler-status")
 async def get_scheduler_status():
     job = scheduler.scheduler.get_job('weekly_reindex')
+    nightly = scheduler.scheduler.get_job('nightly_sync')
     
     if job:
         return {
             "status": "running",
             "next_run": job.next_run_time.isoformat(),
-            "schedule": "Every Sunday 2:00 AM IST"
+            "next_incremental_run": nightly.next_run_time.isoformat() if nightly else None,
+            "schedule": "Nightly sync 2:00 AM IST, full re-index Sunday 3:00 AM IST",
+            "last_result": scheduler.last_result
         }
     else:
         return {
             "status": "not_running"
         }
+
+
+@router.get("/http-pool-stats")
+async def get_http_pool_stats():
+    return HTTPClientPool.get_stats()
+
+
+@router.get("/llm-cache-stats")
+async def get_llm_cache_stats():
+    return LLMCache.get_stats()
+
+
+@router.get("/rate-limit-stats")
+async def get_rate_limit_stats():
+    return RateLimiter.get_stats()
+
+
+@router.get("/circuit-breakers")
+async def get_circuit_breakers():
+    return CircuitBreakerRegistry.get_stats()
+
+
+@router.get("/hedging-stats")
+async def get_hedging_stats():
+    return Hedger.get_stats()
+
+
+@router.get("/semantic-cache-stats")
+async def get_semantic_cache_stats():
+    return SemanticAnswerCache.get_stats()
+
+
+@router.post("/semantic-cache/clear")
+async def clear_semantic_cache():
+    SemanticAnswerCache.invalidate("cleared by admin")
+    return SemanticAnswerCache.get_stats()
+
+
+@router.get("/learned-docs-stats")
+async def get_learned_docs_stats():
+    from ai_career_advisor.RAG.learned_writer import LearnedDocWriter
+    
+    return LearnedDocWriter.get_stats()
+
+
+@router.post("/learned-docs/evict")
+async def evict_learned_docs():
+    from ai_career_advisor.RAG.learned_writer import LearnedDocWriter
+    
+    return await LearnedDocWriter.evict()
+
+
+@router.get("/embedding-cache-stats")
+async def get_embedding_cache_stats():
+    from ai_career_advisor.RAG.embedding_cache import EmbeddingCache
+    
+    return EmbeddingCache.get_stats()
+
+
+@router.get("/embedding-batcher-stats")
+async def get_embedding_batcher_stats():
+    from ai_career_advisor.RAG.embeddings import EmbeddingService
+    
+    return EmbeddingService.get_batcher_stats()
+
+
+@router.get("/intent-batcher-stats")
+async def get_intent_batcher_stats():
+    from ai_career_advisor.services.intentfilter import IntentFilterML
+    
+    return IntentFilterML.get_batcher_stats()
+
+
+@router.get("/intent-memo-stats")
+async def get_intent_memo_stats():
+    from ai_career_advisor.services.intent_memo import IntentMemo
+    
+    return IntentMemo.get_stats()
+
+
+@router.post("/intent-memo/clear")
+async def clear_intent_memo():
+    from ai_career_advisor.services.intent_memo import IntentMemo
+    
+    IntentMemo.clear()
+    return IntentMemo.get_stats()
+
+
+@router.get("/model-monitor")
+async def get_model_monitor_metrics():
+    """Intent confidence drift + cache hit rates"""
+    from ai_career_advisor.services.monitoring_service import monitor
+    
+    return monitor.get_metrics()
+
+
+@router.get("/rag-compare")
+async def compare_rag_modes(query: str, top_k: int = 5, intent: str = None):
+    """Side-by-side dense / bm25 / hybrid results for one query (optionally on an intent's route)"""
+    import asyncio
+    from ai_career_advisor.RAG.retriever import retriever
+    
+    modes = ["dense", "bm25", "hybrid"]
+    route = retriever.get_route(intent)
+    results = await asyncio.gather(*(
+        retriever.search(query, top_k=top_k, mode=m, sources=route["sources"]) for m in modes
+    ))
+    
+    return {
+        "query": query,
+        "route": route,
+        "results": {
+            mode: [
+                {"id": doc_id, "score": round(score, 4), "preview": doc[:160]}
+                for doc_id, score, doc in zip(result["ids"], result["scores"], result["documents"])
+            ]
+            for mode, result in zip(modes, results)
+        }
+    }
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_career_advisor.core.database import get_db
 from ai_career_advisor.core.logger import logger
+from ai_career_advisor.core.single_flight import SingleFlight
 from ai_career_advisor.Schemas.backward_planner import (
     BackwardPlannerRequest,
     BackwardPlannerSuccessResponse,
@@ -17,6 +18,9 @@ from ai_career_advisor.services.backward_planner_llm import BackwardPlannerLLM
 
 router = APIRouter(prefix="/backward-planner", tags=["Backward Planner"])
 
+# Concurrent requests for the same career share one LLM generation
+roadmap_generation_flight = SingleFlight("backward_planner")
+
 
 @router.post("/generate", response_model=BackwardPlannerSuccessResponse)
 async def generate_backward_roadmap(
@@ -117,9 +121,12 @@ async def generate_backward_roadmap(
     # =============================
     logger.info(f"🤖 No cache/template found. Generating with AI...")
     
-    generated = await BackwardPlannerLLM.generate_roadmap(
-        career_name=career_name,
-        category=category
+    generated = await roadmap_generation_flight.do(
+        career_name.lower(),
+        lambda: BackwardPlannerLLM.generate_roadmap(
+            career_name=career_name,
+            category=category
+        )
     )
     
     # Handle generation errors
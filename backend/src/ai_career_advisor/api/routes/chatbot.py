@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from ai_career_advisor.Schemas.chatbot import (
     IntentCheckRequest,
@@ -14,6 +15,7 @@ from ai_career_advisor.models.chatconversation import ChatConversation
 from ai_career_advisor.core.database import get_db
 from ai_career_advisor.core.logger import logger
 from sqlalchemy import select
+import json
 
 router = APIRouter(prefix="/chatbot", tags=["Chatbot"])
 
@@ -23,7 +25,7 @@ async def check_intent(request: IntentCheckRequest):
     try:
         logger.info(f"Checking intent for: {request.query}")
         
-        result = IntentFilter.is_career_related(request.query)
+        result = await IntentFilter.is_career_related_async(request.query)
         
         return {
             "query": request.query,
@@ -69,6 +71,33 @@ async def ask_chatbot(
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
+@router.post("/ask/stream")
+async def ask_chatbot_stream(request: ChatbotAskRequest):
+    """
+    Server-Sent Events version of /ask
+    - event: start  → {"session_id"}
+    - event: token  → {"text"} (repeated)
+    - event: done   → sources, confidence, response_type, response_time, time_to_first_token
+    """
+    logger.info(f"Chatbot ask (stream): {request.query}")
+    
+    async def event_source():
+        async for event in ChatbotService.ask_stream(
+            query=request.query,
+            session_id=request.sessionid,
+            user_email=None,
+            model_preference=request.model
+        ):
+            payload = json.dumps(event["data"], ensure_ascii=False)
+            yield f"event: {event['event']}\ndata: {payload}\n\n"
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/history/{sessionid}")
 async def get_conversation_history(
     sessionid: str,
@@ -11,9 +11,8 @@ from ai_career_advisor.services.college_program_check import CollegeProgramCheck
 
 router = APIRouter(prefix="/colleges", tags=["Colleges"])
 
-# ✅ Free tier safe settings
+# ✅ Free tier safe settings (request pacing is handled by core.rate_limiter)
 PROGRAM_CHECK_BATCH_SIZE = 5  # Batch size for parallel checks
-BATCH_DELAY = 4  # Delay between batches (seconds)
 
 
 class CollegeFinderRequest(BaseModel):
@@ -39,16 +38,6 @@ async def check_programs_in_batches(colleges, degree: str, branch: str, db: Asyn
     Check programs in controlled batches with caching
     Uses database cache to avoid repeated LLM calls
     """
-    async def check_one(college):
-        result = await CollegeProgramCheckService.check_with_cache(
-            db=db,
-            college_id=college.id,
-            college_name=college.name,
-            degree=degree,
-            branch=branch
-        )
-        return (college, result)
-    
     all_results = []
     total = len(colleges)
     
@@ -59,14 +48,14 @@ async def check_programs_in_batches(colleges, degree: str, branch: str, db: Asyn
         
         print(f"🔍 Processing batch {batch_num}/{total_batches} ({len(batch)} colleges)")
         
-        # Process batch in parallel
-        batch_results = await asyncio.gather(*[check_one(c) for c in batch])
-        all_results.extend(batch_results)
-        
-        # Delay between batches (NOT after last batch)
-        if i + PROGRAM_CHECK_BATCH_SIZE < total:
-            print(f"⏳ Waiting {BATCH_DELAY}s before next batch (rate limit safety)")
-            await asyncio.sleep(BATCH_DELAY)
+        # Process batch in parallel (LLM calls only; cache rows are written in order)
+        batch_results = await CollegeProgramCheckService.check_many_with_cache(
+            db=db,
+            colleges=batch,
+            degree=degree,
+            branch=branch
+        )
+        all_results.extend(zip(batch, batch_results))
     
     return all_results
 
@@ -100,6 +89,9 @@ async def check_availability(
         branch=payload.branch
     )
     
+    # Persist the cache row added by check_with_cache
+    await db.commit()
+    
     return {
         "id": college.id,
         "offers_program": offers,
@@ -6,15 +6,19 @@ Useful for debugging and demo during interviews.
 """
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional
 
 from ai_career_advisor.services.intentfilter import IntentFilterML
+from ai_career_advisor.core.executors import run_intent
 from ai_career_advisor.core.logger import logger
 
 
 router = APIRouter(prefix="/intent", tags=["Intent Classification"])
 
+# Upper bound for a client-chosen batch size (texts per forward pass)
+MAX_BATCH_SIZE = 128
+
 
 class IntentRequest(BaseModel):
     """Request model for intent classification"""
@@ -31,6 +35,7 @@ class IntentRequest(BaseModel):
 class BatchIntentRequest(BaseModel):
     """Request model for batch intent classification"""
     queries: List[str]
+    batch_size: Optional[int] = Field(None, ge=1, le=MAX_BATCH_SIZE)  # default: INTENT_BATCH_SIZE
 
 
 class IntentResponse(BaseModel):
@@ -68,7 +73,7 @@ async def classify_intent(request: IntentRequest):
          -d '{"query": "best colleges for computer science"}'
     """
     try:
-        result = IntentFilterML.is_career_related(request.query)
+        result = await IntentFilterML.is_career_related_async(request.query)
         
         return IntentResponse(
             query=request.query,
@@ -95,7 +100,7 @@ async def classify_intent_detailed(request: IntentRequest):
     This demonstrates you understand multi-class classification.
     """
     try:
-        result = IntentFilterML.get_intent_details(request.query)
+        result = await run_intent(IntentFilterML.get_intent_details, request.query)
         
         return DetailedIntentResponse(
             text=result.get("text", request.query),
@@ -117,15 +122,17 @@ async def classify_batch(request: BatchIntentRequest):
     Useful for evaluating model performance on a test set.
     """
     try:
-        results = []
-        for query in request.queries:
-            result = IntentFilterML.is_career_related(query)
-            results.append({
+        # One batched DistilBERT pass instead of one forward pass per query
+        classified = await run_intent(IntentFilterML.classify_batch, request.queries, request.batch_size)
+        results = [
+            {
                 "query": query,
                 "intent": result.get("intent"),
                 "confidence": result.get("confidence"),
                 "method": result.get("method")
-            })
+            }
+            for query, result in zip(request.queries, classified)
+        ]
         
         return {"results": results, "count": len(results)}
     
@@ -165,7 +172,7 @@ async def intent_classifier_health():
     """
     try:
         # Test with a sample query
-        result = IntentFilterML.is_career_related("test query")
+        result = await IntentFilterML.is_career_related_async("test query")
         
         return {
             "status": "healthy",
@@ -3,6 +3,8 @@ from ai_career_advisor.core.logger import logger
 from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.middleware import add_middlewares
 from ai_career_advisor.services.scheduler import scheduler
+from ai_career_advisor.core.http_client import HTTPClientPool
+from ai_career_advisor.core.executors import shutdown_executors
 from contextlib import asynccontextmanager
 import ai_career_advisor.models
 
@@ -18,6 +20,14 @@ async def lifespan(app: FastAPI):
     logger.info("Application shutting down...")
     scheduler.stop()
     logger.info("Scheduler stopped")
+    # Write queued learned RAG documents before exit
+    try:
+        from ai_career_advisor.RAG.learned_writer import LearnedDocWriter
+        await LearnedDocWriter.flush()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not flush learned-doc queue: {e}")
+    await HTTPClientPool.close()
+    shutdown_executors()
 
 
 def create_app() -> FastAPI:
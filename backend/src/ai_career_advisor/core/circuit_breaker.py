@@ -0,0 +1,181 @@
+"""
+Circuit Breakers for LLM Providers
+One breaker per model and per API key: closed → open → half-open → closed
+Open circuits are skipped immediately instead of paying a failed round trip
+"""
+
+import hashlib
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because its circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Time-based circuit breaker
+    - CLOSED: calls flow; failures are tracked in a sliding time window
+    - OPEN: calls are refused until the cooldown (or Retry-After) expires
+    - HALF_OPEN: a single probe call decides between CLOSED and OPEN
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: Optional[float] = None,
+        window_seconds: Optional[float] = None,
+        min_calls: Optional[int] = None,
+        cooldown_seconds: Optional[float] = None
+    ):
+        self.name = name
+        self.failure_rate = failure_rate if failure_rate is not None else settings.CIRCUIT_FAILURE_RATE
+        self.window_seconds = window_seconds or settings.CIRCUIT_WINDOW_SECONDS
+        self.min_calls = min_calls or settings.CIRCUIT_MIN_CALLS
+        self.cooldown_seconds = cooldown_seconds or settings.CIRCUIT_COOLDOWN_SECONDS
+
+        self._state = self.CLOSED
+        self._open_until = 0.0
+        self._probe_started_at: Optional[float] = None
+        self._calls: Deque[Tuple[float, bool]] = deque()
+        self.stats = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() >= self._open_until:
+            self._state = self.HALF_OPEN
+            self._probe_started_at = None
+            logger.info(f"🟡 Circuit '{self.name}' half-open, allowing a probe")
+        return self._state
+
+    def is_open(self) -> bool:
+        """True when calls would be refused right now (does not consume a probe)"""
+        state = self.state
+        if state == self.OPEN:
+            return True
+        if state == self.HALF_OPEN:
+            return self._probe_running()
+        return False
+
+    def _probe_running(self) -> bool:
+        # A probe that was cancelled never reports back; let another one through after a cooldown
+        return (
+            self._probe_started_at is not None
+            and time.monotonic() - self._probe_started_at < self.cooldown_seconds
+        )
+
+    def allow_request(self) -> bool:
+        """Ask permission for one call (in half-open state only one probe is allowed)"""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_running():
+            self._probe_started_at = time.monotonic()
+            return True
+        self.stats["rejected"] += 1
+        return False
+
+    def _trim(self, now: float):
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+    def _open(self, cooldown: float, reason: str):
+        self._state = self.OPEN
+        self._open_until = time.monotonic() + cooldown
+        self._probe_started_at = None
+        self._calls.clear()
+        self.stats["opened"] += 1
+        logger.warning(f"🔴 Circuit '{self.name}' OPEN for {cooldown:.0f}s ({reason})")
+
+    def record_success(self):
+        self.stats["successes"] += 1
+        if self._state == self.HALF_OPEN:
+            logger.success(f"🟢 Circuit '{self.name}' closed after successful probe")
+            self._calls.clear()
+        self._state = self.CLOSED
+        self._probe_started_at = None
+        now = time.monotonic()
+        self._calls.append((now, True))
+        self._trim(now)
+
+    def record_failure(self, retry_after: Optional[float] = None):
+        """
+        Record a failed call
+
+        Args:
+            retry_after: Provider-supplied cooldown (rate limits open the circuit at once)
+        """
+        self.stats["failures"] += 1
+
+        if retry_after is not None:
+            self._open(max(retry_after, 1.0), "rate limited")
+            return
+
+        if self._state == self.HALF_OPEN:
+            self._open(self.cooldown_seconds, "probe failed")
+            return
+
+        now = time.monotonic()
+        self._calls.append((now, False))
+        self._trim(now)
+
+        failures = sum(1 for _, ok in self._calls if not ok)
+        if len(self._calls) >= self.min_calls and failures / len(self._calls) >= self.failure_rate:
+            self._open(self.cooldown_seconds, f"{failures}/{len(self._calls)} failures in {self.window_seconds:.0f}s")
+
+    def reset(self):
+        self._state = self.CLOSED
+        self._open_until = 0.0
+        self._probe_started_at = None
+        self._calls.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        state = self.state
+        return {
+            **self.stats,
+            "state": state,
+            "open_for": round(max(0.0, self._open_until - time.monotonic()), 1) if state == self.OPEN else 0.0,
+            "window_calls": len(self._calls)
+        }
+
+
+class CircuitBreakerRegistry:
+    """Process-wide breakers keyed by name (e.g. 'gemini:gemini-2.5-flash', 'gemini_key:ab12…')"""
+
+    _breakers: Dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def get(cls, name: str) -> CircuitBreaker:
+        breaker = cls._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            cls._breakers[name] = breaker
+        return breaker
+
+    @classmethod
+    def for_model(cls, provider: str, model: str) -> CircuitBreaker:
+        return cls.get(f"{provider}:{model}")
+
+    @classmethod
+    def for_key(cls, provider: str, api_key: str, model: Optional[str] = None) -> CircuitBreaker:
+        """Per-key breaker, optionally scoped to one model (quotas are per key *and* model)"""
+        key_id = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:10]
+        return cls.get(f"{provider}_key:{key_id}" + (f":{model}" if model else ""))
+
+    @classmethod
+    def reset_all(cls):
+        for breaker in cls._breakers.values():
+            breaker.reset()
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        return {name: breaker.get_stats() for name, breaker in cls._breakers.items()}
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional
 from pathlib import Path
 import os
 
@@ -25,6 +25,88 @@ class Settings(BaseSettings):
     GEMINI_API_KEY_3: Optional[str] = None  # Another alternative
     PERPLEXITY_API_KEY: Optional[str] = None
 
+    # Shared outbound HTTP pool
+    HTTP_CONNECT_TIMEOUT: float = 10.0
+    HTTP_READ_TIMEOUT: float = 60.0
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_MAX_KEEPALIVE_PER_HOST: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2_ENABLED: bool = True
+
+    # LLM response cache (shared tier uses REDIS_URL, else optional SQLite file)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 1024
+    LLM_CACHE_DEFAULT_TTL: int = 3600
+    LLM_CACHE_SQLITE_PATH: Optional[str] = None
+
+    # Provider rate limiting (token bucket per provider/key/model + AIMD concurrency)
+    RATE_LIMIT_GEMINI_RPM: float = 10.0
+    RATE_LIMIT_PERPLEXITY_RPM: float = 50.0
+    RATE_LIMIT_DEFAULT_RPM: float = 30.0
+    RATE_LIMIT_MAX_CONCURRENCY: int = 8
+    RATE_LIMIT_DEFAULT_COOLDOWN: float = 60.0
+
+    # Circuit breakers per model / API key
+    CIRCUIT_FAILURE_RATE: float = 0.5
+    CIRCUIT_WINDOW_SECONDS: float = 60.0
+    CIRCUIT_MIN_CALLS: int = 3
+    CIRCUIT_COOLDOWN_SECONDS: float = 30.0
+
+    # Hedged LLM requests (race a second provider when the primary is slower than its p95)
+    LLM_HEDGING_ENABLED: bool = False
+    LLM_HEDGE_DEFAULT_DELAY: float = 8.0
+    LLM_HEDGE_MIN_DELAY: float = 1.0
+    LLM_HEDGE_MAX_DELAY: float = 20.0
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_HEDGE_LATENCY_SAMPLES: int = 200
+    LLM_HEDGE_BUDGETS: Dict[str, float] = {"default": 0.1, "generate_smart": 0.1, "chatbot": 0.2}
+
+    # Dedicated executors (blocking provider I/O vs local CPU inference)
+    IO_EXECUTOR_WORKERS: int = 16
+    CPU_EXECUTOR_WORKERS: Optional[int] = None  # default: min(4, cpu_count)
+
+    # Embedding cache (content hash -> vector, versioned by model name)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_MEMORY_ENTRIES: int = 4096
+    EMBEDDING_CACHE_PATH: Optional[str] = None  # default: chroma_db/embedding_cache.sqlite
+
+    # Query embedding micro-batching (one encode() for concurrent requests)
+    EMBEDDING_BATCHING_ENABLED: bool = True
+    EMBEDDING_BATCH_MAX_SIZE: int = 32
+    EMBEDDING_BATCH_MAX_WAIT_MS: float = 5.0
+
+    # Semantic answer cache for the chatbot (query embedding -> final answer)
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 2000
+    SEMANTIC_CACHE_TTL: int = 21600       # knowledge-base / agent answers
+    SEMANTIC_CACHE_WEB_TTL: int = 3600    # web-search answers go stale faster
+
+    # Write-behind queue for learned (web-search) answers in the knowledge base
+    LEARNED_DOCS_ENABLED: bool = True
+    LEARNED_DOCS_MIN_CHARS: int = 200
+    LEARNED_DOCS_DEDUP_THRESHOLD: float = 0.95  # cosine similarity
+    LEARNED_DOCS_MAX: int = 5000
+    LEARNED_DOCS_TTL_DAYS: int = 30
+    LEARNED_DOCS_BATCH_SIZE: int = 16
+    LEARNED_DOCS_FLUSH_SECONDS: float = 2.0
+    LEARNED_DOCS_QUEUE_SIZE: int = 500
+
+    # Intent classifier batched inference (texts per DistilBERT forward pass)
+    INTENT_BATCH_SIZE: int = 32
+    # torch | torch-int8 | onnx | onnx-int8 (optimized variants need a passing parity check)
+    INTENT_MODEL_BACKEND: str = "torch"
+    # Async classification: dedicated pool + micro-batching of concurrent requests
+    INTENT_EXECUTOR_WORKERS: int = 1
+    INTENT_BATCHING_ENABLED: bool = True
+    INTENT_BATCH_MAX_WAIT_MS: float = 3.0
+    # Memo of intent results keyed by normalized query (cleared when the model changes)
+    INTENT_MEMO_ENABLED: bool = True
+    INTENT_MEMO_MAX_ENTRIES: int = 2048
+
+    # RAG settings file (embedding backend etc.), default: <repo>/configs/rag.yaml
+    RAG_CONFIG_PATH: Optional[str] = None
+
     API_PREFIX: str = "/api"
     PROJECT_NAME: str = "AI Career Advisor"
 
@@ -0,0 +1,82 @@
+"""
+Dedicated Thread Pools
+Blocking provider I/O and local CPU work (embeddings, ML inference) get separate,
+bounded executors instead of sharing asyncio's default pool
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+T = TypeVar("T")
+
+_io_executor: Optional[ThreadPoolExecutor] = None
+_cpu_executor: Optional[ThreadPoolExecutor] = None
+_intent_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Bounded pool for the remaining sync provider SDK calls"""
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(
+            max_workers=settings.IO_EXECUTOR_WORKERS,
+            thread_name_prefix="provider-io"
+        )
+    return _io_executor
+
+
+def get_cpu_executor() -> ThreadPoolExecutor:
+    """Bounded pool for local model inference (sentence-transformers, classifiers)"""
+    global _cpu_executor
+    if _cpu_executor is None:
+        workers = settings.CPU_EXECUTOR_WORKERS or min(4, os.cpu_count() or 1)
+        _cpu_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="local-cpu")
+    return _cpu_executor
+
+
+def get_intent_executor() -> ThreadPoolExecutor:
+    """Small pool for the intent classifier (first step of every chat message)"""
+    global _intent_executor
+    if _intent_executor is None:
+        _intent_executor = ThreadPoolExecutor(
+            max_workers=settings.INTENT_EXECUTOR_WORKERS,
+            thread_name_prefix="intent"
+        )
+    return _intent_executor
+
+
+async def run_io(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking provider call on the I/O pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), partial(fn, *args, **kwargs))
+
+
+async def run_cpu(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run local CPU-bound work on the CPU pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_cpu_executor(), partial(fn, *args, **kwargs))
+
+
+async def run_intent(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run intent classification on its dedicated pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_intent_executor(), partial(fn, *args, **kwargs))
+
+
+def shutdown_executors():
+    """Called from the FastAPI lifespan on shutdown"""
+    global _io_executor, _cpu_executor, _intent_executor
+    for executor in (_io_executor, _cpu_executor, _intent_executor):
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    _io_executor = None
+    _cpu_executor = None
+    _intent_executor = None
+    logger.info("🧵 Executors shut down")
@@ -0,0 +1,102 @@
+"""
+Gemini Client Pool
+Pre-built GenerativeModel objects per (API key, model), each bound to its own
+per-key client - no more genai.configure() on the hot path (global state, racy
+when two coroutines rotate keys at the same time)
+"""
+
+import asyncio
+import hashlib
+import threading
+from typing import Dict, Tuple
+
+import google.generativeai as genai
+from google.ai import generativelanguage as glm
+from google.api_core import client_options as client_options_lib
+
+from ai_career_advisor.core.logger import logger
+
+
+class GenaiClientPool:
+    """
+    Thread-safe registry of Gemini clients
+    - One GenerativeServiceClient per API key (sync, shared by all models)
+    - One GenerativeServiceAsyncClient per API key (grpc.aio, for *_async calls)
+    - One GenerativeModel per (key, model), reused across requests
+    """
+
+    _lock = threading.Lock()
+    _clients: Dict[str, glm.GenerativeServiceClient] = {}
+    _async_clients: Dict[str, glm.GenerativeServiceAsyncClient] = {}
+    _models: Dict[Tuple[str, str], genai.GenerativeModel] = {}
+
+    @staticmethod
+    def _key_id(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:10]
+
+    @classmethod
+    def _client_options(cls, api_key: str) -> client_options_lib.ClientOptions:
+        return client_options_lib.ClientOptions(api_key=api_key)
+
+    @classmethod
+    def get_client(cls, api_key: str) -> glm.GenerativeServiceClient:
+        """Sync client bound to one API key (used for embeddings and as model._client)"""
+        key_id = cls._key_id(api_key)
+        client = cls._clients.get(key_id)
+        if client is None:
+            with cls._lock:
+                client = cls._clients.get(key_id)
+                if client is None:
+                    client = glm.GenerativeServiceClient(client_options=cls._client_options(api_key))
+                    cls._clients[key_id] = client
+                    logger.info(f"🔑 Created Gemini client for key {key_id}")
+        return client
+
+    @classmethod
+    def get_async_client(cls, api_key: str) -> glm.GenerativeServiceAsyncClient:
+        """
+        Async client bound to one API key
+
+        grpc.aio channels belong to the event loop they were created on,
+        so this must be called from a coroutine.
+        """
+        key_id = cls._key_id(api_key)
+        client = cls._async_clients.get(key_id)
+        if client is None:
+            with cls._lock:
+                client = cls._async_clients.get(key_id)
+                if client is None:
+                    client = glm.GenerativeServiceAsyncClient(client_options=cls._client_options(api_key))
+                    cls._async_clients[key_id] = client
+        return client
+
+    @classmethod
+    def get_model(cls, api_key: str, model_name: str) -> genai.GenerativeModel:
+        """Pre-built GenerativeModel for (key, model)"""
+        pool_key = (cls._key_id(api_key), model_name)
+        model = cls._models.get(pool_key)
+        if model is None:
+            client = cls.get_client(api_key)
+            with cls._lock:
+                model = cls._models.get(pool_key)
+                if model is None:
+                    model = genai.GenerativeModel(model_name)
+                    # The SDK falls back to the global (genai.configure) client only when unset
+                    model._client = client
+                    cls._models[pool_key] = model
+
+        if model._async_client is None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return model
+            model._async_client = cls.get_async_client(api_key)
+        return model
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        return {
+            "clients": len(cls._clients),
+            "async_clients": len(cls._async_clients),
+            "models": len(cls._models)
+        }
@@ -0,0 +1,178 @@
+"""
+Hedged LLM Requests
+If the primary provider has not answered within its observed p95 latency,
+race a second provider/model; the first successful answer wins, the loser is cancelled
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling latency samples per provider/model (successful and cancelled calls)"""
+
+    _samples: Dict[str, Deque[float]] = {}
+
+    @classmethod
+    def record(cls, name: str, seconds: float):
+        samples = cls._samples.setdefault(name, deque(maxlen=settings.LLM_HEDGE_LATENCY_SAMPLES))
+        samples.append(seconds)
+
+    @classmethod
+    def percentile(cls, name: str, pct: float) -> Optional[float]:
+        samples = cls._samples.get(name)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    @classmethod
+    def count(cls, name: str) -> int:
+        return len(cls._samples.get(name, ()))
+
+
+class Hedger:
+    """
+    Hedging policy + per-endpoint budgets and metrics
+
+    Budgets cap the extra load: an endpoint may only launch hedges for
+    LLM_HEDGE_BUDGETS[endpoint] (fraction) of its requests.
+    """
+
+    _metrics: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def _endpoint_metrics(cls, endpoint: str) -> Dict[str, int]:
+        return cls._metrics.setdefault(endpoint, {
+            "requests": 0,
+            "hedges_launched": 0,
+            "hedge_wins": 0,
+            "primary_wins": 0,
+            "budget_denied": 0,
+            "fallbacks": 0,
+            "both_failed": 0
+        })
+
+    @classmethod
+    def hedge_delay(cls, primary_name: str) -> float:
+        """p95 of the primary's recent latency, clamped; default until enough samples exist"""
+        if LatencyTracker.count(primary_name) < settings.LLM_HEDGE_MIN_SAMPLES:
+            return settings.LLM_HEDGE_DEFAULT_DELAY
+        p95 = LatencyTracker.percentile(primary_name, 95) or settings.LLM_HEDGE_DEFAULT_DELAY
+        return min(settings.LLM_HEDGE_MAX_DELAY, max(settings.LLM_HEDGE_MIN_DELAY, p95))
+
+    @classmethod
+    def _within_budget(cls, endpoint: str) -> bool:
+        metrics = cls._endpoint_metrics(endpoint)
+        ratio = settings.LLM_HEDGE_BUDGETS.get(endpoint, settings.LLM_HEDGE_BUDGETS.get("default", 0.1))
+        # +1 lets the very first slow request hedge
+        return metrics["hedges_launched"] < ratio * metrics["requests"] + 1
+
+    @staticmethod
+    async def timed(name: str, fn: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # A primary that lost to its hedge was at least this slow; dropping it
+            # would pull the p95 (and so the hedge delay) down with every hedge
+            LatencyTracker.record(name, time.perf_counter() - started)
+            raise
+        LatencyTracker.record(name, time.perf_counter() - started)
+        return result
+
+    @classmethod
+    async def race(
+        cls,
+        endpoint: str,
+        primary_name: str,
+        primary: Callable[[], Awaitable[T]],
+        secondary_name: Optional[str] = None,
+        secondary: Optional[Callable[[], Awaitable[T]]] = None
+    ) -> T:
+        """
+        Run primary(); launch secondary() if primary is slower than its hedge delay
+
+        Args:
+            endpoint: Budget/metrics bucket (e.g. "chatbot", "generate_smart")
+            primary_name / secondary_name: LatencyTracker keys (e.g. "gemini:gemini-2.5-flash")
+
+        Raises the primary's exception if every attempt fails.
+        """
+        metrics = cls._endpoint_metrics(endpoint)
+        metrics["requests"] += 1
+
+        primary_task = asyncio.ensure_future(cls.timed(primary_name, primary))
+        if secondary is None:
+            return await primary_task
+
+        secondary_task: Optional[asyncio.Future] = None
+        try:
+            delay = cls.hedge_delay(primary_name)
+            done, _ = await asyncio.wait({primary_task}, timeout=delay)
+            if done and primary_task.exception() is None:
+                metrics["primary_wins"] += 1
+                return primary_task.result()
+
+            if done:
+                # Primary failed fast: plain fallback, not a hedge
+                metrics["fallbacks"] += 1
+                try:
+                    return await cls.timed(secondary_name or "secondary", secondary)
+                except Exception:
+                    metrics["both_failed"] += 1
+                    raise primary_task.exception()
+
+            if not cls._within_budget(endpoint):
+                metrics["budget_denied"] += 1
+                return await primary_task
+
+            # Primary is slow: race the hedge, first success wins
+            metrics["hedges_launched"] += 1
+            logger.info(f"🏁 [{endpoint}] {primary_name} slower than {delay:.1f}s, hedging with {secondary_name}")
+            secondary_task = asyncio.ensure_future(cls.timed(secondary_name or "secondary", secondary))
+            pending = {primary_task, secondary_task}
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        metrics["hedge_wins" if task is secondary_task else "primary_wins"] += 1
+                        return task.result()
+
+            metrics["both_failed"] += 1
+            raise primary_task.exception()
+        finally:
+            # Cancel the loser (or everything, if the caller went away)
+            for task in (primary_task, secondary_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        endpoints = {}
+        for endpoint, metrics in cls._metrics.items():
+            launched = metrics["hedges_launched"]
+            endpoints[endpoint] = {
+                **metrics,
+                "hedge_win_rate": round(metrics["hedge_wins"] / launched, 4) if launched else 0.0
+            }
+        latency = {
+            name: {
+                "samples": LatencyTracker.count(name),
+                "p50": round(LatencyTracker.percentile(name, 50) or 0.0, 3),
+                "p95": round(LatencyTracker.percentile(name, 95) or 0.0, 3),
+                "hedge_delay": round(cls.hedge_delay(name), 3)
+            }
+            for name in LatencyTracker._samples
+        }
+        return {"enabled": settings.LLM_HEDGING_ENABLED, "endpoints": endpoints, "latency": latency}
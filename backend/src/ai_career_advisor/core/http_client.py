@@ -0,0 +1,180 @@
+"""
+Shared HTTP Client Pool
+One keep-alive httpx.AsyncClient per upstream host, reused by every outbound caller
+(Perplexity, Brevo, web fetches) instead of a fresh client + TLS handshake per request
+"""
+
+import time
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+PERPLEXITY_BASE_URL = "https://api.perplexity.ai"
+PERPLEXITY_CHAT_URL = f"{PERPLEXITY_BASE_URL}/chat/completions"
+
+
+def _http2_available() -> bool:
+    """httpx only speaks HTTP/2 when the optional `h2` package is installed"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """Wraps the real transport to collect per-host request statistics"""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, stats: Dict[str, Any]):
+        self._transport = transport
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.stats["requests"] += 1
+        self.stats["in_flight"] += 1
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            self.stats["transport_errors"] += 1
+            raise
+        finally:
+            self.stats["in_flight"] -= 1
+
+        self.stats["responses"] += 1
+        self.stats["total_latency_ms"] += (time.perf_counter() - started) * 1000
+        if response.status_code >= 400:
+            self.stats["error_responses"] += 1
+        return response
+
+    @property
+    def open_connections(self) -> Optional[int]:
+        """Best-effort connection count from the underlying httpcore pool"""
+        try:
+            return len(self._transport._pool.connections)
+        except Exception:
+            return None
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class HTTPClientPool:
+    """
+    Process-wide pool of httpx.AsyncClient objects
+    - One client per host, so connection limits apply per host
+    - HTTP/2 + keep-alive when available
+    - Created lazily, closed from the FastAPI lifespan
+    """
+
+    DEFAULT_HOST = "default"
+
+    _clients: Dict[str, httpx.AsyncClient] = {}
+    _transports: Dict[str, _CountingTransport] = {}
+    _http2: Optional[bool] = None
+
+    @classmethod
+    def _build_client(cls, host: str) -> httpx.AsyncClient:
+        if cls._http2 is None:
+            cls._http2 = settings.HTTP2_ENABLED and _http2_available()
+            if settings.HTTP2_ENABLED and not cls._http2:
+                logger.warning("⚠️ HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+
+        limits = httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_PER_HOST,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY
+        )
+        timeout = httpx.Timeout(
+            settings.HTTP_READ_TIMEOUT,
+            connect=settings.HTTP_CONNECT_TIMEOUT
+        )
+
+        previous = cls._transports.get(host)
+        stats = previous.stats if previous else {
+            "requests": 0,
+            "responses": 0,
+            "error_responses": 0,
+            "transport_errors": 0,
+            "in_flight": 0,
+            "total_latency_ms": 0.0
+        }
+        transport = _CountingTransport(
+            httpx.AsyncHTTPTransport(http2=cls._http2, limits=limits),
+            stats
+        )
+        cls._transports[host] = transport
+
+        logger.info(f"🌐 Creating pooled HTTP client for '{host}' (http2={cls._http2})")
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=timeout,
+            follow_redirects=True
+        )
+
+    @classmethod
+    def get_client(cls, url: Optional[str] = None) -> httpx.AsyncClient:
+        """
+        Get the pooled client for the host of `url`
+
+        Args:
+            url: Any URL on the target host (None = shared default client)
+
+        Per-request timeouts can still be passed to .get()/.post()
+        """
+        host = (urlsplit(url).netloc if url else None) or cls.DEFAULT_HOST
+
+        client = cls._clients.get(host)
+        if client is None or client.is_closed:
+            client = cls._build_client(host)
+            cls._clients[host] = client
+        return client
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """Pool statistics for the admin dashboard"""
+        hosts = {}
+        for host, transport in cls._transports.items():
+            stats = transport.stats
+            responses = stats["responses"]
+            client = cls._clients.get(host)
+            hosts[host] = {
+                "requests": stats["requests"],
+                "responses": responses,
+                "error_responses": stats["error_responses"],
+                "transport_errors": stats["transport_errors"],
+                "in_flight": stats["in_flight"],
+                "avg_latency_ms": round(stats["total_latency_ms"] / responses, 2) if responses else 0.0,
+                "open_connections": transport.open_connections,
+                "closed": client.is_closed if client else True
+            }
+
+        return {
+            "http2": bool(cls._http2),
+            "max_connections_per_host": settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+            "max_keepalive_per_host": settings.HTTP_MAX_KEEPALIVE_PER_HOST,
+            "connect_timeout": settings.HTTP_CONNECT_TIMEOUT,
+            "read_timeout": settings.HTTP_READ_TIMEOUT,
+            "hosts": hosts
+        }
+
+    @classmethod
+    async def close(cls):
+        """Close every pooled client (called on application shutdown)"""
+        for host, client in list(cls._clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client for '{host}': {e}")
+        cls._clients.clear()
+        logger.info("🌐 HTTP client pool closed")
+
+
+def get_http_client(url: Optional[str] = None) -> httpx.AsyncClient:
+    """Shortcut for HTTPClientPool.get_client"""
+    return HTTPClientPool.get_client(url)
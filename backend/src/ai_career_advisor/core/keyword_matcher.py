@@ -0,0 +1,144 @@
+"""
+Aho–Corasick Keyword Matcher
+Every keyword of every category is compiled into one automaton, so a query is
+scanned once (O(len(query) + hits)) instead of once per keyword with `kw in text`.
+Hits respect word boundaries: "sex" does not match "Sussex", "ca" does not match "cat"
+"""
+
+import unicodedata
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    # Letters, combining marks (Devanagari matras) and digits
+    return ch == "_" or unicodedata.category(ch)[0] in "LMN"
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    pattern: str
+    start: int
+    end: int
+
+
+class KeywordHits:
+    """Hits of one scan, grouped by category (in text order)"""
+
+    def __init__(self, text: str, hits: Dict[str, Tuple[KeywordHit, ...]]):
+        self.text = text
+        self._hits = hits
+
+    def __contains__(self, category: str) -> bool:
+        return category in self._hits
+
+    def get(self, category: str) -> Tuple[KeywordHit, ...]:
+        return self._hits.get(category, ())
+
+    def first(self, category: str) -> Optional[str]:
+        """Earliest keyword of the category in the text"""
+        hits = self._hits.get(category)
+        return hits[0].pattern if hits else None
+
+    def patterns(self, category: str) -> Set[str]:
+        return {hit.pattern for hit in self._hits.get(category, ())}
+
+    def categories(self) -> List[str]:
+        return list(self._hits)
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern matcher over named keyword categories
+
+    - A keyword must start at a word boundary
+    - It must also end at one (an "s"/"es" plural is allowed: "iit" matches "IITs"),
+      except in prefix_categories, where "porn" also matches "pornography"
+    - Keywords are passed through normalize() at build time; scan text that was
+      normalized the same way
+    """
+
+    PLURAL_SUFFIXES = ("s", "es")
+
+    def __init__(
+        self,
+        categories: Dict[str, Iterable[str]],
+        prefix_categories: Iterable[str] = (),
+        normalize: Callable[[str], str] = str.lower
+    ):
+        prefix_categories = set(prefix_categories)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # state -> [(keyword, category, prefix_ok)] ending at that state
+        self._out: List[List[Tuple[str, str, bool]]] = [[]]
+        self.size = 0
+
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                keyword = normalize(keyword)
+                if keyword:
+                    self._add(keyword, category, category in prefix_categories)
+        self._build_failure_links()
+
+    def _add(self, keyword: str, category: str, prefix_ok: bool):
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        if (keyword, category, prefix_ok) not in self._out[state]:
+            self._out[state].append((keyword, category, prefix_ok))
+            self.size += 1
+
+    def _build_failure_links(self):
+        # Depth-1 states fall back to the root; BFS so shorter states are done first
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0) if state else 0
+                # Inherit the keywords that end at the fallback state
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _ends_word(self, text: str, end: int) -> bool:
+        if end == len(text) or not _is_word_char(text[end]):
+            return True
+        for suffix in self.PLURAL_SUFFIXES:
+            after = end + len(suffix)
+            if text.startswith(suffix, end) and (after == len(text) or not _is_word_char(text[after])):
+                return True
+        return False
+
+    def scan(self, text: str) -> KeywordHits:
+        """All keyword hits in one pass over text"""
+        hits: Dict[str, List[KeywordHit]] = {}
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+
+            for keyword, category, prefix_ok in self._out[state]:
+                start, end = i + 1 - len(keyword), i + 1
+                if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(keyword[0]):
+                    continue
+                if not prefix_ok and _is_word_char(keyword[-1]) and not self._ends_word(text, end):
+                    continue
+                hits.setdefault(category, []).append(KeywordHit(keyword, start, end))
+
+        # Outputs are reported by end position; order each category by start
+        return KeywordHits(text, {
+            category: tuple(sorted(found, key=lambda hit: (hit.start, -hit.end)))
+            for category, found in hits.items()
+        })
@@ -0,0 +1,227 @@
+"""
+Content-addressed LLM Response Cache
+Two tiers: in-process LRU + optional shared tier (Redis via REDIS_URL, or a SQLite file)
+Keys are a hash of (model, prompt, parameters) so byte-identical prompts never hit the API twice
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    negative: bool = False
+
+
+class _RedisTier:
+    """Shared tier backed by Redis (TTL handled by Redis itself)"""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis_asyncio
+        self._client = redis_asyncio.from_url(url)
+
+    async def get(self, key: str) -> Optional[str]:
+        raw = await self._client.get(key)
+        return raw.decode("utf-8") if isinstance(raw, bytes) else raw
+
+    async def set(self, key: str, payload: str, ttl: int):
+        await self._client.set(key, payload, ex=ttl)
+
+
+class _SQLiteTier:
+    """Shared tier backed by a local SQLite file (survives restarts)"""
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self._path = path
+        with sqlite3.connect(self._path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        with sqlite3.connect(self._path) as conn:
+            row = conn.execute(
+                "SELECT payload, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            if row[1] < time.time():
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            return row[0]
+
+    def _set_sync(self, key: str, payload: str, ttl: int):
+        with sqlite3.connect(self._path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, payload, expires_at) VALUES (?, ?, ?)",
+                (key, payload, time.time() + ttl)
+            )
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, key: str, payload: str, ttl: int):
+        await asyncio.to_thread(self._set_sync, key, payload, ttl)
+
+
+class LLMCache:
+    """
+    Two-tier cache for LLM responses
+    - Tier 1: in-process LRU (bounded by LLM_CACHE_MAX_ENTRIES)
+    - Tier 2: Redis (REDIS_URL) or SQLite (LLM_CACHE_SQLITE_PATH), optional
+    - Negative entries remember validation failures for a shorter TTL
+    """
+
+    KEY_PREFIX = "llm_cache:v1:"
+
+    _memory: "OrderedDict[str, Tuple[float, CacheEntry]]" = OrderedDict()
+    _shared = None
+    _shared_initialized = False
+    _stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def make_key(cls, model: str, prompt: str, **params) -> str:
+        """Hash of (model, prompt, parameters)"""
+        material = json.dumps(
+            {"model": model, "prompt": prompt, "params": params},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return cls.KEY_PREFIX + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _get_shared_tier(cls):
+        if cls._shared_initialized:
+            return cls._shared
+        cls._shared_initialized = True
+
+        try:
+            if settings.REDIS_URL:
+                cls._shared = _RedisTier(settings.REDIS_URL)
+            elif settings.LLM_CACHE_SQLITE_PATH:
+                cls._shared = _SQLiteTier(settings.LLM_CACHE_SQLITE_PATH)
+            if cls._shared:
+                logger.info(f"🗄️ LLM cache shared tier: {cls._shared.name}")
+        except Exception as e:
+            logger.warning(f"⚠️ LLM cache shared tier unavailable, using memory only: {e}")
+            cls._shared = None
+        return cls._shared
+
+    @classmethod
+    def _count(cls, namespace: str, field: str):
+        stats = cls._stats.setdefault(namespace, {
+            "hits": 0, "misses": 0, "negative_hits": 0, "shared_hits": 0, "stores": 0, "evictions": 0
+        })
+        stats[field] += 1
+
+    @classmethod
+    def _remember(cls, key: str, entry: CacheEntry, ttl: int, namespace: str):
+        cls._memory[key] = (time.time() + ttl, entry)
+        cls._memory.move_to_end(key)
+        while len(cls._memory) > settings.LLM_CACHE_MAX_ENTRIES:
+            cls._memory.popitem(last=False)
+            cls._count(namespace, "evictions")
+
+    @classmethod
+    async def get(cls, key: str, namespace: str = "default") -> Optional[CacheEntry]:
+        """Look up a key in memory, then in the shared tier"""
+        if not settings.LLM_CACHE_ENABLED:
+            return None
+
+        cached = cls._memory.get(key)
+        if cached:
+            expires_at, entry = cached
+            if expires_at > time.time():
+                cls._memory.move_to_end(key)
+                cls._count(namespace, "negative_hits" if entry.negative else "hits")
+                return entry
+            del cls._memory[key]
+
+        shared = cls._get_shared_tier()
+        if shared:
+            try:
+                payload = await shared.get(key)
+                if payload:
+                    data = json.loads(payload)
+                    entry = CacheEntry(value=data["value"], negative=data.get("negative", False))
+                    remaining = max(1, int(data.get("expires_at", time.time() + 60) - time.time()))
+                    cls._remember(key, entry, remaining, namespace)
+                    cls._count(namespace, "shared_hits")
+                    cls._count(namespace, "negative_hits" if entry.negative else "hits")
+                    return entry
+            except Exception as e:
+                logger.warning(f"⚠️ LLM cache shared read failed: {e}")
+
+        cls._count(namespace, "misses")
+        return None
+
+    @classmethod
+    async def set(
+        cls,
+        key: str,
+        value: Any,
+        *,
+        ttl: Optional[int] = None,
+        negative: bool = False,
+        namespace: str = "default"
+    ):
+        """Store a (JSON-serializable) value in both tiers"""
+        if not settings.LLM_CACHE_ENABLED:
+            return
+
+        ttl = ttl or settings.LLM_CACHE_DEFAULT_TTL
+        entry = CacheEntry(value=value, negative=negative)
+        cls._remember(key, entry, ttl, namespace)
+        cls._count(namespace, "stores")
+
+        shared = cls._get_shared_tier()
+        if shared:
+            try:
+                payload = json.dumps({
+                    "value": value,
+                    "negative": negative,
+                    "expires_at": time.time() + ttl
+                }, ensure_ascii=False)
+                await shared.set(key, payload, ttl)
+            except Exception as e:
+                logger.warning(f"⚠️ LLM cache shared write failed: {e}")
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """Hit/miss counters per call site (namespace)"""
+        namespaces = {}
+        for namespace, stats in cls._stats.items():
+            lookups = stats["hits"] + stats["negative_hits"] + stats["misses"]
+            namespaces[namespace] = {
+                **stats,
+                "hit_rate": round((stats["hits"] + stats["negative_hits"]) / lookups, 4) if lookups else 0.0
+            }
+        return {
+            "enabled": settings.LLM_CACHE_ENABLED,
+            "memory_entries": len(cls._memory),
+            "max_entries": settings.LLM_CACHE_MAX_ENTRIES,
+            "shared_tier": cls._shared.name if cls._shared else None,
+            "namespaces": namespaces
+        }
+
+    @classmethod
+    def clear(cls):
+        """Drop the in-process tier (shared tier entries expire on their own)"""
+        cls._memory.clear()
+        logger.info("🧹 LLM cache cleared")
@@ -0,0 +1,133 @@
+"""
+Micro-batching for Model Calls
+Concurrent single-text requests (query embeddings, intent classification) are
+collected for a few milliseconds (or until max_batch_size) and served by ONE
+batched call on an executor pool
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ai_career_advisor.core.executors import run_cpu
+from ai_career_advisor.core.logger import logger
+
+
+class MicroBatcher:
+    """
+    In-process dynamic batcher
+    - submit(text) enqueues and awaits its own result
+    - A worker task drains the queue: waits up to max_wait_ms after the first item,
+      runs encode_batch(texts) once (on runner's pool, CPU pool by default) and
+      resolves every waiting future
+    - The worker exits when the queue is empty and is restarted by the next submit
+    """
+
+    HISTOGRAM_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128]
+
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], List[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "embeddings",
+        runner: Callable[..., Awaitable[Any]] = run_cpu
+    ):
+        self.encode_batch = encode_batch
+        self.runner = runner
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.name = name
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self._histogram: Dict[str, int] = {self._bucket(b): 0 for b in self.HISTOGRAM_BUCKETS}
+        self._stats = {"requests": 0, "batches": 0, "errors": 0, "max_batch": 0}
+
+    def _bucket(self, size: int) -> str:
+        for bucket in self.HISTOGRAM_BUCKETS:
+            if size <= bucket:
+                return f"<={bucket}"
+        return f">{self.HISTOGRAM_BUCKETS[-1]}"
+
+    def _ensure_queue(self) -> asyncio.Queue:
+        # Queues/tasks belong to one event loop (scripts may call asyncio.run repeatedly)
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._worker = None
+        return self._queue
+
+    async def submit(self, text: str) -> List[float]:
+        queue = self._ensure_queue()
+        future = self._loop.create_future()
+        queue.put_nowait((text, future))
+        self._stats["requests"] += 1
+
+        if self._worker is None:
+            self._worker = self._loop.create_task(self._run())
+        return await future
+
+    async def _collect(self, queue: asyncio.Queue) -> List[Tuple[str, asyncio.Future]]:
+        batch = [queue.get_nowait()]
+        deadline = self._loop.time() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            if queue.empty():
+                # No await between the check and the reset: the next submit restarts us
+                self._worker = None
+                return
+
+            batch = await self._collect(queue)
+            pending = [(text, future) for text, future in batch if not future.cancelled()]
+            if not pending:
+                continue
+
+            texts = list(dict.fromkeys(text for text, _ in pending))
+            self._record(len(texts))
+            try:
+                vectors = dict(zip(texts, await self.runner(self.encode_batch, texts)))
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"❌ Batched encode failed ({self.name}, {len(texts)} texts): {e}")
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for text, future in pending:
+                if not future.done():
+                    future.set_result(vectors[text])
+
+    def _record(self, size: int):
+        self._stats["batches"] += 1
+        self._stats["max_batch"] = max(self._stats["max_batch"], size)
+        self._histogram[self._bucket(size)] = self._histogram.get(self._bucket(size), 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        batches = self._stats["batches"]
+        return {
+            "name": self.name,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            **self._stats,
+            "avg_batch": round(self._stats["requests"] / batches, 2) if batches else 0.0,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "batch_size_histogram": self._histogram
+        }
@@ -4,15 +4,40 @@ Handles rate limiting and automatic model/API switching
 """
 
 import google.generativeai as genai
-import requests
 from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
+from ai_career_advisor.core.http_client import get_http_client, PERPLEXITY_CHAT_URL
+from ai_career_advisor.core.llm_cache import LLMCache
+from ai_career_advisor.core.rate_limiter import RateLimiter, retry_after_from_error
+from ai_career_advisor.core.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from ai_career_advisor.core.hedging import Hedger
+from ai_career_advisor.core.genai_pool import GenaiClientPool
+from ai_career_advisor.core.structured_output import (
+    StructuredOutputError,
+    build_repair_prompt,
+    gemini_response_schema,
+    is_valid_json_for,
+    parse_json_text,
+    validate_fields,
+)
+from pydantic import BaseModel
 from google.api_core.exceptions import ResourceExhausted
-from typing import Dict, Any, Optional, List
+from google.generativeai.types import generation_types
+from typing import Dict, Any, Optional, List, Callable, Awaitable, AsyncIterator, Type, TypeVar
 import asyncio
+import json
+import time
+import httpx
 from functools import partial
 
 
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+class ModelUnavailableError(Exception):
+    """Raised when the requested model, or every model in the fallback chain, failed"""
+
+
 class ModelManager:
     """Manages multiple AI models with automatic fallback"""
     
@@ -22,6 +47,8 @@ class ModelManager:
         "gemini-2.5-flash-lite",      # Secondary
     ]
     
+    PERPLEXITY_MODEL = "sonar-pro"  # Current Perplexity model
+    
     # Available API keys (in priority order)
     GEMINI_API_KEYS = [
         getattr(settings, 'GEMINI_API_KEY', None),
@@ -50,12 +77,39 @@ class ModelManager:
         cls.current_key_index += 1
         return key
     
+    @classmethod
+    def _next_healthy_gemini_key(cls, model: str) -> Optional[str]:
+        """Rotate through API keys, skipping keys whose circuit is open for this model"""
+        if not cls.GEMINI_API_KEYS:
+            return cls.get_next_gemini_key()
+        
+        for _ in range(len(cls.GEMINI_API_KEYS)):
+            key = cls.get_next_gemini_key()
+            if not CircuitBreakerRegistry.for_key("gemini", key, model).is_open():
+                return key
+        return None
+    
+    @classmethod
+    def _has_healthy_gemini_key(cls, model: str) -> bool:
+        if not cls.GEMINI_API_KEYS:
+            return True
+        return any(
+            not CircuitBreakerRegistry.for_key("gemini", key, model).is_open()
+            for key in cls.GEMINI_API_KEYS
+        )
+    
+    @classmethod
+    def is_model_available(cls, model: str) -> bool:
+        """Closed (or probe-ready) model circuit and at least one usable API key"""
+        if CircuitBreakerRegistry.for_model("gemini", model).is_open():
+            return False
+        return cls._has_healthy_gemini_key(model)
+    
     @classmethod
     def get_available_gemini_model(cls):
         """Get the next available Gemini model, or rotate if all are rate-limited"""
         for model in cls.GEMINI_MODELS:
-            status = cls.model_status.get(model, {})
-            if status.get("available", True):
+            if cls.is_model_available(model):
                 logger.info(f"✅ Using Gemini model: {model}")
                 return model
         
@@ -65,26 +119,35 @@ class ModelManager:
         return cls.GEMINI_MODELS[0]
     
     @classmethod
-    def mark_model_rate_limited(cls, model: str, retry_after: int = 60):
-        """Mark a model as rate-limited"""
-        logger.warning(f"🔴 Marking {model} as rate-limited for {retry_after}s")
+    def mark_model_rate_limited(cls, model: str, retry_after: float = 60):
+        """Mark a model as rate-limited: its circuit opens until now + retry_after"""
+        logger.warning(f"🔴 Marking {model} as rate-limited for {retry_after:.0f}s")
+        CircuitBreakerRegistry.for_model("gemini", model).record_failure(retry_after=retry_after)
         if model in cls.model_status:
             cls.model_status[model]["available"] = False
-            cls.model_status[model]["rate_limited_until"] = retry_after
+            cls.model_status[model]["rate_limited_until"] = time.time() + retry_after
     
     @classmethod
     def mark_model_available(cls, model: str):
         """Mark a model as available again"""
         if model in cls.model_status:
             cls.model_status[model]["available"] = True
+            cls.model_status[model]["rate_limited_until"] = None
             cls.model_status[model]["failures"] = 0
     
     @classmethod
-    async def generate_with_gemini(cls, prompt: str, model: Optional[str] = None) -> str:
+    async def generate_with_gemini(
+        cls,
+        prompt: str,
+        model: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Generate content using Gemini with automatic fallback
         - Tries different API keys when one is rate-limited
         - Tries different models when a model is rate-limited
+        - Raises CircuitOpenError immediately when the model's circuit is open
+        - generation_config is passed through (e.g. JSON mode + response_schema)
         """
         # Get the model to use
         selected_model = model or cls.get_available_gemini_model()
@@ -93,47 +156,66 @@ class ModelManager:
         retry_count = 0
         
         while retry_count < max_retries:
+            if not cls.GEMINI_API_KEYS and not getattr(settings, 'GEMINI_API_KEY', None):
+                raise ValueError("No Gemini API keys configured")
+            
+            # Get next API key (rotate through multiple keys, skipping open circuits)
+            api_key = cls._next_healthy_gemini_key(selected_model)
+            model_breaker = CircuitBreakerRegistry.for_model("gemini", selected_model)
+            if not api_key or not model_breaker.allow_request():
+                raise CircuitOpenError(f"Circuit open for {selected_model}")
+            key_breaker = CircuitBreakerRegistry.for_key("gemini", api_key, selected_model)
+            
             try:
-                # Get next API key (rotate through multiple keys)
-                api_key = cls.get_next_gemini_key()
-                if not api_key:
-                    raise ValueError("No Gemini API keys configured")
-                
                 logger.info(f"📤 Generating with {selected_model} (attempt {retry_count + 1})")
                 
-                # Configure and try the selected model
-                genai.configure(api_key=api_key)
-                genai_model = genai.GenerativeModel(selected_model)
+                # Pre-built model bound to this key (no global genai.configure)
+                genai_model = GenaiClientPool.get_model(api_key, selected_model)
                 
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    partial(genai_model.generate_content, prompt)
-                )
+                # Wait for a rate-limit permit instead of sleeping blindly
+                async with RateLimiter.permit("gemini", api_key, selected_model):
+                    response = await genai_model.generate_content_async(
+                        prompt, generation_config=generation_config
+                    )
                 
-                # Success - mark model as available
+                # Success - close circuits and mark model as available
+                model_breaker.record_success()
+                key_breaker.record_success()
                 cls.mark_model_available(selected_model)
                 logger.success(f"✅ Generated with {selected_model}")
                 return response.text.strip()
                 
             except ResourceExhausted as e:
-                # Rate limited - try next model (if auto-swapping is enabled, but here we specific model)
+                # Quotas are per key + model: open that pair for Retry-After
                 logger.warning(f"🔴 Rate limit hit on {selected_model}: {str(e)}")
-                cls.mark_model_rate_limited(selected_model)
+                retry_after = retry_after_from_error(e)
+                key_breaker.record_failure(retry_after=retry_after)
+                if not cls._has_healthy_gemini_key(selected_model):
+                    cls.mark_model_rate_limited(selected_model, retry_after)
+                
+                retry_count += 1
+                if cls.is_model_available(selected_model):
+                    # Another key still has quota for this model
+                    continue
                 
                 # If specifically requested model failed, we stop here to let fallback logic handle it
                 if model:
                      raise
                 
-                # Otherwise try next available from pool
+                # Otherwise try next available from pool (its own permit paces the retry)
                 selected_model = cls.get_available_gemini_model()
-                retry_count += 1
-                await asyncio.sleep(2)
+            
+            except (TypeError, ValueError) as e:
+                # Raised while building the request (bad generation_config) or reading
+                # a blocked response - not a sign of an unhealthy model or key
+                logger.error(f"❌ Invalid request/response for {selected_model}: {str(e)}")
+                raise
             
             except Exception as e:
                 logger.error(f"❌ Error with {selected_model}: {str(e)}")
+                model_breaker.record_failure()
                 retry_count += 1
-                if retry_count < max_retries:
+                if retry_count < max_retries and not model_breaker.is_open():
                     await asyncio.sleep(2)
                 else:
                     raise
@@ -141,13 +223,22 @@ class ModelManager:
         raise Exception("Gemini generation failed after retries")
     
     @classmethod
-    async def generate_with_perplexity(cls, prompt: str) -> str:
+    async def generate_with_perplexity(
+        cls,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Fallback to Perplexity API
+        response_format enables Perplexity structured outputs ({"type": "json_schema", ...})
         """
         if not settings.PERPLEXITY_API_KEY:
             raise ValueError("PERPLEXITY_API_KEY not configured")
         
+        breaker = CircuitBreakerRegistry.for_model("perplexity", cls.PERPLEXITY_MODEL)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for Perplexity {cls.PERPLEXITY_MODEL}")
+        
         logger.info("🔄 Switching to Perplexity API as fallback")
         
         headers = {
@@ -156,7 +247,7 @@ class ModelManager:
         }
         
         payload = {
-            "model": "sonar-pro",  # Current Perplexity model
+            "model": cls.PERPLEXITY_MODEL,
             "messages": [
                 {
                     "role": "user",
@@ -164,88 +255,505 @@ class ModelManager:
                 }
             ]
         }
+        if response_format:
+            payload["response_format"] = response_format
         
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                partial(
-                    requests.post,
-                    "https://api.perplexity.ai/chat/completions",
+            client = get_http_client(PERPLEXITY_CHAT_URL)
+            async with RateLimiter.permit("perplexity", settings.PERPLEXITY_API_KEY, cls.PERPLEXITY_MODEL) as permit:
+                response = await client.post(
+                    PERPLEXITY_CHAT_URL,
                     json=payload,
                     headers=headers
                 )
-            )
+                permit.observe_status(response.status_code, response.headers.get("retry-after"))
             
             if response.status_code == 200:
                 result = response.json()
+                breaker.record_success()
                 logger.success("✅ Generated with Perplexity API")
                 return result.get("choices", [{}])[0].get("message", {}).get("content", "")
             else:
                 logger.error(f"❌ Perplexity API error: {response.status_code} - {response.text}")
+                if response.status_code == 429:
+                    breaker.record_failure(retry_after=permit.retry_after)
+                else:
+                    breaker.record_failure()
                 raise Exception(f"Perplexity API error: {response.status_code}")
         
+        except httpx.HTTPError as e:
+            logger.error(f"❌ Perplexity API exception: {str(e)}")
+            breaker.record_failure()
+            raise
+        
         except Exception as e:
             logger.error(f"❌ Perplexity API exception: {str(e)}")
             raise
     
     @classmethod
-    async def generate_smart(cls, prompt: str) -> str:
+    async def _generate_cached(
+        cls,
+        model_key: str,
+        prompt: str,
+        producer: Callable[[], Awaitable[str]],
+        *,
+        cache_ttl: Optional[int],
+        negative_ttl: Optional[int],
+        validate: Optional[Callable[[str], bool]],
+        cache_namespace: str
+    ) -> str:
+        """
+        Serve byte-identical prompts from LLMCache
+        - cache_ttl=None disables caching for the call site
+        - validate() failures are stored as negative entries (negative_ttl)
+        """
+        if not cache_ttl:
+            return await producer()
+        
+        key = LLMCache.make_key(model_key, prompt)
+        entry = await LLMCache.get(key, namespace=cache_namespace)
+        if entry is not None:
+            logger.info(f"💾 LLM cache {'negative ' if entry.negative else ''}hit ({cache_namespace})")
+            return entry.value
+        
+        text = await producer()
+        
+        if validate is not None and not validate(text):
+            await LLMCache.set(
+                key, text,
+                ttl=negative_ttl or max(60, cache_ttl // 24),
+                negative=True,
+                namespace=cache_namespace
+            )
+        else:
+            await LLMCache.set(key, text, ttl=cache_ttl, namespace=cache_namespace)
+        
+        return text
+    
+    @classmethod
+    async def generate_smart(
+        cls,
+        prompt: str,
+        *,
+        cache_ttl: Optional[int] = None,
+        negative_ttl: Optional[int] = None,
+        validate: Optional[Callable[[str], bool]] = None,
+        cache_namespace: str = "generate_smart",
+        hedge: Optional[bool] = None,
+        hedge_endpoint: str = "generate_smart"
+    ) -> str:
         """
         Smart generation with explicit fallback chain:
         1. Gemini 2.5 Flash
         2. Gemini 2.5 Flash-Lite
         3. Perplexity Sonar-Pro
+        
+        Pass cache_ttl to serve repeated prompts from LLMCache
+        Pass hedge=True (or set LLM_HEDGING_ENABLED) to race the first two healthy providers
         """
-        # 1. Try Gemini 2.5 Flash
-        try:
-            return await cls.generate_with_gemini(prompt, model="gemini-2.5-flash")
-        except Exception as e1:
-            logger.warning(f"⚠️ Gemini 2.5 Flash failed: {e1}. Trying Flash-Lite...")
-            
-            # 2. Try Gemini 2.5 Flash-Lite
+        return await cls._generate_cached(
+            "auto",
+            prompt,
+            partial(cls._generate_smart_uncached, prompt, hedge=hedge, hedge_endpoint=hedge_endpoint),
+            cache_ttl=cache_ttl,
+            negative_ttl=negative_ttl,
+            validate=validate,
+            cache_namespace=cache_namespace
+        )
+    
+    @classmethod
+    async def _call_provider(
+        cls,
+        prompt: str,
+        model_name: str,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        if model_name in cls.GEMINI_MODELS:
+            return await cls.generate_with_gemini(prompt, model=model_name, generation_config=generation_config)
+        return await cls.generate_with_perplexity(
+            prompt, response_format=cls._perplexity_response_format(generation_config)
+        )
+    
+    @staticmethod
+    def _perplexity_response_format(generation_config: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Translate a Gemini response_schema into Perplexity's json_schema response_format"""
+        schema = (generation_config or {}).get("response_schema")
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            return {"type": "json_schema", "json_schema": {"schema": schema.model_json_schema()}}
+        if isinstance(schema, dict):
+            return {"type": "json_schema", "json_schema": {"schema": schema}}
+        return None
+    
+    @classmethod
+    async def _generate_smart_uncached(
+        cls,
+        prompt: str,
+        hedge: Optional[bool] = None,
+        hedge_endpoint: str = "generate_smart",
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Fallback chain without the cache layer (open circuits are skipped)"""
+        chain = [
+            ("Gemini 2.5 Flash", "gemini-2.5-flash"),
+            ("Gemini 2.5 Flash-Lite", "gemini-2.5-flash-lite"),
+            ("Perplexity Sonar-Pro", cls.PERPLEXITY_MODEL),
+        ]
+        last_error: Optional[Exception] = None
+        
+        candidates = []
+        for label, model_name in chain:
+            is_gemini = model_name in cls.GEMINI_MODELS
+            provider = "gemini" if is_gemini else "perplexity"
+            if CircuitBreakerRegistry.for_model(provider, model_name).is_open() or (
+                is_gemini and not cls._has_healthy_gemini_key(model_name)
+            ):
+                logger.info(f"⏭️ Skipping {label}: circuit open")
+                continue
+            candidates.append((label, model_name, f"{provider}:{model_name}"))
+        
+        if hedge is None:
+            hedge = settings.LLM_HEDGING_ENABLED
+        
+        if hedge and len(candidates) >= 2:
+            (label1, model1, name1), (label2, model2, name2) = candidates[:2]
             try:
-                return await cls.generate_with_gemini(prompt, model="gemini-2.5-flash-lite")
-            except Exception as e2:
-                logger.warning(f"⚠️ Gemini 2.5 Flash-Lite failed: {e2}. Switching to Perplexity...")
-                
-                # 3. Try Perplexity Sonar-Pro
-                try:
-                    return await cls.generate_with_perplexity(prompt)
-                except Exception as e3:
-                    logger.error(f"❌ All providers failed. Final error: {e3}")
-                    raise Exception(f"All models failed. Last error: {e3}")
+                return await Hedger.race(
+                    hedge_endpoint,
+                    name1, partial(cls._call_provider, prompt, model1, generation_config),
+                    name2, partial(cls._call_provider, prompt, model2, generation_config)
+                )
+            except Exception as e:
+                last_error = e
+                logger.warning(f"⚠️ {label1} and {label2} failed: {e}. Trying next provider...")
+            candidates = candidates[2:]
+        
+        for label, model_name, name in candidates:
+            try:
+                return await Hedger.timed(name, partial(cls._call_provider, prompt, model_name, generation_config))
+            except Exception as e:
+                last_error = e
+                logger.warning(f"⚠️ {label} failed: {e}. Trying next provider...")
+        
+        if last_error is None:
+            last_error = CircuitOpenError("All provider circuits are open")
+        logger.error(f"❌ All providers failed. Final error: {last_error}")
+        raise ModelUnavailableError(f"All models failed. Last error: {last_error}")
     
     @classmethod
-    async def generate(cls, prompt: str, preference: str = "auto") -> str:
+    async def generate(
+        cls,
+        prompt: str,
+        preference: str = "auto",
+        *,
+        cache_ttl: Optional[int] = None,
+        negative_ttl: Optional[int] = None,
+        validate: Optional[Callable[[str], bool]] = None,
+        cache_namespace: str = "generate"
+    ) -> str:
         """
         Generate content based on user preference.
         - "auto": Use smart fallback chain (Flash -> Lite -> Sonar)
         - "sonar-pro": Use Perplexity
         - "gemini-2.5-flash": Use specific Gemini model
+        
+        Pass cache_ttl to serve repeated prompts from LLMCache
         """
+        return await cls._generate_cached(
+            (preference or "auto").lower(),
+            prompt,
+            partial(cls._generate_uncached, prompt, preference),
+            cache_ttl=cache_ttl,
+            negative_ttl=negative_ttl,
+            validate=validate,
+            cache_namespace=cache_namespace
+        )
+    
+    @classmethod
+    async def _generate_uncached(
+        cls,
+        prompt: str,
+        preference: str = "auto",
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Preference routing without the cache layer"""
         if not preference or preference.lower() == "auto":
-            return await cls.generate_smart(prompt)
+            return await cls._generate_smart_uncached(prompt, generation_config=generation_config)
         
         elif preference.lower() == "sonar-pro":
             try:
-                return await cls.generate_with_perplexity(prompt)
+                return await cls.generate_with_perplexity(
+                    prompt, response_format=cls._perplexity_response_format(generation_config)
+                )
+            except (TypeError, ValueError):
+                raise
             except Exception as e:
                 # If specific model requested fails, we DO NOT fallback
-                raise Exception(f"Perplexity Sonar-Pro failed: {str(e)}")
+                raise ModelUnavailableError(f"Perplexity Sonar-Pro failed: {str(e)}")
         
         elif "gemini" in preference.lower():
             try:
                 # Extract model name if valid, otherwise default to flash
                 model_name = preference if preference in cls.GEMINI_MODELS else "gemini-2.5-flash"
-                return await cls.generate_with_gemini(prompt, model=model_name)
+                return await cls.generate_with_gemini(prompt, model=model_name, generation_config=generation_config)
+            except (TypeError, ValueError):
+                # Local request errors keep their type (callers may fall back on them)
+                raise
             except Exception as e:
                 # If specific model requested fails, we DO NOT fallback
-                raise Exception(f"{model_name} failed: {str(e)}")
+                raise ModelUnavailableError(f"{model_name} failed: {str(e)}")
         
         else:
             # Unknown preference default to smart
-            return await cls.generate_smart(prompt)
+            return await cls._generate_smart_uncached(prompt, generation_config=generation_config)
+    
+    @staticmethod
+    def structured_generation_config(schema: Type[BaseModel], response_schema: bool = True) -> Dict[str, Any]:
+        """
+        JSON-mode generation_config, with an SDK-compatible response_schema when possible
+        Built and checked once, before any provider is called: a schema the SDK cannot
+        convert falls back to plain JSON mode here instead of failing every request
+        """
+        generation_config: Dict[str, Any] = {"response_mime_type": "application/json"}
+        if not response_schema:
+            return generation_config
+        
+        try:
+            config = {**generation_config, "response_schema": gemini_response_schema(schema)}
+            # Same conversion generate_content_async does (mutates its argument)
+            generation_types.to_generation_config_dict(dict(config))
+            return config
+        except (TypeError, ValueError) as e:
+            logger.warning(f"⚠️ response_schema unsupported for {schema.__name__} ({e}), using JSON mode only")
+            return generation_config
+    
+    @classmethod
+    async def generate_structured(
+        cls,
+        prompt: str,
+        schema: Type[SchemaT],
+        *,
+        preference: str = "auto",
+        response_schema: bool = True,
+        cache_ttl: Optional[int] = None,
+        negative_ttl: Optional[int] = None,
+        cache_namespace: str = "structured",
+        max_repairs: int = 1
+    ) -> SchemaT:
+        """
+        Structured-output generation validated against a Pydantic schema
+        - Requests JSON mode (and the schema itself when response_schema=True)
+        - Validates the parsed object; on failure asks ONLY for the broken fields
+          (cheap repair call) instead of regenerating the whole document
+        - Only schema-valid JSON is cached as a positive entry
+        
+        Raises:
+            StructuredOutputError: output still invalid after max_repairs
+        """
+        generation_config = cls.structured_generation_config(schema, response_schema)
+        
+        async def produce() -> str:
+            return await cls._generate_uncached(prompt, preference, generation_config)
+        
+        model_key = f"{(preference or 'auto').lower()}:json:{schema.__name__}"
+        text = await cls._generate_cached(
+            model_key,
+            prompt,
+            produce,
+            cache_ttl=cache_ttl,
+            negative_ttl=negative_ttl,
+            validate=partial(is_valid_json_for, schema),
+            cache_namespace=cache_namespace
+        )
+        
+        try:
+            data = parse_json_text(text)
+        except (json.JSONDecodeError, ValueError):
+            data = {}
+        result, fields = validate_fields(schema, data)
+        if result is not None:
+            return result
+        if not data:
+            fields = list(schema.model_fields)
+        
+        for attempt in range(max_repairs):
+            logger.warning(f"🩹 {schema.__name__} invalid fields {fields}, repair attempt {attempt + 1}")
+            repair_prompt = build_repair_prompt(schema, fields, data, context=prompt[:1500])
+            try:
+                patch = parse_json_text(await cls._generate_uncached(
+                    repair_prompt, preference, {"response_mime_type": "application/json"}
+                ))
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.warning(f"⚠️ Repair output for {schema.__name__} was not JSON: {e}")
+                continue
+            
+            data = {**data, **{k: v for k, v in patch.items() if k in fields}}
+            result, fields = validate_fields(schema, data)
+            if result is not None:
+                if cache_ttl:
+                    await LLMCache.set(
+                        LLMCache.make_key(model_key, prompt),
+                        json.dumps(data, ensure_ascii=False),
+                        ttl=cache_ttl,
+                        namespace=cache_namespace
+                    )
+                logger.success(f"✅ Repaired {schema.__name__}")
+                return result
+        
+        raise StructuredOutputError(
+            f"{schema.__name__} output invalid after {max_repairs} repair(s): {fields}",
+            partial=data,
+            fields=fields
+        )
+    
+    @classmethod
+    async def stream_with_gemini(cls, prompt: str, model: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Stream text chunks from Gemini (generate_content_async(stream=True))
+        """
+        selected_model = model or cls.get_available_gemini_model()
+        api_key = cls._next_healthy_gemini_key(selected_model)
+        model_breaker = CircuitBreakerRegistry.for_model("gemini", selected_model)
+        if not api_key or not model_breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for {selected_model}")
+        key_breaker = CircuitBreakerRegistry.for_key("gemini", api_key, selected_model)
+        
+        genai_model = GenaiClientPool.get_model(api_key, selected_model)
+        
+        logger.info(f"📡 Streaming with {selected_model}")
+        try:
+            async with RateLimiter.permit("gemini", api_key, selected_model):
+                response = await genai_model.generate_content_async(prompt, stream=True)
+                async for chunk in response:
+                    text = chunk.text
+                    if text:
+                        yield text
+            
+            model_breaker.record_success()
+            key_breaker.record_success()
+        except ResourceExhausted as e:
+            retry_after = retry_after_from_error(e)
+            key_breaker.record_failure(retry_after=retry_after)
+            if not cls._has_healthy_gemini_key(selected_model):
+                cls.mark_model_rate_limited(selected_model, retry_after)
+            raise
+        except Exception:
+            model_breaker.record_failure()
+            raise
+    
+    @classmethod
+    async def stream_with_perplexity(
+        cls,
+        prompt: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        timeout: float = 45.0
+    ) -> AsyncIterator[str]:
+        """
+        Stream text chunks from Perplexity (OpenAI-style SSE, "stream": true)
+        Citations are written to meta["citations"] when provided
+        """
+        if not settings.PERPLEXITY_API_KEY:
+            raise ValueError("PERPLEXITY_API_KEY not configured")
+        
+        model = model or cls.PERPLEXITY_MODEL
+        breaker = CircuitBreakerRegistry.for_model("perplexity", model)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for Perplexity {model}")
+        
+        messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        messages.append({"role": "user", "content": prompt})
+        
+        logger.info(f"📡 Streaming with Perplexity {model}")
+        client = get_http_client(PERPLEXITY_CHAT_URL)
+        permit = None
+        try:
+            async with RateLimiter.permit("perplexity", settings.PERPLEXITY_API_KEY, model) as permit:
+                async with client.stream(
+                    "POST",
+                    PERPLEXITY_CHAT_URL,
+                    headers={
+                        "Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}",
+                        "Content-Type": "application/json"
+                    },
+                    json={"model": model, "messages": messages, "stream": True},
+                    timeout=timeout
+                ) as response:
+                    permit.observe_status(response.status_code, response.headers.get("retry-after"))
+                    if response.status_code != 200:
+                        await response.aread()
+                        logger.error(f"❌ Perplexity API error: {response.status_code} - {response.text}")
+                        raise Exception(f"Perplexity API error: {response.status_code}")
+                    
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[len("data:"):].strip()
+                        if data == "[DONE]":
+                            break
+                        chunk = json.loads(data)
+                        if meta is not None and chunk.get("citations"):
+                            meta["citations"] = chunk["citations"]
+                        delta = (chunk.get("choices") or [{}])[0].get("delta", {}).get("content")
+                        if delta:
+                            yield delta
+            
+            breaker.record_success()
+        except Exception:
+            throttled = permit is not None and permit.outcome == "throttled"
+            breaker.record_failure(retry_after=permit.retry_after if throttled else None)
+            raise
+    
+    @classmethod
+    async def generate_stream(
+        cls,
+        prompt: str,
+        preference: str = "auto",
+        *,
+        system_prompt: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Streaming counterpart of generate()
+        Falls back to the next provider only if nothing has been streamed yet;
+        the provider that answered is written to meta["model"]
+        """
+        preference = (preference or "auto").lower()
+        if preference == "sonar-pro":
+            chain = [cls.PERPLEXITY_MODEL]
+        elif "gemini" in preference:
+            chain = [preference if preference in cls.GEMINI_MODELS else "gemini-2.5-flash"]
+        else:
+            chain = [
+                model_name for model_name in [*cls.GEMINI_MODELS, cls.PERPLEXITY_MODEL]
+                if (model_name not in cls.GEMINI_MODELS and not CircuitBreakerRegistry.for_model("perplexity", model_name).is_open())
+                or (model_name in cls.GEMINI_MODELS and cls.is_model_available(model_name))
+            ]
+        
+        last_error: Optional[Exception] = None
+        for model_name in chain:
+            started = False
+            try:
+                if model_name in cls.GEMINI_MODELS:
+                    full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+                    stream = cls.stream_with_gemini(full_prompt, model=model_name)
+                else:
+                    stream = cls.stream_with_perplexity(prompt, model=model_name, system_prompt=system_prompt, meta=meta)
+                
+                async for text in stream:
+                    started = True
+                    yield text
+                
+                if meta is not None:
+                    meta["model"] = model_name
+                return
+            except Exception as e:
+                if started:
+                    raise
+                last_error = e
+                logger.warning(f"⚠️ Streaming with {model_name} failed before first token: {e}")
+        
+        raise ModelUnavailableError(f"All models failed. Last error: {last_error or CircuitOpenError('All provider circuits are open')}")
     
     @classmethod
     async def get_embedding(cls, text: str) -> List[float]:
@@ -261,18 +769,12 @@ class ModelManager:
                 if not api_key:
                     raise ValueError("No Gemini API keys configured")
                 
-                genai.configure(api_key=api_key)
-                
                 # Using text-embedding-004 which is optimized for retrieval
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None,
-                    partial(
-                        genai.embed_content,
-                        model="models/text-embedding-004",
-                        content=text,
-                        task_type="retrieval_document"
-                    )
+                result = await genai.embed_content_async(
+                    model="models/text-embedding-004",
+                    content=text,
+                    task_type="retrieval_document",
+                    client=GenaiClientPool.get_async_client(api_key)
                 )
                 
                 return result['embedding']
@@ -289,4 +791,5 @@ class ModelManager:
         """Reset all model statuses"""
         for model in cls.GEMINI_MODELS:
             cls.mark_model_available(model)
+        CircuitBreakerRegistry.reset_all()
         logger.info("🔄 All models reset to available")
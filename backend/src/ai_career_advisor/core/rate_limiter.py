@@ -0,0 +1,240 @@
+"""
+Provider Rate Limiter
+Token bucket (requests/minute) + AIMD concurrency per (provider, API key, model)
+Callers await a permit instead of sleeping for fixed delays
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """ResourceExhausted / HTTP 429 / quota messages"""
+    if type(error).__name__ in ("ResourceExhausted", "TooManyRequests", "RateLimitExceeded"):
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "quota" in message or "rate limit" in message
+
+
+def retry_after_from_error(error: BaseException, default: float = 60.0) -> float:
+    """Best-effort Retry-After extraction from provider errors"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers and headers.get("retry-after"):
+        try:
+            return float(headers["retry-after"])
+        except ValueError:
+            pass
+
+    message = str(error)
+    for pattern in (r"retry in ([\d.]+)\s*s", r"retry_delay\s*\{\s*seconds:\s*(\d+)", r"retry after ([\d.]+)"):
+        match = re.search(pattern, message, re.IGNORECASE)
+        if match:
+            return float(match.group(1))
+    return default
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def drain(self):
+        """Empty the bucket (after a 429 the provider's window is clearly full)"""
+        self._refill()
+        self.tokens = 0
+
+
+class AIMDConcurrency:
+    """
+    Additive-increase / multiplicative-decrease concurrency window
+    - success: limit += 1 / limit  (≈ +1 per window of successes)
+    - throttle: limit *= 0.5 and block new permits until the cooldown ends
+    """
+
+    def __init__(self, max_limit: int, initial_limit: Optional[float] = None):
+        self.max_limit = float(max_limit)
+        self.limit = float(initial_limit or max(1, max_limit // 2))
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            while True:
+                wait_for = self.blocked_until - time.monotonic()
+                if wait_for > 0:
+                    self._condition.release()
+                    try:
+                        await asyncio.sleep(wait_for)
+                    finally:
+                        await self._condition.acquire()
+                    continue
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                await self._condition.wait()
+
+    async def release(self, outcome: str, retry_after: float = 0.0):
+        async with self._condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            if outcome == "success":
+                self.limit = min(self.max_limit, self.limit + 1.0 / max(self.limit, 1.0))
+            elif outcome == "throttled":
+                self.limit = max(1.0, self.limit * 0.5)
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+            self._condition.notify_all()
+
+
+class Permit:
+    """Handle returned by RateLimiter.permit(); report HTTP status codes through it"""
+
+    def __init__(self):
+        self.outcome = "success"
+        self.retry_after = 0.0
+
+    def observe_status(self, status_code: int, retry_after: Optional[str] = None):
+        if status_code == 429:
+            try:
+                cooldown = float(retry_after)
+            except (TypeError, ValueError):
+                cooldown = settings.RATE_LIMIT_DEFAULT_COOLDOWN
+            self.throttled(cooldown)
+        elif status_code >= 500:
+            self.outcome = "error"
+
+    def throttled(self, retry_after: float):
+        self.outcome = "throttled"
+        self.retry_after = retry_after
+
+
+class RateLimiter:
+    """Registry of limiter state per (provider, API key, model)"""
+
+    _buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+    _windows: Dict[Tuple[str, str, str], AIMDConcurrency] = {}
+    _stats: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+    @staticmethod
+    def _key_id(api_key: Optional[str]) -> str:
+        """Never keep raw API keys in memory maps / stats"""
+        if not api_key:
+            return "none"
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:10]
+
+    @classmethod
+    def _requests_per_minute(cls, provider: str) -> float:
+        if provider == "gemini":
+            return settings.RATE_LIMIT_GEMINI_RPM
+        if provider == "perplexity":
+            return settings.RATE_LIMIT_PERPLEXITY_RPM
+        return settings.RATE_LIMIT_DEFAULT_RPM
+
+    @classmethod
+    def _state(cls, provider: str, api_key: Optional[str], model: str):
+        key = (provider, cls._key_id(api_key), model)
+        if key not in cls._buckets:
+            rpm = cls._requests_per_minute(provider)
+            cls._buckets[key] = TokenBucket(rate=rpm / 60.0, capacity=max(1.0, rpm / 6.0))
+            cls._windows[key] = AIMDConcurrency(settings.RATE_LIMIT_MAX_CONCURRENCY)
+            cls._stats[key] = {"permits": 0, "throttled": 0, "errors": 0, "wait_ms": 0.0}
+        return key, cls._buckets[key], cls._windows[key]
+
+    @classmethod
+    @asynccontextmanager
+    async def permit(cls, provider: str, api_key: Optional[str], model: str) -> AsyncIterator[Permit]:
+        """
+        Await a request slot for (provider, key, model)
+
+        Usage:
+            async with RateLimiter.permit("perplexity", key, "sonar") as permit:
+                response = await client.post(...)
+                permit.observe_status(response.status_code, response.headers.get("retry-after"))
+
+        Rate-limit exceptions raised inside the block shrink the window automatically.
+        """
+        key, bucket, window = cls._state(provider, api_key, model)
+        stats = cls._stats[key]
+
+        started = time.monotonic()
+        await window.acquire()
+        try:
+            await bucket.acquire()
+        except BaseException:
+            await window.release("error")
+            raise
+        stats["permits"] += 1
+        stats["wait_ms"] += (time.monotonic() - started) * 1000
+
+        permit = Permit()
+        try:
+            yield permit
+        except BaseException as e:
+            if isinstance(e, Exception) and is_rate_limit_error(e):
+                permit.throttled(retry_after_from_error(e, settings.RATE_LIMIT_DEFAULT_COOLDOWN))
+            elif permit.outcome == "success":
+                permit.outcome = "error"
+            raise
+        finally:
+            if permit.outcome == "throttled":
+                stats["throttled"] += 1
+                bucket.drain()
+                logger.warning(
+                    f"🚦 {provider}/{model} throttled, backing off {permit.retry_after:.0f}s "
+                    f"(concurrency → {max(1.0, window.limit * 0.5):.1f})"
+                )
+            elif permit.outcome == "error":
+                stats["errors"] += 1
+            await window.release(permit.outcome, permit.retry_after)
+
+    @classmethod
+    def cooldown_remaining(cls, provider: str, api_key: Optional[str], model: str) -> float:
+        """Seconds until (provider, key, model) accepts requests again"""
+        _, _, window = cls._state(provider, api_key, model)
+        return max(0.0, window.blocked_until - time.monotonic())
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        result = {}
+        for key, stats in cls._stats.items():
+            provider, key_id, model = key
+            window = cls._windows[key]
+            bucket = cls._buckets[key]
+            permits = stats["permits"]
+            result[f"{provider}:{key_id}:{model}"] = {
+                **{k: v for k, v in stats.items() if k != "wait_ms"},
+                "avg_wait_ms": round(stats["wait_ms"] / permits, 2) if permits else 0.0,
+                "concurrency_limit": round(window.limit, 2),
+                "in_flight": window.in_flight,
+                "cooldown_remaining": round(max(0.0, window.blocked_until - time.monotonic()), 1),
+                "tokens": round(bucket.tokens, 2)
+            }
+        return result
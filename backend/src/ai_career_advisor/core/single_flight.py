@@ -0,0 +1,62 @@
+"""
+Single-Flight Request Coalescing
+Concurrent callers asking for the same key share ONE in-flight computation
+(e.g. 30 users requesting the same roadmap → 1 LLM call)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+from ai_career_advisor.core.logger import logger
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent async calls by key
+
+    The computation runs as its own task, so a caller that disconnects
+    (is cancelled) does not cancel the work other callers are waiting on.
+    The key is released as soon as the computation finishes; results are
+    NOT cached here (that is the job of the DB / LLMCache layers).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.stats = {"calls": 0, "executions": 0, "coalesced": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() once per key at a time; concurrent callers await the same result
+
+        Exceptions are propagated to every waiting caller.
+        """
+        self.stats["calls"] += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats["executions"] += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._release(k, _t))
+        else:
+            self.stats["coalesced"] += 1
+            logger.info(f"🔗 [{self.name}] Joining in-flight request for {key!r}")
+
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark exceptions as retrieved when every caller has gone away
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "in_flight": self.in_flight()}
@@ -0,0 +1,154 @@
+"""
+Structured LLM Output Helpers
+JSON parsing, Pydantic validation and field-level repair prompts
+shared by ModelManager.generate_structured and direct Perplexity callers
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+
+class StructuredOutputError(Exception):
+    """LLM output could not be parsed/validated (partial data attached when available)"""
+
+    def __init__(self, message: str, partial: Optional[Dict[str, Any]] = None, fields: Optional[List[str]] = None):
+        super().__init__(message)
+        self.partial = partial or {}
+        self.fields = fields or []
+
+
+def parse_json_text(text: str) -> Dict[str, Any]:
+    """
+    Parse a JSON object from LLM text
+    - Strips ```json fences
+    - Falls back to the outermost {...} block when the model added prose
+    """
+    text = (text or "").strip()
+    if text.startswith("```"):
+        text = re.sub(r"^```(?:json)?", "", text).rstrip("`").strip()
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        start, end = text.find("{"), text.rfind("}")
+        if start == -1 or end <= start:
+            raise
+        data = json.loads(text[start:end + 1])
+
+    if not isinstance(data, dict):
+        raise json.JSONDecodeError("Expected a JSON object", text, 0)
+    return data
+
+
+def validate_fields(schema: Type[BaseModel], data: Dict[str, Any]) -> Tuple[Optional[BaseModel], List[str]]:
+    """
+    Validate data against schema
+
+    Returns:
+        (model, []) on success, (None, [top-level fields to repair]) on failure
+    """
+    try:
+        return schema.model_validate(data), []
+    except ValidationError as e:
+        fields = []
+        for error in e.errors():
+            loc = error.get("loc") or ("__root__",)
+            field = str(loc[0])
+            if field not in fields:
+                fields.append(field)
+        return None, fields
+
+
+def is_valid_json_for(schema: Type[BaseModel], text: str) -> bool:
+    """Cache validator: parseable and schema-valid"""
+    try:
+        return validate_fields(schema, parse_json_text(text))[0] is not None
+    except (json.JSONDecodeError, ValueError):
+        return False
+
+
+# Keys google-generativeai's Schema proto accepts (no defaults, bounds, titles, $refs)
+_GEMINI_SCHEMA_KEYS = ("type", "description", "nullable", "enum", "items", "properties", "required")
+
+
+def gemini_response_schema(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    SDK-compatible response_schema for a Pydantic model
+    - $refs are inlined, Optional[X] becomes X + nullable
+    - Defaults and constraints (ge/le/min_length) are dropped; validate_fields()
+      still enforces them on the parsed output
+    - Free-form fields (Any) and untyped dicts cannot be expressed and are left out
+    """
+    json_schema = schema.model_json_schema()
+    definitions = json_schema.get("$defs", {})
+
+    def convert(node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if "$ref" in node:
+            node = {**definitions[node["$ref"].split("/")[-1]], **{k: v for k, v in node.items() if k != "$ref"}}
+        if "allOf" in node and len(node["allOf"]) == 1:
+            node = {**node["allOf"][0], **{k: v for k, v in node.items() if k != "allOf"}}
+            return convert(node)
+        if "anyOf" in node:
+            variants = [v for v in node["anyOf"] if v.get("type") != "null"]
+            if len(variants) != 1:
+                return None
+            converted = convert(variants[0])
+            if converted is not None and len(variants) < len(node["anyOf"]):
+                converted["nullable"] = True
+            return converted
+
+        node_type = node.get("type")
+        if node_type is None:
+            return None
+        out = {k: node[k] for k in _GEMINI_SCHEMA_KEYS if k in node and k not in ("items", "properties", "required")}
+        if node_type == "array":
+            items = convert(node.get("items", {}))
+            if items is None:
+                return None
+            out["items"] = items
+        elif node_type == "object":
+            properties = {}
+            for name, prop in node.get("properties", {}).items():
+                converted = convert(prop)
+                if converted is not None:
+                    properties[name] = converted
+            if not properties:
+                return None
+            out["properties"] = properties
+            required = [name for name in node.get("required", []) if name in properties]
+            if required:
+                out["required"] = required
+        return out
+
+    converted = convert(json_schema)
+    if converted is None:
+        raise ValueError(f"{schema.__name__} has no fields expressible as a Gemini response_schema")
+    return converted
+
+
+def build_repair_prompt(schema: Type[BaseModel], fields: List[str], partial: Dict[str, Any], context: str = "") -> str:
+    """
+    Cheap follow-up prompt asking ONLY for the missing/invalid fields
+    (instead of regenerating the whole document)
+    """
+    json_schema = schema.model_json_schema()
+    properties = json_schema.get("properties", {})
+    wanted = {field: properties.get(field, {}) for field in fields}
+    if json_schema.get("$defs"):
+        wanted_schema = {"properties": wanted, "$defs": json_schema["$defs"]}
+    else:
+        wanted_schema = {"properties": wanted}
+
+    return f"""The JSON you produced is missing or has invalid values for: {", ".join(fields)}.
+{context}
+Existing (valid) data for reference:
+{json.dumps(partial, ensure_ascii=False)[:3000]}
+
+Return ONLY a JSON object containing exactly these keys: {", ".join(fields)}
+Each value must match this JSON schema:
+{json.dumps(wanted_schema, ensure_ascii=False)}
+
+No markdown, no explanation - just the JSON object."""
@@ -2,12 +2,31 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from ai_career_advisor.core.logger import logger
 from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.http_client import HTTPClientPool
+from ai_career_advisor.core.executors import shutdown_executors
+from contextlib import asynccontextmanager
 
-# Create app directly without lifespan for now
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Write queued learned RAG documents before exit
+    try:
+        from ai_career_advisor.RAG.learned_writer import LearnedDocWriter
+        await LearnedDocWriter.flush()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not flush learned-doc queue: {e}")
+    # Release pooled keep-alive connections
+    await HTTPClientPool.close()
+    shutdown_executors()
+
+
+# Create app directly (scheduler is started from app.py)
 app = FastAPI(
     title="AI Career Advisor API",
     debug=settings.DEBUG,
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS
@@ -50,6 +50,7 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score, f1_score
 import numpy as np
 
+from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
 
 
@@ -107,7 +108,9 @@ class IntentClassifier:
         self,
         model_path: Optional[str] = None,
         num_labels: int = 9,
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        backend: str = "torch",
+        verify_parity: bool = True
     ):
         """
         Initialize the classifier
@@ -116,6 +119,8 @@ class IntentClassifier:
             model_path: Path to saved model (None = load pretrained)
             num_labels: Number of intent categories
             device: 'cuda', 'cpu', or None (auto-detect)
+            backend: 'torch', 'torch-int8', 'onnx' or 'onnx-int8' (see intent_export)
+            verify_parity: Only serve an optimized backend that passed its parity check
         """
         self.num_labels = num_labels
         
@@ -144,6 +149,32 @@ class IntentClassifier:
         # Load tokenizer
         self.tokenizer = DistilBertTokenizer.from_pretrained('distilbert-base-uncased')
         
+        self.backend = "torch"
+        self._onnx_session = None
+        if backend != "torch":
+            backend = self._check_backend(model_path, backend, verify_parity)
+        
+        # Identifies the served weights (cached intent results are tied to it)
+        self.version = self._version_of(model_path, backend)
+        
+        if backend.startswith("onnx"):
+            # The fp32 PyTorch weights are never loaded (smaller resident memory)
+            import onnxruntime as ort
+            from ai_career_advisor.ml_models.intent_export import onnx_file
+            
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            self._onnx_session = ort.InferenceSession(
+                str(onnx_file(model_path, quantized=backend == "onnx-int8")),
+                sess_options=options,
+                providers=["CPUExecutionProvider"]
+            )
+            self.model = None
+            self.device = torch.device('cpu')
+            self.backend = backend
+            logger.info(f"Intent classifier serving ONNX backend: {backend}")
+            return
+        
         # Load model
         if model_path and os.path.exists(model_path):
             logger.info(f"Loading trained model from {model_path}")
@@ -158,8 +189,59 @@ class IntentClassifier:
                 num_labels=num_labels
             )
         
+        if backend == "torch-int8":
+            from ai_career_advisor.ml_models.intent_export import quantize_torch
+            
+            self.model = quantize_torch(self.model)
+            self.device = torch.device('cpu')
+            self.backend = backend
+            logger.info("Intent classifier serving dynamically quantized INT8 PyTorch model")
+        
         self.model.to(self.device)
     
+    @staticmethod
+    def _version_of(model_path: Optional[str], backend: str) -> str:
+        """backend + last modification time of the saved model files"""
+        if not model_path or not os.path.isdir(model_path):
+            return f"{backend}:pretrained"
+        mtimes = [f.stat().st_mtime for f in Path(model_path).rglob("*") if f.is_file()]
+        return f"{backend}:{int(max(mtimes, default=0))}"
+    
+    @staticmethod
+    def _check_backend(model_path: Optional[str], backend: str, verify_parity: bool) -> str:
+        """Requested backend, or 'torch' if it is unknown, not exported or failed parity"""
+        from ai_career_advisor.ml_models.intent_export import BACKENDS, onnx_file, parity_passed
+        
+        if backend not in BACKENDS:
+            logger.warning(f"Unknown intent backend '{backend}', using torch")
+            return "torch"
+        if not model_path or not os.path.exists(model_path):
+            logger.warning(f"No trained model for backend '{backend}', using torch")
+            return "torch"
+        if backend.startswith("onnx") and not onnx_file(model_path, quantized=backend == "onnx-int8").exists():
+            logger.warning(f"Intent backend '{backend}' not exported (run train_intent_classifier --export-only), using torch")
+            return "torch"
+        if verify_parity and not parity_passed(model_path, backend):
+            logger.warning(f"Intent backend '{backend}' has no passing parity check, using torch")
+            return "torch"
+        return backend
+    
+    def _logits(self, input_ids: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+        """Forward pass on whichever backend is being served"""
+        if self._onnx_session is not None:
+            logits = self._onnx_session.run(None, {
+                "input_ids": input_ids.cpu().numpy().astype(np.int64),
+                "attention_mask": attention_mask.cpu().numpy().astype(np.int64)
+            })[0]
+            return torch.from_numpy(logits)
+        
+        self.model.eval()
+        with torch.no_grad():
+            return self.model(
+                input_ids=input_ids.to(self.device),
+                attention_mask=attention_mask.to(self.device)
+            ).logits
+    
     def train(
         self,
         train_texts: List[str],
@@ -318,8 +400,6 @@ class IntentClassifier:
         Returns:
             Tuple of (intent_label, confidence_score)
         """
-        self.model.eval()
-        
         # Tokenize input
         encoding = self.tokenizer(
             text,
@@ -329,16 +409,12 @@ class IntentClassifier:
             return_tensors='pt'
         )
         
-        # Move to device
-        input_ids = encoding['input_ids'].to(self.device)
-        attention_mask = encoding['attention_mask'].to(self.device)
-        
         # Get prediction
         with torch.no_grad():
-            outputs = self.model(input_ids=input_ids, attention_mask=attention_mask)
+            logits = self._logits(encoding['input_ids'], encoding['attention_mask'])
             
             # Apply softmax to get probabilities
-            probabilities = torch.softmax(outputs.logits, dim=1)
+            probabilities = torch.softmax(logits, dim=1)
             
             # Get highest probability and its index
             confidence, predicted_id = torch.max(probabilities, dim=1)
@@ -348,9 +424,53 @@ class IntentClassifier:
         
         return intent, confidence_score
     
-    def predict_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
-        """Predict intents for multiple texts"""
-        return [self.predict(text) for text in texts]
+    def predict_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Predict intents for multiple texts with real batched inference
+        
+        📚 STUDY NOTE - Why sort by length?
+        - Each batch is padded only to its longest sequence (dynamic padding)
+        - Sorting by token length keeps similar lengths together, so short
+          queries do not pay for one long query's padding
+        - Results are written back by original index, so order is preserved
+        
+        Args:
+            texts: User query texts
+            batch_size: Texts per forward pass (default: INTENT_BATCH_SIZE)
+        """
+        if not texts:
+            return []
+        
+        if batch_size is None:
+            batch_size = settings.INTENT_BATCH_SIZE
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        
+        # Tokenize once without padding; lengths decide the bucketing
+        encodings = self.tokenizer(list(texts), max_length=64, truncation=True)
+        order = sorted(range(len(texts)), key=lambda i: len(encodings['input_ids'][i]))
+        
+        results: List[Optional[Tuple[str, float]]] = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
+            batch = self.tokenizer.pad(
+                {
+                    'input_ids': [encodings['input_ids'][i] for i in indices],
+                    'attention_mask': [encodings['attention_mask'][i] for i in indices]
+                },
+                padding=True,
+                return_tensors='pt'
+            )
+            
+            with torch.no_grad():
+                logits = self._logits(batch['input_ids'], batch['attention_mask'])
+                probabilities = torch.softmax(logits, dim=1)
+                confidences, predicted_ids = torch.max(probabilities, dim=1)
+            
+            for i, confidence, predicted_id in zip(indices, confidences.tolist(), predicted_ids.tolist()):
+                results[i] = (self.id2label[predicted_id], confidence)
+        
+        return results
     
     def get_detailed_prediction(self, text: str) -> Dict[str, Any]:
         """
@@ -358,8 +478,6 @@ class IntentClassifier:
         
         Useful for debugging and understanding model behavior
         """
-        self.model.eval()
-        
         encoding = self.tokenizer(
             text,
             max_length=64,
@@ -368,12 +486,9 @@ class IntentClassifier:
             return_tensors='pt'
         )
         
-        input_ids = encoding['input_ids'].to(self.device)
-        attention_mask = encoding['attention_mask'].to(self.device)
-        
         with torch.no_grad():
-            outputs = self.model(input_ids=input_ids, attention_mask=attention_mask)
-            probabilities = torch.softmax(outputs.logits, dim=1).cpu().numpy()[0]
+            logits = self._logits(encoding['input_ids'], encoding['attention_mask'])
+            probabilities = torch.softmax(logits, dim=1).cpu().numpy()[0]
         
         # Create probability dict for all classes
         all_probs = {self.id2label[i]: float(prob) for i, prob in enumerate(probabilities)}
@@ -388,7 +503,8 @@ class IntentClassifier:
             "text": text,
             "predicted_intent": top_intent,
             "confidence": top_confidence,
-            "all_probabilities": sorted_probs
+            "all_probabilities": sorted_probs,
+            "backend": self.backend
         }
     
     def save_model(self, path: str) -> None:
@@ -433,8 +549,11 @@ def get_intent_classifier() -> IntentClassifier:
         model_path = Path(__file__).parent.parent.parent.parent / "models" / "intent_classifier"
         
         if model_path.exists():
-            logger.info("Loading trained intent classifier")
-            _classifier_instance = IntentClassifier(model_path=str(model_path))
+            logger.info(f"Loading trained intent classifier ({settings.INTENT_MODEL_BACKEND})")
+            _classifier_instance = IntentClassifier(
+                model_path=str(model_path),
+                backend=settings.INTENT_MODEL_BACKEND
+            )
         else:
             logger.warning("No trained model found. Using base model (will need training)")
             _classifier_instance = IntentClassifier()
@@ -0,0 +1,169 @@
+"""
+Optimized Intent Classifier Exports for CPU Serving
+
+📚 STUDY NOTES:
+================================
+- Dynamic INT8 quantization: Linear layer weights are stored as int8 and
+  activations are quantized on the fly -> ~4x smaller weights, faster matmuls on CPU
+- ONNX: the fine-tuned graph runs in onnxruntime (fused kernels, no autograd),
+  optionally quantized to int8 as well
+- Every variant must pass an accuracy-parity check on the held-out split before
+  IntentClassifier will serve it (results are written to optimized/parity.json)
+
+Backends:
+    torch       fp32 PyTorch (reference)
+    torch-int8  torch.quantization.quantize_dynamic applied at load time
+    onnx        exported graph, fp32
+    onnx-int8   exported graph, int8 dynamic quantization
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import torch
+
+from ai_career_advisor.core.logger import logger
+
+
+BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+
+OPTIMIZED_DIR = "optimized"
+FP32_FILE = "model.onnx"
+INT8_FILE = "model.int8.onnx"
+PARITY_FILE = "parity.json"
+
+
+class _LogitsOnly(torch.nn.Module):
+    """Wrapper so the exported graph has plain tensor inputs/outputs"""
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        return self.model(input_ids=input_ids, attention_mask=attention_mask).logits
+
+
+def optimized_dir(model_path: Union[str, Path]) -> Path:
+    return Path(model_path) / OPTIMIZED_DIR
+
+
+def onnx_file(model_path: Union[str, Path], quantized: bool) -> Path:
+    return optimized_dir(model_path) / (INT8_FILE if quantized else FP32_FILE)
+
+
+def quantize_torch(model):
+    """Dynamic INT8 quantization of every Linear layer (CPU only)"""
+    return torch.quantization.quantize_dynamic(model.to("cpu").eval(), {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def export_onnx(classifier, model_path: Union[str, Path], quantize: bool = True) -> Path:
+    """
+    Export a trained IntentClassifier to optimized/model.onnx
+    (+ optimized/model.int8.onnx with quantize=True)
+    """
+    out_dir = optimized_dir(model_path)
+    os.makedirs(out_dir, exist_ok=True)
+
+    model = classifier.model.to("cpu").eval()
+    sample = classifier.tokenizer(
+        ["sample query for export"], max_length=64, truncation=True, padding=True, return_tensors="pt"
+    )
+
+    fp32_path = out_dir / FP32_FILE
+    with torch.no_grad():
+        torch.onnx.export(
+            _LogitsOnly(model),
+            (sample["input_ids"], sample["attention_mask"]),
+            str(fp32_path),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"},
+            },
+            opset_version=17,
+            do_constant_folding=True,
+            # TorchScript exporter (the dynamo exporter needs onnxscript)
+            dynamo=False
+        )
+    model.to(classifier.device)
+    logger.success(f"✅ Exported intent classifier to {fp32_path}")
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        int8_path = out_dir / INT8_FILE
+        quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+        logger.success(f"✅ Quantized {int8_path.name} (int8 dynamic)")
+
+    return out_dir
+
+
+def evaluate_parity(
+    reference,
+    candidate,
+    texts: List[str],
+    labels: List[str],
+    max_accuracy_drop: float = 0.01
+) -> Dict[str, Any]:
+    """
+    Compare a candidate backend with the fp32 reference on held-out data
+    Passes when accuracy drops by at most max_accuracy_drop
+    """
+    def run(classifier):
+        start = time.perf_counter()
+        predictions = [classifier.predict(text)[0] for text in texts]
+        latency_ms = (time.perf_counter() - start) / max(len(texts), 1) * 1000
+        accuracy = sum(p == l for p, l in zip(predictions, labels)) / max(len(labels), 1)
+        return predictions, accuracy, latency_ms
+
+    ref_predictions, ref_accuracy, ref_latency = run(reference)
+    cand_predictions, cand_accuracy, cand_latency = run(candidate)
+    agreement = sum(a == b for a, b in zip(ref_predictions, cand_predictions)) / max(len(texts), 1)
+
+    report = {
+        "backend": candidate.backend,
+        "examples": len(texts),
+        "reference_accuracy": round(ref_accuracy, 4),
+        "accuracy": round(cand_accuracy, 4),
+        "agreement": round(agreement, 4),
+        "reference_latency_ms": round(ref_latency, 2),
+        "latency_ms": round(cand_latency, 2),
+        "max_accuracy_drop": max_accuracy_drop,
+        "passed": ref_accuracy - cand_accuracy <= max_accuracy_drop,
+        "checked_at": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+    log = logger.success if report["passed"] else logger.error
+    log(
+        f"{'✅' if report['passed'] else '❌'} Parity {candidate.backend}: "
+        f"accuracy {cand_accuracy:.2%} vs {ref_accuracy:.2%}, agreement {agreement:.2%}, "
+        f"{cand_latency:.1f} ms vs {ref_latency:.1f} ms per query"
+    )
+    return report
+
+
+def read_parity(model_path: Union[str, Path]) -> Dict[str, Any]:
+    try:
+        with open(optimized_dir(model_path) / PARITY_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_parity(model_path: Union[str, Path], report: Dict[str, Any]):
+    reports = read_parity(model_path)
+    reports[report["backend"]] = report
+    os.makedirs(optimized_dir(model_path), exist_ok=True)
+    with open(optimized_dir(model_path) / PARITY_FILE, "w", encoding="utf-8") as f:
+        json.dump(reports, f, indent=2)
+
+
+def parity_passed(model_path: Union[str, Path], backend: str) -> Optional[bool]:
+    """True/False from the last parity check, None if the backend was never checked"""
+    report = read_parity(model_path).get(backend)
+    return None if report is None else bool(report.get("passed"))
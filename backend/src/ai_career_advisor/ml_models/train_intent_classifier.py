@@ -5,6 +5,7 @@ HOW TO RUN THIS SCRIPT:
 ==========================
 cd backend
 python -m ai_career_advisor.ml_models.train_intent_classifier
+python -m ai_career_advisor.ml_models.train_intent_classifier --export-only   # re-export a trained model
 
 WHAT THIS SCRIPT DOES:
 =========================
@@ -13,6 +14,8 @@ WHAT THIS SCRIPT DOES:
 3. Fine-tunes DistilBERT model
 4. Evaluates on test set
 5. Saves the trained model
+6. Exports CPU-optimized variants (INT8 PyTorch, ONNX, ONNX INT8) and checks
+   their accuracy against the fp32 model on the same held-out test set
 
 INTERVIEW KEY POINTS:
 ========================
@@ -22,6 +25,7 @@ INTERVIEW KEY POINTS:
 - Stratified split = Each class is equally represented in train/test
 """
 
+import argparse
 import json
 import os
 import sys
@@ -41,6 +45,7 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='repla
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from ai_career_advisor.ml_models.intent_classifier import IntentClassifier
+from ai_career_advisor.ml_models.intent_export import evaluate_parity, export_onnx, write_parity
 
 
 def load_training_data(data_path: str):
@@ -54,7 +59,40 @@ def load_training_data(data_path: str):
     return texts, labels
 
 
+def export_optimized(model_path: Path, test_texts, test_labels):
+    """
+    Export ONNX / INT8 variants and record their parity on the held-out split
+    A failed export is reported, never fatal: the trained fp32 model is already saved
+    """
+    print("\n[EXPORT] Exporting CPU-optimized variants...")
+    try:
+        _export_and_check(model_path, test_texts, test_labels)
+    except Exception as e:
+        print(f"   [WARN] Export failed ({e}); serve the default INTENT_MODEL_BACKEND=torch")
+
+
+def _export_and_check(model_path: Path, test_texts, test_labels):
+    reference = IntentClassifier(model_path=str(model_path), device="cpu")
+    export_onnx(reference, model_path, quantize=True)
+    
+    for backend in ("torch-int8", "onnx", "onnx-int8"):
+        candidate = IntentClassifier(model_path=str(model_path), backend=backend, verify_parity=False)
+        report = evaluate_parity(reference, candidate, test_texts, test_labels)
+        write_parity(model_path, report)
+        print(
+            f"   {backend:<11} accuracy {report['accuracy']:.2%} (fp32 {report['reference_accuracy']:.2%}), "
+            f"agreement {report['agreement']:.2%}, {report['latency_ms']:.1f} ms/query "
+            f"(fp32 {report['reference_latency_ms']:.1f}) -> {'PASS' if report['passed'] else 'FAIL'}"
+        )
+    print("   Serve one with INTENT_MODEL_BACKEND=<backend>")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Train / export the intent classifier")
+    parser.add_argument("--export-only", action="store_true", help="Skip training, export the saved model")
+    parser.add_argument("--skip-export", action="store_true", help="Do not export optimized variants")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("[START] Intent Classifier Training Script")
     print("=" * 60)
@@ -100,6 +138,10 @@ def main():
     print(f"   Training examples: {len(train_texts)}")
     print(f"   Test examples: {len(test_texts)}")
     
+    if args.export_only:
+        export_optimized(model_save_path, test_texts, test_labels)
+        return
+    
     # Initialize classifier
     print("\n[INIT] Initializing DistilBERT classifier...")
     classifier = IntentClassifier()
@@ -189,6 +231,9 @@ def main():
     print(f"[DONE] Model saved to: {model_save_path}")
     print("=" * 60)
     
+    if not args.skip_export:
+        export_optimized(model_save_path, test_texts, test_labels)
+    
     # Print metrics summary for interview
     print("\n[METRICS] FOR INTERVIEW:")
     print("-" * 40)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, JSON, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, JSON, Float, DateTime, ForeignKey, Text, Index
 from sqlalchemy.sql import func
 from ai_career_advisor.core.database import Base
 
@@ -67,3 +67,13 @@ class BackwardRoadmap(Base):
             "confidence_score": self.confidence_score,
             "created_at": self.created_at.isoformat() if self.created_at else None
         }
+
+
+# One shared (user-less) roadmap per career - guards concurrent LLM inserts
+Index(
+    "uq_backward_roadmaps_shared_career",
+    func.lower(BackwardRoadmap.normalized_career),
+    unique=True,
+    sqlite_where=BackwardRoadmap.user_id.is_(None),
+    postgresql_where=BackwardRoadmap.user_id.is_(None)
+)
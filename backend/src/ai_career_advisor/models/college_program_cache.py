@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.sql import func
 from ai_career_advisor.core.database import Base
 
@@ -6,6 +6,9 @@ from ai_career_advisor.core.database import Base
 class CollegeProgramCache(Base):
     """Cache for college program availability checks"""
     __tablename__ = "college_program_cache"
+    __table_args__ = (
+        UniqueConstraint("college_id", "degree", "branch", name="uq_program_cache_college_degree_branch"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
@@ -0,0 +1,220 @@
+"""
+BM25 Keyword Index
+In-process inverted index kept next to each Chroma collection, so exact tokens
+("IIT Bombay fees", "JEE Advanced cutoff", "NIRF rank 7") are matched even when
+the dense embedding misses them
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ai_career_advisor.core.logger import logger
+
+
+TOKEN_PATTERN = re.compile(r"[\w₹]+", re.UNICODE)
+
+# Very common English glue words only: exam/college names must stay searchable
+STOPWORDS = {
+    "a", "an", "the", "of", "in", "on", "for", "to", "and", "or", "is", "are",
+    "what", "which", "how", "me", "my", "i", "do", "does", "with", "about", "kya", "hai", "ka", "ki", "ke"
+}
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in TOKEN_PATTERN.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Okapi BM25 over document ids
+    - upsert()/remove() keep it in step with incremental syncs
+    - Each document remembers its metadata "source", so searches can be
+      restricted to the same sources as a filtered vector query
+    - Persisted as JSON (term frequencies per document) next to the Chroma files
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._doc_terms: Dict[str, Dict[str, int]] = {}
+        self._doc_len: Dict[str, int] = {}
+        self._doc_source: Dict[str, Optional[str]] = {}
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._total_len = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    @property
+    def ids(self) -> set:
+        return set(self._doc_terms)
+
+    def _remove_unlocked(self, doc_id: str):
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        self._total_len -= self._doc_len.pop(doc_id, 0)
+        self._doc_source.pop(doc_id, None)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def upsert(self, items: Iterable[Tuple[str, str, Optional[str]]]):
+        """Add or replace (doc_id, text, source) entries"""
+        with self._lock:
+            for doc_id, text, source in items:
+                self._remove_unlocked(doc_id)
+                terms = Counter(tokenize(text))
+                self._doc_terms[doc_id] = dict(terms)
+                self._doc_source[doc_id] = source
+                length = sum(terms.values())
+                self._doc_len[doc_id] = length
+                self._total_len += length
+                for term, tf in terms.items():
+                    self._postings[term][doc_id] = tf
+
+    def remove(self, doc_ids: Iterable[str]):
+        with self._lock:
+            for doc_id in doc_ids:
+                self._remove_unlocked(doc_id)
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        sources: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """[(doc_id, bm25 score)] best first, optionally only documents from sources"""
+        allowed = set(sources) if sources else None
+        terms = set(tokenize(query))
+        if not terms or not self._doc_terms:
+            return []
+
+        with self._lock:
+            n_docs = len(self._doc_terms)
+            avg_len = self._total_len / n_docs if n_docs else 0.0
+            scores: Dict[str, float] = defaultdict(float)
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings.items():
+                    if allowed is not None and self._doc_source.get(doc_id) not in allowed:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_len[doc_id] / (avg_len or 1))
+                    scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+    # =============================
+    # PERSISTENCE
+    # =============================
+
+    def save(self, path: str):
+        with self._lock:
+            payload = json.dumps({
+                "version": self.FORMAT_VERSION,
+                "k1": self.k1,
+                "b": self.b,
+                "doc_terms": self._doc_terms,
+                "doc_sources": self._doc_source
+            })
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BM25Index"]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get("version") != cls.FORMAT_VERSION:
+            # Older layout (no sources): rebuilt from the collection
+            return None
+
+        index = cls(k1=data.get("k1", 1.5), b=data.get("b", 0.75))
+        for doc_id, terms in data.get("doc_terms", {}).items():
+            index._doc_terms[doc_id] = terms
+            index._doc_source[doc_id] = data["doc_sources"].get(doc_id)
+            length = sum(terms.values())
+            index._doc_len[doc_id] = length
+            index._total_len += length
+            for term, tf in terms.items():
+                index._postings[term][doc_id] = tf
+        return index
+
+
+class KeywordIndexRegistry:
+    """
+    One BM25Index per Chroma collection
+    - Built from the collection's stored documents when no file exists yet
+    - Reloaded when another process (the reindex job) rewrote the file
+    """
+
+    _indexes: Dict[str, Tuple[float, BM25Index]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def path_for(persist_directory: str, collection_name: str) -> str:
+        return os.path.join(persist_directory, f"bm25_{collection_name}.json")
+
+    @classmethod
+    def build_from_collection(cls, collection) -> BM25Index:
+        index = BM25Index()
+        stored = collection.get(include=["documents", "metadatas"])
+        index.upsert(
+            (doc_id, doc, (meta or {}).get("source"))
+            for doc_id, doc, meta in zip(stored["ids"], stored["documents"], stored["metadatas"])
+        )
+        logger.info(f"🔤 Built BM25 index for '{collection.name}' ({len(index)} docs)")
+        return index
+
+    @classmethod
+    def get(cls, persist_directory: str, collection) -> BM25Index:
+        path = cls.path_for(persist_directory, collection.name)
+        mtime = os.path.getmtime(path) if os.path.exists(path) else 0.0
+
+        cached = cls._indexes.get(collection.name)
+        if cached and cached[0] >= mtime:
+            return cached[1]
+
+        with cls._lock:
+            cached = cls._indexes.get(collection.name)
+            if cached and cached[0] >= mtime:
+                return cached[1]
+            index = BM25Index.load(path) if mtime else None
+            if index is None:
+                index = cls.build_from_collection(collection)
+                index.save(path)
+                mtime = os.path.getmtime(path)
+            cls._indexes[collection.name] = (mtime, index)
+            return index
+
+    @classmethod
+    def save(cls, persist_directory: str, collection_name: str, index: BM25Index):
+        path = cls.path_for(persist_directory, collection_name)
+        index.save(path)
+        cls._indexes[collection_name] = (os.path.getmtime(path), index)
+
+    @classmethod
+    def drop(cls, persist_directory: str, collection_name: str):
+        cls._indexes.pop(collection_name, None)
+        try:
+            os.remove(cls.path_for(persist_directory, collection_name))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,162 @@
+"""
+Token-aware Document Chunking
+Sits between KnowledgeLoader and the vector store: long documents are split on
+section/sentence boundaries into chunks that fit the embedding model's window
+(MiniLM reads 256 tokens), with overlap, parent ids and chunk-level dedup
+"""
+
+import hashlib
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from ai_career_advisor.core.logger import logger
+from ai_career_advisor.RAG.rag_config import get_rag_config
+
+
+# Chunk ids are "<parent_id>#c<index>"; short documents keep their own id
+CHUNK_SEPARATOR = "#c"
+
+SECTION_SPLIT = re.compile(r"\n\s*\n")
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?।])\s+|\n")
+
+
+def parent_id_of(doc_id: str) -> str:
+    return doc_id.split(CHUNK_SEPARATOR, 1)[0]
+
+
+class DocumentChunker:
+    """
+    Splits {"id", "content", "metadata"} documents into embedding-sized chunks
+    - Sections (blank-line separated) first, then sentences, then words
+    - Consecutive chunks of a document share overlap_tokens of context
+    - Chunk metadata carries parent_id / chunk_index / chunk_count
+    - Identical chunk texts are embedded once (first occurrence wins)
+    """
+
+    _token_counter: Optional[Callable[[str], int]] = None
+
+    @staticmethod
+    def _config() -> Dict[str, Any]:
+        config = get_rag_config().get("chunking") or {}
+        return {
+            "max_tokens": config.get("max_tokens", 200),
+            "overlap_tokens": config.get("overlap_tokens", 40),
+            "min_chunk_tokens": config.get("min_chunk_tokens", 8),
+        }
+
+    @classmethod
+    def count_tokens(cls, text: str) -> int:
+        """Tokens as the embedding model's tokenizer sees them (word estimate as fallback)"""
+        if cls._token_counter is None:
+            try:
+                from transformers import AutoTokenizer
+                from ai_career_advisor.RAG.embeddings import EmbeddingService
+
+                model_id = EmbeddingService.MODEL_NAME
+                if "/" not in model_id:
+                    model_id = f"sentence-transformers/{model_id}"
+                tokenizer = AutoTokenizer.from_pretrained(model_id)
+                cls._token_counter = lambda t: len(tokenizer.tokenize(t))
+            except Exception as e:
+                logger.warning(f"⚠️ Tokenizer unavailable for chunking, estimating tokens from words: {e}")
+                cls._token_counter = lambda t: int(len(t.split()) * 1.3) + 1
+        return cls._token_counter(text)
+
+    @classmethod
+    def _units(cls, text: str, max_tokens: int) -> List[str]:
+        """Sentence-level pieces, each no longer than max_tokens"""
+        units = []
+        for section in SECTION_SPLIT.split(text):
+            for sentence in SENTENCE_SPLIT.split(section):
+                sentence = sentence.strip()
+                if not sentence:
+                    continue
+                if cls.count_tokens(sentence) <= max_tokens:
+                    units.append(sentence)
+                    continue
+                # Very long sentence: fall back to word windows
+                words, current = sentence.split(), []
+                for word in words:
+                    current.append(word)
+                    if cls.count_tokens(" ".join(current)) >= max_tokens:
+                        units.append(" ".join(current))
+                        current = []
+                if current:
+                    units.append(" ".join(current))
+        return units
+
+    @classmethod
+    def split_text(cls, text: str) -> List[str]:
+        """Greedy packing of sentences into chunks with sentence-level overlap"""
+        config = cls._config()
+        max_tokens, overlap_tokens = config["max_tokens"], config["overlap_tokens"]
+
+        if cls.count_tokens(text) <= max_tokens:
+            return [text.strip()]
+
+        chunks: List[str] = []
+        current: List[str] = []
+        current_tokens = 0
+        for unit in cls._units(text, max_tokens):
+            unit_tokens = cls.count_tokens(unit)
+            if current and current_tokens + unit_tokens > max_tokens:
+                chunks.append(" ".join(current))
+                # Carry trailing sentences forward as overlap
+                overlap, overlap_size = [], 0
+                for sentence in reversed(current):
+                    size = cls.count_tokens(sentence)
+                    if overlap_size + size > overlap_tokens:
+                        break
+                    overlap.insert(0, sentence)
+                    overlap_size += size
+                current, current_tokens = overlap, overlap_size
+            current.append(unit)
+            current_tokens += unit_tokens
+
+        if current:
+            tail = " ".join(current)
+            # Merge a tiny tail into the previous chunk instead of embedding noise
+            if chunks and cls.count_tokens(tail) < config["min_chunk_tokens"]:
+                chunks[-1] = f"{chunks[-1]} {tail}"
+            else:
+                chunks.append(tail)
+        return chunks
+
+    @staticmethod
+    def _fingerprint(text: str) -> str:
+        normalized = " ".join(text.lower().split())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def chunk_documents(cls, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Documents -> chunk documents (ids stable for unchanged content)"""
+        chunks: List[Dict[str, Any]] = []
+        seen = set()
+        duplicates = 0
+
+        for doc in documents:
+            pieces = cls.split_text(doc["content"])
+            for index, piece in enumerate(pieces):
+                fingerprint = cls._fingerprint(piece)
+                if fingerprint in seen:
+                    duplicates += 1
+                    continue
+                seen.add(fingerprint)
+
+                chunk_id = doc["id"] if len(pieces) == 1 else f"{doc['id']}{CHUNK_SEPARATOR}{index}"
+                chunks.append({
+                    "id": chunk_id,
+                    "content": piece,
+                    "metadata": {
+                        **doc["metadata"],
+                        "parent_id": doc["id"],
+                        "chunk_index": index,
+                        "chunk_count": len(pieces)
+                    }
+                })
+
+        logger.info(
+            f"✂️ Chunked {len(documents)} documents into {len(chunks)} chunks"
+            f" ({duplicates} duplicate chunks skipped)"
+        )
+        return chunks
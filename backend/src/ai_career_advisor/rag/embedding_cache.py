@@ -0,0 +1,193 @@
+"""
+Embedding Cache
+Content-hash -> vector cache for EmbeddingService, versioned by model name
+- In-memory LRU (queries and hot corpus texts)
+- On-disk SQLite store of float32 vectors (corpus texts survive restarts/reindexes)
+"""
+
+import hashlib
+import os
+import sqlite3
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.executors import run_io
+from ai_career_advisor.core.logger import logger
+
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "chroma_db",
+    "embedding_cache.sqlite"
+)
+
+
+class _DiskStore:
+    """SQLite table of (hash key, model, float32 blob)"""
+
+    # SQLite's default host parameter limit is 999
+    LOOKUP_CHUNK = 500
+
+    def __init__(self, path: str):
+        self._path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with sqlite3.connect(self._path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, model TEXT NOT NULL, vector BLOB NOT NULL)"
+            )
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with sqlite3.connect(self._path) as conn:
+            for start in range(0, len(keys), self.LOOKUP_CHUNK):
+                chunk = keys[start:start + self.LOOKUP_CHUNK]
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+        return found
+
+    def set_many(self, model: str, items: Dict[str, List[float]]):
+        with sqlite3.connect(self._path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, model, vector) VALUES (?, ?, ?)",
+                [(key, model, array("f", vector).tobytes()) for key, vector in items.items()]
+            )
+
+    def prune_other_models(self, model: str) -> int:
+        with sqlite3.connect(self._path) as conn:
+            return conn.execute("DELETE FROM embeddings WHERE model != ?", (model,)).rowcount
+
+    def count(self) -> int:
+        with sqlite3.connect(self._path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache
+    - Keys are sha256(model name + text), so a model change never serves stale vectors
+    - Queries are remembered in memory only; corpus texts are also persisted to disk
+    """
+
+    _memory: "OrderedDict[str, List[float]]" = OrderedDict()
+    _disk: Optional[_DiskStore] = None
+    _disk_initialized = False
+    _stats: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "disk_writes": 0}
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _get_disk(cls) -> Optional[_DiskStore]:
+        if cls._disk_initialized:
+            return cls._disk
+        cls._disk_initialized = True
+
+        try:
+            cls._disk = _DiskStore(settings.EMBEDDING_CACHE_PATH or DEFAULT_CACHE_PATH)
+            logger.info(f"🗄️ Embedding cache disk store: {cls._disk._path}")
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding cache disk store unavailable, using memory only: {e}")
+            cls._disk = None
+        return cls._disk
+
+    @classmethod
+    def _remember(cls, key: str, vector: List[float]):
+        cls._memory[key] = vector
+        cls._memory.move_to_end(key)
+        while len(cls._memory) > settings.EMBEDDING_CACHE_MEMORY_ENTRIES:
+            cls._memory.popitem(last=False)
+
+    @classmethod
+    async def get_many(cls, model: str, texts: List[str]) -> Dict[str, List[float]]:
+        """Cached vectors by text (memory first, then disk); misses are simply absent"""
+        if not settings.EMBEDDING_CACHE_ENABLED:
+            return {}
+
+        found: Dict[str, List[float]] = {}
+        pending: Dict[str, str] = {}
+        for text in texts:
+            key = cls.make_key(model, text)
+            vector = cls._memory.get(key)
+            if vector is not None:
+                cls._memory.move_to_end(key)
+                found[text] = vector
+                cls._stats["memory_hits"] += 1
+            else:
+                pending[key] = text
+
+        disk = cls._get_disk()
+        if pending and disk:
+            try:
+                rows = await run_io(disk.get_many, list(pending))
+            except Exception as e:
+                logger.warning(f"⚠️ Embedding cache disk read failed: {e}")
+                rows = {}
+            for key, vector in rows.items():
+                cls._remember(key, vector)
+                found[pending.pop(key)] = vector
+                cls._stats["disk_hits"] += 1
+
+        cls._stats["misses"] += len(pending)
+        return found
+
+    @classmethod
+    async def get(cls, model: str, text: str) -> Optional[List[float]]:
+        return (await cls.get_many(model, [text])).get(text)
+
+    @classmethod
+    async def set_many(cls, model: str, vectors: Dict[str, List[float]], persist: bool = True):
+        """Remember text -> vector pairs; persist=True also writes them to disk"""
+        if not settings.EMBEDDING_CACHE_ENABLED or not vectors:
+            return
+
+        keyed = {cls.make_key(model, text): vector for text, vector in vectors.items()}
+        for key, vector in keyed.items():
+            cls._remember(key, vector)
+
+        disk = cls._get_disk()
+        if persist and disk:
+            try:
+                await run_io(disk.set_many, model, keyed)
+                cls._stats["disk_writes"] += len(keyed)
+            except Exception as e:
+                logger.warning(f"⚠️ Embedding cache disk write failed: {e}")
+
+    @classmethod
+    async def prune(cls, model: str) -> int:
+        """Drop persisted vectors produced by other model versions"""
+        disk = cls._get_disk()
+        if not disk:
+            return 0
+        removed = await run_io(disk.prune_other_models, model)
+        if removed:
+            logger.info(f"🧹 Pruned {removed} embeddings from previous models")
+        return removed
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, object]:
+        lookups = cls._stats["memory_hits"] + cls._stats["disk_hits"] + cls._stats["misses"]
+        disk = cls._disk
+        return {
+            "enabled": settings.EMBEDDING_CACHE_ENABLED,
+            **cls._stats,
+            "hit_rate": round((lookups - cls._stats["misses"]) / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(cls._memory),
+            "max_memory_entries": settings.EMBEDDING_CACHE_MEMORY_ENTRIES,
+            "disk_entries": disk.count() if disk else None
+        }
+
+    @classmethod
+    def clear(cls):
+        """Drop the in-process tier (disk entries stay valid for the same model)"""
+        cls._memory.clear()
+        logger.info("🧹 Embedding cache cleared")
@@ -1,6 +1,11 @@
 from ai_career_advisor.core.logger import logger
-from typing import List
-import asyncio
+from ai_career_advisor.core.executors import run_cpu
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.RAG.embedding_cache import EmbeddingCache
+from ai_career_advisor.core.micro_batcher import MicroBatcher
+from ai_career_advisor.RAG.rag_config import get_embedding_config, resolve_repo_path
+from typing import Any, Dict, List, Optional
+import threading
 from functools import lru_cache
 
 
@@ -10,34 +15,151 @@ class EmbeddingService:
     - Works offline (after first model download)
     - Free, no API limits
     - Fast embedding generation
+    - Backend (torch / onnx, optional int8) selected in configs/rag.yaml
     """
     
     # Using a lightweight, high-quality model
-    MODEL_NAME = "all-MiniLM-L6-v2"  # 384 dimensions, fast, good quality
+    MODEL_NAME = get_embedding_config().get("model_name", "all-MiniLM-L6-v2")  # 384 dimensions
     _model = None
-    _lock = asyncio.Lock()
+    # cache_version() of the backend that actually loaded (ONNX may fall back to PyTorch)
+    _loaded_version: Optional[str] = None
+    # _get_model() runs on CPU-pool threads; concurrent first calls must not load twice
+    _load_lock = threading.Lock()
+    _batcher: Optional[MicroBatcher] = None
+    
+    @staticmethod
+    def _backend() -> str:
+        return (get_embedding_config().get("backend") or "torch").lower()
+    
+    @classmethod
+    def _configured_version(cls) -> str:
+        if cls._backend() != "onnx":
+            return cls.MODEL_NAME
+        quantized = (get_embedding_config().get("onnx") or {}).get("quantize", True)
+        return f"{cls.MODEL_NAME}:onnx-{'int8' if quantized else 'fp32'}"
+    
+    @classmethod
+    def cache_version(cls) -> str:
+        """
+        Model + backend label used to version cached vectors
+        The loaded backend's label; the configured one until the model is loaded
+        (use resolved_cache_version() where the difference matters)
+        """
+        return cls._loaded_version or cls._configured_version()
+    
+    @classmethod
+    async def resolved_cache_version(cls) -> str:
+        """cache_version() after loading the model (an ONNX load can fall back to PyTorch)"""
+        if cls._loaded_version is None and cls._backend() == "onnx":
+            await run_cpu(cls._get_model)
+        return cls.cache_version()
+    
+    @classmethod
+    def _load_torch_model(cls):
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(cls.MODEL_NAME)
+    
+    @classmethod
+    def _load_onnx_model(cls):
+        """
+        ONNX Runtime backend: exported (and parity-checked against PyTorch) on
+        first use, then loaded without torch on later starts
+        """
+        import json
+        from ai_career_advisor.RAG.onnx_embedder import OnnxEmbedder, check_parity
+        
+        onnx_config = get_embedding_config().get("onnx") or {}
+        model_dir = resolve_repo_path(onnx_config.get("model_dir", f"backend/models/embeddings/{cls.MODEL_NAME}-onnx"))
+        quantized = onnx_config.get("quantize", True)
+        max_seq_length = onnx_config.get("max_seq_length", 256)
+        
+        if not OnnxEmbedder.is_exported(model_dir, quantized):
+            OnnxEmbedder.export(cls.MODEL_NAME, model_dir, quantize=quantized, max_seq_length=max_seq_length)
+        
+        embedder = OnnxEmbedder(
+            model_dir,
+            quantized=quantized,
+            max_seq_length=max_seq_length,
+            intra_op_threads=onnx_config.get("intra_op_threads", 0)
+        )
+        
+        parity_file = model_dir / f"parity{'.int8' if quantized else ''}.json"
+        if not parity_file.exists():
+            min_cosine = check_parity(
+                cls._load_torch_model(),
+                embedder,
+                onnx_config.get("parity_texts") or ["How to become a software engineer?"],
+                onnx_config.get("parity_min_cosine", 0.99)
+            )
+            if min_cosine is None:
+                raise RuntimeError("ONNX embeddings diverge from the PyTorch model")
+            parity_file.write_text(json.dumps({"min_cosine": min_cosine, "quantized": quantized}))
+        
+        return embedder
     
     @classmethod
     def _get_model(cls):
         """Lazy load the model (only when first needed)"""
-        if cls._model is None:
-            logger.info(f"🔄 Loading embedding model: {cls.MODEL_NAME}")
+        if cls._model is not None:
+            return cls._model
+        
+        with cls._load_lock:
+            if cls._model is not None:
+                return cls._model
+            
+            backend = cls._backend()
+            logger.info(f"🔄 Loading embedding model: {cls.MODEL_NAME} ({backend})")
             try:
-                from sentence_transformers import SentenceTransformer
-                cls._model = SentenceTransformer(cls.MODEL_NAME)
+                version = cls._configured_version()
+                if backend == "onnx":
+                    try:
+                        model = cls._load_onnx_model()
+                    except Exception as e:
+                        logger.error(f"❌ ONNX backend unavailable, falling back to PyTorch: {e}")
+                        model = cls._load_torch_model()
+                        version = cls.MODEL_NAME
+                else:
+                    model = cls._load_torch_model()
+                # Version first: the unlocked fast path only checks _model
+                cls._loaded_version = version
+                cls._model = model
                 logger.success(f"✅ Embedding model loaded successfully")
             except Exception as e:
                 logger.error(f"❌ Failed to load model: {e}")
                 raise
         return cls._model
     
+    @classmethod
+    def _encode_batch(cls, texts: List[str]) -> List[List[float]]:
+        """Blocking encode of a list of texts (run on the CPU pool)"""
+        return cls._get_model().encode(texts).tolist()
+    
+    @classmethod
+    def _get_batcher(cls) -> MicroBatcher:
+        if cls._batcher is None:
+            cls._batcher = MicroBatcher(
+                cls._encode_batch,
+                max_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE,
+                max_wait_ms=settings.EMBEDDING_BATCH_MAX_WAIT_MS,
+                name=cls.MODEL_NAME
+            )
+        return cls._batcher
+    
+    @classmethod
+    def get_batcher_stats(cls) -> Dict[str, Any]:
+        return {
+            "enabled": settings.EMBEDDING_BATCHING_ENABLED,
+            **(cls._batcher.get_stats() if cls._batcher else {})
+        }
+    
     @staticmethod
-    async def generate_embedding(text: str) -> List[float]:
+    async def generate_embedding(text: str, persist: bool = True) -> List[float]:
         """
         Generate embedding for a single text
         
         Args:
             text: Input text (will be truncated if too long)
+            persist: Also store the vector in the on-disk cache (corpus texts)
         
         Returns:
             384-dimensional vector (for all-MiniLM-L6-v2)
@@ -52,12 +174,18 @@ class EmbeddingService:
                 text = text[:5000]
                 logger.warning(f"Text truncated to 5000 chars")
             
-            # Run in executor to not block event loop
-            loop = asyncio.get_event_loop()
-            embedding = await loop.run_in_executor(
-                None,
-                lambda: EmbeddingService._get_model().encode(text).tolist()
-            )
+            version = await EmbeddingService.resolved_cache_version()
+            cached = await EmbeddingCache.get(version, text)
+            if cached is not None:
+                return cached
+            
+            if settings.EMBEDDING_BATCHING_ENABLED:
+                # Concurrent requests share one encode() call
+                embedding = await EmbeddingService._get_batcher().submit(text)
+            else:
+                # Run on the dedicated CPU pool (not shared with provider I/O)
+                embedding = await run_cpu(lambda: EmbeddingService._get_model().encode(text).tolist())
+            await EmbeddingCache.set_many(version, {text: embedding}, persist=persist)
             
             logger.debug(f"Generated embedding (dim: {len(embedding)})")
             return embedding
@@ -70,9 +198,9 @@ class EmbeddingService:
     async def generate_query_embedding(query: str) -> List[float]:
         """
         Generate embedding for search query
-        Same as generate_embedding but with clear semantics
+        Same as generate_embedding, but only cached in memory (not persisted)
         """
-        return await EmbeddingService.generate_embedding(query)
+        return await EmbeddingService.generate_embedding(query, persist=False)
     
     @staticmethod
     async def generate_batch_embeddings(texts: List[str]) -> List[List[float]]:
@@ -87,14 +215,23 @@ class EmbeddingService:
             if not clean_texts:
                 return []
             
-            # Batch encode
-            loop = asyncio.get_event_loop()
-            embeddings = await loop.run_in_executor(
-                None,
-                lambda: EmbeddingService._get_model().encode(clean_texts).tolist()
-            )
+            # Only texts never embedded by this model reach the encoder
+            version = await EmbeddingService.resolved_cache_version()
+            cached = await EmbeddingCache.get_many(version, clean_texts)
+            missing = list(dict.fromkeys(t for t in clean_texts if t not in cached))
+            
+            if missing:
+                vectors = await run_cpu(EmbeddingService._encode_batch, missing)
+                computed = dict(zip(missing, vectors))
+                await EmbeddingCache.set_many(version, computed)
+                cached.update(computed)
             
-            logger.success(f"✅ Generated {len(embeddings)} embeddings in batch")
+            embeddings = [cached[t] for t in clean_texts]
+            
+            logger.success(
+                f"✅ Generated {len(embeddings)} embeddings in batch "
+                f"({len(missing)} encoded, {len(embeddings) - len(missing)} cached)"
+            )
             return embeddings
         
         except Exception as e:
@@ -0,0 +1,284 @@
+"""
+Incremental Knowledge Base Sync
+Diff-based reindexing: only new/changed documents are embedded and upserted,
+vanished ids are deleted, llm_* documents learned at runtime are preserved.
+Full rebuilds go into a versioned shadow collection and flip the alias atomically.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from ai_career_advisor.RAG.knowledge_loader import KnowledgeLoader
+from ai_career_advisor.RAG.embeddings import EmbeddingService
+from ai_career_advisor.RAG.embedding_cache import EmbeddingCache
+from ai_career_advisor.RAG.chunking import DocumentChunker, parent_id_of
+from ai_career_advisor.RAG.bm25_index import KeywordIndexRegistry
+from ai_career_advisor.core.executors import run_cpu
+from ai_career_advisor.RAG.vector_store import VectorStore
+from ai_career_advisor.core.logger import logger
+
+
+class KnowledgeIndexSync:
+    """
+    Content-hash based sync between the database and a Chroma collection
+    - content_hash is stored in each document's metadata
+    - The last sync time is kept in the collection metadata (synced_at) and used
+      as an updated_at watermark for the next incremental run
+    """
+
+    # Ids written by LearnedDocWriter / RAGRetriever.add_to_knowledge_base - never deleted by sync
+    LEARNED_PREFIX = "llm_"
+
+    # Overlap between runs so rows committed during the last sync are not missed
+    WATERMARK_OVERLAP = timedelta(minutes=10)
+
+    # Embedding chunk size (also the granularity of progress updates)
+    EMBED_BATCH_SIZE = 256
+
+    SMOKE_TEST_QUERY = "IIT Bombay fees"
+
+    @staticmethod
+    def content_hash(doc: Dict[str, Any]) -> str:
+        material = json.dumps(
+            {"content": doc["content"], "metadata": doc["metadata"]},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_watermark(collection) -> Optional[datetime]:
+        synced_at = (collection.metadata or {}).get("synced_at")
+        if not synced_at:
+            return None
+        try:
+            return datetime.fromisoformat(synced_at)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def set_watermark(collection, synced_at: datetime):
+        metadata = {
+            k: v for k, v in (collection.metadata or {}).items()
+            if not k.startswith("hnsw:")
+        }
+        metadata["synced_at"] = synced_at.isoformat()
+        collection.modify(metadata=metadata)
+
+    @classmethod
+    async def sync(
+        cls,
+        vs: VectorStore,
+        collection,
+        *,
+        full: bool = False,
+        progress: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Bring the collection in line with the database
+
+        Args:
+            full: Ignore the watermark and hash-compare every row
+                  (still only re-embeds documents whose content changed)
+            progress: Optional dict updated in place (stage / embedded / to_embed)
+
+        Returns:
+            Stats: loaded / chunks / upserted / unchanged / deleted / preserved_learned
+        """
+        started = datetime.now(timezone.utc)
+        watermark = None if full else cls.get_watermark(collection)
+        since = watermark - cls.WATERMARK_OVERLAP if watermark else None
+        logger.info(f"🔄 Knowledge sync ({'full' if since is None else f'since {since.isoformat()}'})")
+        if progress is None:
+            progress = {}
+        progress["stage"] = "loading"
+
+        documents = await KnowledgeLoader.load_all(since=since)
+        live_ids = await KnowledgeLoader.load_all_ids()
+        stored = vs.get_content_hashes(collection)
+
+        # Hashing/diffing works on chunks; rows map back through parent_id
+        progress["stage"] = "chunking"
+        chunks = await run_cpu(DocumentChunker.chunk_documents, documents)
+        loaded_parents = {doc["id"] for doc in documents}
+        chunk_ids = {chunk["id"] for chunk in chunks}
+
+        changed: List[Dict[str, Any]] = []
+        for doc in chunks:
+            doc_hash = cls.content_hash(doc)
+            if stored.get(doc["id"]) != doc_hash:
+                doc["metadata"] = {**doc["metadata"], "content_hash": doc_hash}
+                changed.append(doc)
+
+        progress.update({"stage": "embedding", "to_embed": len(changed), "embedded": 0})
+        upserted = 0
+        for start in range(0, len(changed), cls.EMBED_BATCH_SIZE):
+            batch = changed[start:start + cls.EMBED_BATCH_SIZE]
+            texts = [doc["content"] for doc in batch]
+            embeddings = await EmbeddingService.generate_batch_embeddings(texts)
+            if len(embeddings) != len(texts):
+                raise RuntimeError(f"Embedding count mismatch ({len(embeddings)}/{len(texts)})")
+            vs.upsert_documents(
+                collection=collection,
+                documents=texts,
+                embeddings=embeddings,
+                metadatas=[doc["metadata"] for doc in batch],
+                ids=[doc["id"] for doc in batch]
+            )
+            upserted += len(batch)
+            progress["embedded"] = upserted
+
+        progress["stage"] = "deleting"
+
+        learned = [id_ for id_ in stored if id_.startswith(cls.LEARNED_PREFIX)]
+        # Rows that vanished, plus old chunks of re-chunked rows that no longer exist
+        stale = [
+            id_ for id_ in stored
+            if not id_.startswith(cls.LEARNED_PREFIX) and (
+                parent_id_of(id_) not in live_ids
+                or (parent_id_of(id_) in loaded_parents and id_ not in chunk_ids)
+            )
+        ]
+        vs.delete_documents(collection, stale)
+
+        progress["stage"] = "keyword_index"
+        await run_cpu(cls.refresh_keyword_index, vs, collection, changed, stale)
+
+        cls.set_watermark(collection, started)
+
+        stats = {
+            "mode": "full" if since is None else "incremental",
+            "loaded": len(documents),
+            "chunks": len(chunks),
+            "upserted": upserted,
+            "unchanged": len(chunks) - upserted,
+            "deleted": len(stale),
+            "preserved_learned": len(learned),
+            "total": collection.count(),
+            "duration_seconds": round((datetime.now(timezone.utc) - started).total_seconds(), 2)
+        }
+        logger.success(f"✅ Knowledge sync done: {stats}")
+        return stats
+
+    @staticmethod
+    def refresh_keyword_index(
+        vs: VectorStore,
+        collection,
+        upserted: Iterable[Dict[str, Any]] = (),
+        deleted_ids: Iterable[str] = ()
+    ) -> int:
+        """
+        Apply a sync's changes to the collection's BM25 index and persist it
+        Also reconciles against the stored ids (learned documents added by
+        another process, an index file from an older run)
+        """
+        index = KeywordIndexRegistry.get(vs.persist_directory, collection)
+        index.remove(deleted_ids)
+        index.upsert((doc["id"], doc["content"], doc["metadata"].get("source")) for doc in upserted)
+
+        stored_ids = set(collection.get(include=[])["ids"])
+        indexed_ids = index.ids
+        index.remove(indexed_ids - stored_ids)
+        missing = list(stored_ids - indexed_ids)
+        if missing:
+            fetched = collection.get(ids=missing, include=["documents", "metadatas"])
+            index.upsert(
+                (doc_id, doc, (meta or {}).get("source"))
+                for doc_id, doc, meta in zip(fetched["ids"], fetched["documents"], fetched["metadatas"])
+            )
+
+        KeywordIndexRegistry.save(vs.persist_directory, collection.name, index)
+        return len(index)
+
+    @classmethod
+    def copy_learned(cls, source, target) -> int:
+        """Copy llm_* documents (with their embeddings) missing from target"""
+        learned = source.get(
+            where={"source": "llm_generated"},
+            include=["documents", "embeddings", "metadatas"]
+        )
+        existing = set(target.get(ids=list(learned["ids"]), include=[])["ids"]) if learned["ids"] else set()
+        items = [
+            (id_, doc, emb, meta)
+            for id_, doc, emb, meta in zip(
+                learned["ids"], learned["documents"], learned["embeddings"], learned["metadatas"]
+            )
+            if id_.startswith(cls.LEARNED_PREFIX) and id_ not in existing
+        ]
+        if not items:
+            return 0
+
+        ids, docs, embs, metas = zip(*items)
+        target.upsert(
+            ids=list(ids),
+            documents=list(docs),
+            embeddings=[list(emb) for emb in embs],
+            metadatas=list(metas)
+        )
+        return len(items)
+
+    @classmethod
+    async def smoke_test(cls, vs: VectorStore, collection) -> bool:
+        """The shadow collection must answer the standard test query"""
+        query_emb = await EmbeddingService.generate_query_embedding(cls.SMOKE_TEST_QUERY)
+        results = vs.search(collection, query_emb, top_k=1)
+        return bool(results["documents"] and results["documents"][0])
+
+    @classmethod
+    async def rebuild(
+        cls,
+        vs: VectorStore,
+        alias: str = "career_knowledge",
+        progress: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Blue/green full rebuild
+        1. Build every document into a new career_knowledge_v{n} collection
+        2. Copy learned llm_* documents from the live collection
+        3. Smoke-test, then flip the alias (previous version kept for rollback)
+
+        The live collection keeps serving queries until the flip; unchanged texts
+        come from the embedding cache instead of the model.
+        """
+        if progress is None:
+            progress = {}
+
+        live = vs.get_or_create_collection(vs.resolve_alias(alias))
+        shadow_name = vs.next_version_name(alias)
+        progress["collection"] = shadow_name
+        logger.info(f"🟦 Building shadow collection '{shadow_name}' (live: '{live.name}')")
+
+        # Vectors from an older model/backend can never be hit again
+        await EmbeddingCache.prune(await EmbeddingService.resolved_cache_version())
+
+        shadow = vs.get_or_create_collection(shadow_name)
+        try:
+            stats = await cls.sync(vs, shadow, full=True, progress=progress)
+
+            # Copied last so answers learned during the build are not lost
+            progress["stage"] = "copying_learned"
+            stats["copied_learned"] = cls.copy_learned(live, shadow)
+            await run_cpu(cls.refresh_keyword_index, vs, shadow)
+
+            progress["stage"] = "smoke_test"
+            if not await cls.smoke_test(vs, shadow):
+                raise RuntimeError(f"Smoke test failed for '{shadow_name}'")
+        except Exception:
+            vs.delete_collection(shadow_name)
+            raise
+
+        progress["stage"] = "switching"
+        vs.set_alias(alias, shadow_name)
+        vs.drop_old_versions(alias)
+
+        stats.update({
+            "mode": "blue_green",
+            "collection": shadow_name,
+            "previous": live.name,
+            "total": shadow.count()
+        })
+        logger.success(f"🟩 '{alias}' now serves '{shadow_name}'")
+        return stats
@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import select, or_
 from ai_career_advisor.core.database import get_db
 from ai_career_advisor.models.college import College
 from ai_career_advisor.models.career_template import CareerTemplate
@@ -12,19 +12,64 @@ from ai_career_advisor.models.branch import Branch
 from ai_career_advisor.models.degree import Degree
 from ai_career_advisor.models.career_insight import CareerInsight
 from ai_career_advisor.core.logger import logger
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set
+from datetime import datetime, timezone
 
 class KnowledgeLoader:
     """Loads ALL knowledge from database for RAG indexing"""
     
     @staticmethod
-    async def load_colleges() -> List[Dict[str, Any]]:
+    def _render(value: Any) -> str:
+        """Flatten JSON columns (lists/dicts from LLM output) into readable text"""
+        if isinstance(value, dict):
+            return "; ".join(
+                f"{key.replace('_', ' ')}: {KnowledgeLoader._render(item)}"
+                for key, item in value.items() if item
+            )
+        if isinstance(value, list):
+            return ", ".join(KnowledgeLoader._render(item) for item in value if item)
+        return str(value) if value is not None else ""
+    
+    @staticmethod
+    def _sections(title: str, fields: List[tuple]) -> str:
+        """Title + one blank-line separated section per non-empty field (chunker splits on these)"""
+        parts = [title]
+        for label, value in fields:
+            text = KnowledgeLoader._render(value)
+            if text:
+                parts.append(f"{label}: {text}")
+        return "\n\n".join(parts)
+    
+    @staticmethod
+    def _changed_since(query, model, since: Optional[datetime]):
+        """Restrict a query to rows created/updated after the sync watermark"""
+        if since is None:
+            return query
+        return query.where(or_(
+            model.updated_at > KnowledgeLoader._as_column_time(model.updated_at, since),
+            model.created_at > KnowledgeLoader._as_column_time(model.created_at, since)
+        ))
+    
+    @staticmethod
+    def _as_column_time(column, since: datetime) -> datetime:
+        """
+        Match the watermark to the column: asyncpg refuses an aware datetime for
+        `timestamp without time zone` (naive columns hold UTC) and vice versa
+        """
+        if getattr(column.type, "timezone", False):
+            return since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+        return since.astimezone(timezone.utc).replace(tzinfo=None) if since.tzinfo else since
+    
+    @staticmethod
+    async def load_colleges(since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Load college basic info"""
         documents = []
         
         async for db in get_db():
             try:
-                result = await db.execute(select(College))
+                result = await db.execute(
+                    KnowledgeLoader._changed_since(select(College), College, since)
+                )
                 colleges = result.scalars().all()
                 
                 for college in colleges:
@@ -147,14 +192,16 @@ class KnowledgeLoader:
         return documents
     
     @staticmethod
-    async def load_career_templates() -> List[Dict[str, Any]]:
+    async def load_career_templates(since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Load pre-built career templates"""
         documents = []
         
         async for db in get_db():
             try:
                 # Try without is_active filter first
-                result = await db.execute(select(CareerTemplate))
+                result = await db.execute(
+                    KnowledgeLoader._changed_since(select(CareerTemplate), CareerTemplate, since)
+                )
                 templates = result.scalars().all()
                 
                 for template in templates:
@@ -188,18 +235,29 @@ class KnowledgeLoader:
         
         async for db in get_db():
             try:
-                result = await db.execute(select(CareerInsight))
-                insights = result.scalars().all()
+                result = await db.execute(
+                    select(CareerInsight, Career.name).join(Career, Career.id == CareerInsight.career_id)
+                )
                 
-                for insight in insights:
-                    content = "Career insight available"
+                for insight, career_name in result.all():
+                    content = KnowledgeLoader._sections(
+                        f"{career_name} career insight (top 1% preparation)",
+                        [
+                            ("Skills", insight.skills),
+                            ("Internships", insight.internships),
+                            ("Projects", insight.projects),
+                            ("Programs", insight.programs),
+                            ("Top salary", insight.top_salary),
+                        ]
+                    )
                     
                     doc = {
                         "id": f"career_insight_{insight.id}",
                         "content": content,
                         "metadata": {
                             "source": "career_insight",
-                            "type": "top_1_percent"
+                            "type": "top_1_percent",
+                            "career_name": career_name
                         }
                     }
                     documents.append(doc)
@@ -212,13 +270,15 @@ class KnowledgeLoader:
         return documents
     
     @staticmethod
-    async def load_branches() -> List[Dict[str, Any]]:
+    async def load_branches(since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Load branch information"""
         documents = []
         
         async for db in get_db():
             try:
-                result = await db.execute(select(Branch))
+                result = await db.execute(
+                    KnowledgeLoader._changed_since(select(Branch), Branch, since)
+                )
                 branches = result.scalars().all()
                 
                 for branch in branches:
@@ -244,13 +304,15 @@ class KnowledgeLoader:
         return documents
     
     @staticmethod
-    async def load_degrees() -> List[Dict[str, Any]]:
+    async def load_degrees(since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Load degree information"""
         documents = []
         
         async for db in get_db():
             try:
-                result = await db.execute(select(Degree))
+                result = await db.execute(
+                    KnowledgeLoader._changed_since(select(Degree), Degree, since)
+                )
                 degrees = result.scalars().all()
                 
                 for degree in degrees:
@@ -276,13 +338,15 @@ class KnowledgeLoader:
         return documents
     
     @staticmethod
-    async def load_entrance_exams() -> List[Dict[str, Any]]:
+    async def load_entrance_exams(since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Load entrance exam information"""
         documents = []
         
         async for db in get_db():
             try:
-                result = await db.execute(select(EntranceExam))
+                result = await db.execute(
+                    KnowledgeLoader._changed_since(select(EntranceExam), EntranceExam, since)
+                )
                 exams = result.scalars().all()
                 
                 for exam in exams:
@@ -308,25 +372,43 @@ class KnowledgeLoader:
         return documents
     
     @staticmethod
-    async def load_backward_roadmaps() -> List[Dict[str, Any]]:
+    async def load_backward_roadmaps(since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Load backward career roadmaps"""
         documents = []
         
         async for db in get_db():
             try:
-                result = await db.execute(select(BackwardRoadmap))
+                result = await db.execute(
+                    KnowledgeLoader._changed_since(select(BackwardRoadmap), BackwardRoadmap, since)
+                )
                 roadmaps = result.scalars().all()
                 
                 for roadmap in roadmaps:
                     career_name = getattr(roadmap, 'normalized_career', getattr(roadmap, 'career_goal_input', 'Career'))
-                    content = f"{career_name} career roadmap"
+                    content = KnowledgeLoader._sections(
+                        f"{career_name} career roadmap",
+                        [
+                            ("Description", roadmap.career_description),
+                            ("Required education", roadmap.required_education),
+                            ("Entrance exams", roadmap.entrance_exams),
+                            ("Stream recommendation", roadmap.stream_recommendation),
+                            ("Skills required", roadmap.skills_required),
+                            ("Projects to build", roadmap.projects_to_build),
+                            ("Internships", roadmap.internships),
+                            ("Certifications", roadmap.certifications),
+                            ("Top colleges", roadmap.top_colleges),
+                            ("Career prospects", roadmap.career_prospects),
+                            ("Timeline", roadmap.timeline),
+                        ]
+                    )
                     
                     doc = {
                         "id": f"backward_roadmap_{roadmap.id}",
                         "content": content,
                         "metadata": {
                             "source": "backward_roadmap",
-                            "type": "career_roadmap"
+                            "type": "career_roadmap",
+                            "career_name": career_name
                         }
                     }
                     documents.append(doc)
@@ -372,8 +454,14 @@ class KnowledgeLoader:
         return documents
     
     @staticmethod
-    async def load_all() -> List[Dict[str, Any]]:
-        """Load ALL knowledge base documents"""
+    async def load_all(since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Load ALL knowledge base documents
+        
+        Args:
+            since: Sync watermark - tables with updated_at only return rows changed
+                   after it (tables without timestamps are always loaded in full)
+        """
         logger.info("=" * 60)
         logger.info("Loading complete knowledge base...")
         logger.info("=" * 60)
@@ -382,7 +470,7 @@ class KnowledgeLoader:
         
         # Load each category
         logger.info("\n📚 Loading colleges...")
-        colleges = await KnowledgeLoader.load_colleges()
+        colleges = await KnowledgeLoader.load_colleges(since)
         all_docs.extend(colleges)
         
         logger.info("📚 Loading college details...")
@@ -394,7 +482,7 @@ class KnowledgeLoader:
         all_docs.extend(careers)
         
         logger.info("📚 Loading career templates...")
-        templates = await KnowledgeLoader.load_career_templates()
+        templates = await KnowledgeLoader.load_career_templates(since)
         all_docs.extend(templates)
         
         logger.info("📚 Loading career insights...")
@@ -402,19 +490,19 @@ class KnowledgeLoader:
         all_docs.extend(insights)
         
         logger.info("📚 Loading branches...")
-        branches = await KnowledgeLoader.load_branches()
+        branches = await KnowledgeLoader.load_branches(since)
         all_docs.extend(branches)
         
         logger.info("📚 Loading degrees...")
-        degrees = await KnowledgeLoader.load_degrees()
+        degrees = await KnowledgeLoader.load_degrees(since)
         all_docs.extend(degrees)
         
         logger.info("📚 Loading entrance exams...")
-        exams = await KnowledgeLoader.load_entrance_exams()
+        exams = await KnowledgeLoader.load_entrance_exams(since)
         all_docs.extend(exams)
         
         logger.info("📚 Loading backward roadmaps...")
-        backward = await KnowledgeLoader.load_backward_roadmaps()
+        backward = await KnowledgeLoader.load_backward_roadmaps(since)
         all_docs.extend(backward)
         
         logger.info("📚 Loading guided roadmaps...")
@@ -426,3 +514,31 @@ class KnowledgeLoader:
         logger.info("=" * 60)
         
         return all_docs
+    
+    # Document id prefix -> source query (used to detect deleted rows)
+    ID_SOURCES = [
+        ("college_", lambda: select(College.id)),
+        ("college_detail_", lambda: select(CollegeDetails.id)),
+        ("career_", lambda: select(Career.id)),
+        ("career_template_", lambda: select(CareerTemplate.id)),
+        ("career_insight_", lambda: select(CareerInsight.id)),
+        ("branch_", lambda: select(Branch.id)),
+        ("degree_", lambda: select(Degree.id)),
+        ("exam_", lambda: select(EntranceExam.id)),
+        ("backward_roadmap_", lambda: select(BackwardRoadmap.id)),
+        ("guided_roadmap_", lambda: select(Roadmap.id).where(Roadmap.roadmap_type == "guided")),
+    ]
+    
+    @staticmethod
+    async def load_all_ids() -> Set[str]:
+        """
+        Ids of every document the database can currently produce
+        Raises on DB errors so a failed read never deletes the whole index
+        """
+        ids: Set[str] = set()
+        async for db in get_db():
+            for prefix, build_query in KnowledgeLoader.ID_SOURCES:
+                result = await db.execute(build_query())
+                ids.update(f"{prefix}{row_id}" for row_id in result.scalars().all())
+            break
+        return ids
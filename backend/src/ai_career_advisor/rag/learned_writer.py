@@ -0,0 +1,285 @@
+"""
+Write-behind Queue for Learned RAG Documents
+Web-search answers the chatbot wants to remember are queued and written later
+in batches, so the user's response never waits on embedding or Chroma:
+quality gate -> embed -> dedup by similarity -> one add() per batch -> LRU/TTL eviction
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.executors import run_cpu, run_io
+from ai_career_advisor.core.logger import logger
+from ai_career_advisor.RAG.bm25_index import KeywordIndexRegistry
+from ai_career_advisor.RAG.chunking import DocumentChunker, parent_id_of
+from ai_career_advisor.RAG.embeddings import EmbeddingService
+
+
+class LearnedDocWriter:
+    """
+    Async write-behind queue for llm_* documents
+    - enqueue() is synchronous and never blocks: rejected answers (too short,
+      apologies/errors) and overflow beyond LEARNED_DOCS_QUEUE_SIZE are dropped
+    - The worker waits LEARNED_DOCS_FLUSH_SECONDS to collect a batch, embeds it once
+      and skips answers too similar to a document already stored (or earlier in
+      the batch); a near-duplicate of a learned document refreshes that document
+    - After each batch, learned documents past LEARNED_DOCS_TTL_DAYS or beyond
+      LEARNED_DOCS_MAX (least recently retrieved first) are deleted
+    """
+
+    SOURCE = "llm_generated"
+    ID_PREFIX = "llm_"
+
+    # Answers that only say "no answer" are not knowledge
+    REJECT_MARKERS = (
+        "i apologize",
+        "technical difficulties",
+        "i cannot generate",
+        "i don't have enough information",
+        "unable to find",
+    )
+
+    _queue: Optional[asyncio.Queue] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _worker: Optional[asyncio.Task] = None
+
+    # parent id -> last time it was retrieved (persisted as last_used on eviction)
+    _touched: Dict[str, float] = {}
+
+    _stats: Dict[str, int] = {
+        "enqueued": 0, "rejected_quality": 0, "dropped_queue_full": 0,
+        "duplicates": 0, "written": 0, "batches": 0,
+        "evicted_ttl": 0, "evicted_lru": 0, "errors": 0
+    }
+
+    @classmethod
+    def _rejection_reason(cls, response: str) -> Optional[str]:
+        text = (response or "").strip()
+        if len(text) < settings.LEARNED_DOCS_MIN_CHARS:
+            return "too short"
+        lowered = text.lower()
+        for marker in cls.REJECT_MARKERS:
+            if marker in lowered:
+                return f"fallback answer ({marker})"
+        return None
+
+    @classmethod
+    def _ensure_queue(cls) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if cls._queue is None or cls._loop is not loop:
+            cls._queue = asyncio.Queue()
+            cls._loop = loop
+            cls._worker = None
+        return cls._queue
+
+    @classmethod
+    def enqueue(cls, query: str, response: str, metadata: Dict[str, Any] = None) -> bool:
+        """Queue an answer for the knowledge base (returns immediately)"""
+        if not settings.LEARNED_DOCS_ENABLED:
+            return False
+
+        reason = cls._rejection_reason(response)
+        if reason:
+            cls._stats["rejected_quality"] += 1
+            logger.debug(f"Not learning answer for '{query[:50]}': {reason}")
+            return False
+
+        queue = cls._ensure_queue()
+        if queue.qsize() >= settings.LEARNED_DOCS_QUEUE_SIZE:
+            cls._stats["dropped_queue_full"] += 1
+            logger.warning("⚠️ Learned-doc queue full, dropping answer")
+            return False
+
+        queue.put_nowait((query, response, dict(metadata or {})))
+        cls._stats["enqueued"] += 1
+        if cls._worker is None:
+            cls._worker = cls._loop.create_task(cls._run())
+        return True
+
+    @classmethod
+    def touch(cls, doc_ids: List[str]):
+        """Mark learned documents as used by a retrieval (drives LRU eviction)"""
+        now = time.time()
+        for doc_id in doc_ids:
+            if doc_id and doc_id.startswith(cls.ID_PREFIX):
+                cls._touched[parent_id_of(doc_id)] = now
+
+    @classmethod
+    async def _run(cls):
+        queue = cls._queue
+        while True:
+            if queue.empty():
+                # No await between the check and the reset: the next enqueue restarts us
+                cls._worker = None
+                return
+
+            await asyncio.sleep(settings.LEARNED_DOCS_FLUSH_SECONDS)
+            batch = []
+            while not queue.empty() and len(batch) < settings.LEARNED_DOCS_BATCH_SIZE:
+                batch.append(queue.get_nowait())
+
+            try:
+                await cls._write_batch(batch)
+                await cls.evict()
+            except Exception as e:
+                cls._stats["errors"] += 1
+                logger.error(f"❌ Learned-doc batch failed ({len(batch)} answers): {e}")
+
+    @staticmethod
+    def _cosine(a: List[float], b: List[float]) -> float:
+        # Embeddings are L2-normalized
+        return sum(x * y for x, y in zip(a, b))
+
+    @classmethod
+    async def _write_batch(cls, batch: List[Tuple[str, str, Dict[str, Any]]]):
+        from ai_career_advisor.RAG.retriever import retriever
+
+        now = time.time()
+        documents = []
+        for query, response, metadata in batch:
+            # Chroma metadata values must be scalars
+            metadata = {k: v for k, v in metadata.items() if isinstance(v, (str, int, float, bool))}
+            documents.append({
+                "id": f"{cls.ID_PREFIX}{uuid.uuid4()}",
+                "content": response.strip(),
+                "metadata": {
+                    **metadata,
+                    "origin": metadata.get("source", "unknown"),
+                    "source": cls.SOURCE,
+                    "original_query": query,
+                    "created_at": now,
+                    "last_used": now
+                }
+            })
+
+        chunks = await run_cpu(DocumentChunker.chunk_documents, documents)
+        if not chunks:
+            return
+        embeddings = await EmbeddingService.generate_batch_embeddings([c["content"] for c in chunks])
+
+        # Each answer is compared by its first chunk
+        firsts = {
+            chunk["metadata"]["parent_id"]: embedding
+            for chunk, embedding in zip(chunks, embeddings)
+            if chunk["metadata"]["chunk_index"] == 0
+        }
+        parents = list(firsts)
+
+        collection = retriever.collection
+        nearest = await run_io(
+            collection.query,
+            query_embeddings=[firsts[p] for p in parents],
+            n_results=1,
+            include=["distances"]
+        ) if collection.count() else {"ids": [[] for _ in parents], "distances": [[] for _ in parents]}
+
+        keep = set()
+        accepted: List[List[float]] = []
+        for parent, ids, distances in zip(parents, nearest["ids"], nearest["distances"]):
+            # Squared L2 between unit vectors = 2 - 2 * cosine
+            if ids and 1 - distances[0] / 2 >= settings.LEARNED_DOCS_DEDUP_THRESHOLD:
+                cls._stats["duplicates"] += 1
+                cls.touch(ids)
+                continue
+            if any(cls._cosine(firsts[parent], other) >= settings.LEARNED_DOCS_DEDUP_THRESHOLD for other in accepted):
+                cls._stats["duplicates"] += 1
+                continue
+            keep.add(parent)
+            accepted.append(firsts[parent])
+
+        kept = [(c, e) for c, e in zip(chunks, embeddings) if c["metadata"]["parent_id"] in keep]
+        if not kept:
+            return
+
+        await run_io(
+            collection.add,
+            ids=[c["id"] for c, _ in kept],
+            embeddings=[e for _, e in kept],
+            documents=[c["content"] for c, _ in kept],
+            metadatas=[c["metadata"] for c, _ in kept]
+        )
+        persist_directory = retriever.vector_store.persist_directory
+        index = KeywordIndexRegistry.get(persist_directory, collection)
+        index.upsert((c["id"], c["content"], cls.SOURCE) for c, _ in kept)
+        await run_cpu(KeywordIndexRegistry.save, persist_directory, collection.name, index)
+
+        cls._stats["written"] += len(keep)
+        cls._stats["batches"] += 1
+        logger.success(f"💾 Learned {len(keep)}/{len(batch)} answers ({len(kept)} chunks)")
+
+    @classmethod
+    async def evict(cls) -> Dict[str, int]:
+        """Delete expired learned documents, then the least recently used beyond the cap"""
+        from ai_career_advisor.RAG.retriever import retriever
+
+        collection = retriever.collection
+        stored = await run_io(collection.get, where={"source": cls.SOURCE}, include=["metadatas"])
+
+        now = time.time()
+        parents: Dict[str, Dict[str, Any]] = {}
+        for doc_id, metadata in zip(stored["ids"], stored["metadatas"]):
+            if not doc_id.startswith(cls.ID_PREFIX):
+                continue
+            metadata = metadata or {}
+            parent = parents.setdefault(parent_id_of(doc_id), {
+                "chunks": [],
+                "created_at": metadata.get("created_at", metadata.get("timestamp", now)),
+                "last_used": metadata.get("last_used", metadata.get("timestamp", now))
+            })
+            parent["chunks"].append((doc_id, metadata))
+
+        ttl_seconds = settings.LEARNED_DOCS_TTL_DAYS * 86400
+        expired = [p for p, info in parents.items() if now - info["created_at"] > ttl_seconds]
+        expired_set = set(expired)
+        alive = sorted(
+            (p for p in parents if p not in expired_set),
+            key=lambda p: max(parents[p]["last_used"], cls._touched.get(p, 0.0))
+        )
+        over_cap = alive[:max(0, len(alive) - settings.LEARNED_DOCS_MAX)]
+
+        doomed = [doc_id for p in expired + over_cap for doc_id, _ in parents[p]["chunks"]]
+        if doomed:
+            await run_io(collection.delete, ids=doomed)
+            persist_directory = retriever.vector_store.persist_directory
+            index = KeywordIndexRegistry.get(persist_directory, collection)
+            index.remove(doomed)
+            await run_cpu(KeywordIndexRegistry.save, persist_directory, collection.name, index)
+            logger.info(f"🧹 Evicted {len(expired)} expired + {len(over_cap)} LRU learned documents")
+
+        # Persist retrieval times so LRU order survives restarts
+        removed = set(expired + over_cap)
+        touched = [
+            (doc_id, {**metadata, "last_used": cls._touched[p]})
+            for p in cls._touched if p in parents and p not in removed
+            for doc_id, metadata in parents[p]["chunks"]
+        ]
+        if touched:
+            await run_io(collection.update, ids=[t[0] for t in touched], metadatas=[t[1] for t in touched])
+        cls._touched.clear()
+
+        cls._stats["evicted_ttl"] += len(expired)
+        cls._stats["evicted_lru"] += len(over_cap)
+        return {"expired": len(expired), "lru": len(over_cap), "learned": len(parents) - len(removed)}
+
+    @classmethod
+    async def flush(cls, timeout: float = 30.0):
+        """Wait for queued answers to be written (called on shutdown)"""
+        if cls._worker is not None and not cls._worker.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(cls._worker), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"⚠️ Learned-doc queue not drained on shutdown ({cls._queue.qsize()} left)")
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        return {
+            "enabled": settings.LEARNED_DOCS_ENABLED,
+            "queued": cls._queue.qsize() if cls._queue else 0,
+            "max_learned_docs": settings.LEARNED_DOCS_MAX,
+            "ttl_days": settings.LEARNED_DOCS_TTL_DAYS,
+            "dedup_threshold": settings.LEARNED_DOCS_DEDUP_THRESHOLD,
+            **cls._stats
+        }
@@ -0,0 +1,166 @@
+"""
+ONNX Runtime Embedding Backend
+Exports the sentence-transformers checkpoint to ONNX (optionally int8 dynamic
+quantization) and reproduces its pipeline on CPU:
+tokenizer (same vocab/truncation) -> transformer -> mean pooling -> L2 normalize
+"""
+
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+
+from ai_career_advisor.core.logger import logger
+
+
+class OnnxEmbedder:
+    """
+    Drop-in replacement for SentenceTransformer.encode() on CPU
+    encode() returns a float32 numpy array, so callers can keep using .tolist()
+    """
+
+    FP32_FILE = "model.onnx"
+    INT8_FILE = "model.int8.onnx"
+
+    def __init__(
+        self,
+        model_dir: Union[str, Path],
+        quantized: bool = True,
+        max_seq_length: int = 256,
+        intra_op_threads: int = 0
+    ):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        self.model_dir = Path(model_dir)
+        self.max_seq_length = max_seq_length
+        self.model_path = self.model_dir / (self.INT8_FILE if quantized else self.FP32_FILE)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+
+        self.session = ort.InferenceSession(
+            str(self.model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(str(self.model_dir))
+        self._input_names = {i.name for i in self.session.get_inputs()}
+        logger.success(f"✅ ONNX embedder loaded: {self.model_path.name}")
+
+    @staticmethod
+    def is_exported(model_dir: Union[str, Path], quantized: bool = True) -> bool:
+        filename = OnnxEmbedder.INT8_FILE if quantized else OnnxEmbedder.FP32_FILE
+        return (Path(model_dir) / filename).exists()
+
+    @staticmethod
+    def export(
+        model_name: str,
+        model_dir: Union[str, Path],
+        quantize: bool = True,
+        max_seq_length: int = 256
+    ) -> Path:
+        """
+        Export the transformer of a sentence-transformers model to ONNX
+        (pooling/normalization stay in numpy) and save its tokenizer alongside
+        """
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        model_dir = Path(model_dir)
+        os.makedirs(model_dir, exist_ok=True)
+
+        logger.info(f"📦 Exporting {model_name} to ONNX at {model_dir}")
+        st_model = SentenceTransformer(model_name, device="cpu")
+        transformer = st_model[0].auto_model.eval()
+        tokenizer = st_model.tokenizer
+        tokenizer.save_pretrained(str(model_dir))
+
+        sample = tokenizer(
+            ["sample text for export"],
+            padding=True,
+            truncation=True,
+            max_length=max_seq_length,
+            return_tensors="pt"
+        )
+        input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+        fp32_path = model_dir / OnnxEmbedder.FP32_FILE
+        with torch.no_grad():
+            torch.onnx.export(
+                transformer,
+                tuple(sample[name] for name in input_names),
+                str(fp32_path),
+                input_names=input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=17,
+                do_constant_folding=True,
+                # TorchScript exporter (the dynamo exporter needs onnxscript)
+                dynamo=False
+            )
+        logger.success(f"✅ Exported {fp32_path.name}")
+
+        if quantize:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            int8_path = model_dir / OnnxEmbedder.INT8_FILE
+            quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+            logger.success(f"✅ Quantized {int8_path.name} (int8 dynamic)")
+
+        return model_dir
+
+    def encode(self, sentences: Union[str, List[str]], batch_size: int = 32, **_) -> np.ndarray:
+        """Normalized mean-pooled embeddings (same output as all-MiniLM-L6-v2)"""
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            feeds = {
+                name: encoded[name].astype(np.int64)
+                for name in ("input_ids", "attention_mask", "token_type_ids")
+                if name in self._input_names and name in encoded
+            }
+            token_embeddings = self.session.run(None, feeds)[0]
+
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+            batches.append(pooled / np.clip(norms, 1e-12, None))
+
+        embeddings = np.concatenate(batches).astype(np.float32) if batches else np.zeros((0, 0), np.float32)
+        return embeddings[0] if single else embeddings
+
+
+def check_parity(
+    reference,
+    candidate,
+    texts: List[str],
+    min_cosine: float = 0.99
+) -> Optional[float]:
+    """
+    Compare candidate vectors against the PyTorch reference
+    Returns the minimum cosine similarity, or None if it is below min_cosine
+    """
+    ref = np.asarray(reference.encode(texts, normalize_embeddings=True), dtype=np.float32)
+    cand = np.asarray(candidate.encode(texts), dtype=np.float32)
+    ref /= np.clip(np.linalg.norm(ref, axis=1, keepdims=True), 1e-12, None)
+    cand /= np.clip(np.linalg.norm(cand, axis=1, keepdims=True), 1e-12, None)
+
+    worst = float((ref * cand).sum(axis=1).min())
+    if worst < min_cosine:
+        logger.error(f"❌ ONNX parity check failed: min cosine {worst:.4f} < {min_cosine}")
+        return None
+    logger.success(f"✅ ONNX parity check passed: min cosine {worst:.4f}")
+    return worst
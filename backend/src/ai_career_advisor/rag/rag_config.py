@@ -0,0 +1,39 @@
+"""
+RAG Configuration
+Loads configs/rag.yaml (override the path with RAG_CONFIG_PATH)
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+DEFAULT_RAG_CONFIG = REPO_ROOT / "configs" / "rag.yaml"
+
+
+@lru_cache(maxsize=1)
+def get_rag_config() -> Dict[str, Any]:
+    """Parsed rag.yaml ({} when missing or empty)"""
+    path = Path(settings.RAG_CONFIG_PATH) if settings.RAG_CONFIG_PATH else DEFAULT_RAG_CONFIG
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        logger.warning(f"⚠️ RAG config not found at {path}, using defaults")
+        return {}
+
+
+def get_embedding_config() -> Dict[str, Any]:
+    return get_rag_config().get("embeddings") or {}
+
+
+def resolve_repo_path(path: str) -> Path:
+    """Config paths are relative to the repository root"""
+    candidate = Path(path)
+    return candidate if candidate.is_absolute() else REPO_ROOT / candidate
@@ -1,76 +1,214 @@
 from ai_career_advisor.RAG.vector_store import VectorStore
 from ai_career_advisor.RAG.embeddings import EmbeddingService
+from ai_career_advisor.RAG.chunking import DocumentChunker
+from ai_career_advisor.RAG.bm25_index import KeywordIndexRegistry
+from ai_career_advisor.RAG.learned_writer import LearnedDocWriter
+from ai_career_advisor.RAG.rag_config import get_rag_config
+from ai_career_advisor.core.executors import run_cpu, run_io
 from ai_career_advisor.core.logger import logger
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import asyncio
 
 
 class RAGRetriever:
     
+    # Alias flipped by blue/green reindexing (see KnowledgeIndexSync.rebuild)
+    ALIAS = "career_knowledge"
+    
     def __init__(self):
         self.vector_store = VectorStore()
-        self.collection = self.vector_store.get_or_create_collection("career_knowledge")
+        self._collection = None
+        self._collection_name = None
+    
+    @property
+    def collection(self):
+        """
+        Collection the alias currently points to (re-resolved after a switch)
+        resolve_alias() only stats the alias file; it is parsed again only when it changes
+        """
+        name = self.vector_store.resolve_alias(self.ALIAS)
+        if self._collection is None or name != self._collection_name:
+            self._collection = self.vector_store.get_or_create_collection(name)
+            self._collection_name = name
+        return self._collection
+    
+    @staticmethod
+    def _retrieval_config() -> Dict[str, Any]:
+        config = get_rag_config().get("retrieval") or {}
+        return {
+            "mode": (config.get("mode") or "hybrid").lower(),
+            "rrf_k": config.get("rrf_k", 60),
+            "candidates": config.get("candidates", 20),
+        }
+    
+    @staticmethod
+    def get_route(intent: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retrieval route for an intent (retrieval.routes in configs/rag.yaml)
+        Unknown intents use the "default" route (all sources)
+        """
+        routes = (get_rag_config().get("retrieval") or {}).get("routes") or {}
+        default = routes.get("default") or {}
+        name = intent if intent in routes else "default"
+        route = routes.get(name) or {}
+        return {
+            "name": name,
+            "sources": route.get("sources") or None,
+            "top_k": route.get("top_k", default.get("top_k", 5)),
+            "min_score": route.get("min_score", default.get("min_score", 0.3)),
+            "fallback": route.get("fallback_to_all", True),
+        }
     
-    async def search(self, query: str, top_k: int = 5) -> Dict[str, Any]:
+    @staticmethod
+    def _source_filter(sources: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        if not sources:
+            return None
+        if len(sources) == 1:
+            return {"source": sources[0]}
+        return {"source": {"$in": list(sources)}}
+    
+    def _keyword_search(
+        self, collection, query: str, limit: int, sources: Optional[List[str]] = None
+    ) -> List[str]:
+        index = KeywordIndexRegistry.get(self.vector_store.persist_directory, collection)
+        return [doc_id for doc_id, _ in index.search(query, top_k=limit, sources=sources)]
+    
+    @staticmethod
+    def _empty_result() -> Dict[str, Any]:
+        return {
+            "found": False,
+            "ids": [],
+            "documents": [],
+            "metadatas": [],
+            "scores": []
+        }
+    
+    async def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        mode: Optional[str] = None,
+        sources: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve documents for a query
+        
+        Args:
+            mode: "dense" (Chroma only), "bm25" (keyword only) or "hybrid"
+                  (both in parallel, fused with reciprocal-rank fusion);
+                  defaults to retrieval.mode in configs/rag.yaml
+            sources: Only search documents whose metadata "source" is listed
+        
+        scores stay similarity-like (1 - L2 distance) so thresholds and
+        confidence work the same in every mode; ordering follows the fusion.
+        """
+        config = self._retrieval_config()
+        mode = (mode or config["mode"]).lower()
         try:
-            logger.info(f"RAG search for: {query}")
+            logger.info(f"RAG search ({mode}{', ' + '/'.join(sources) if sources else ''}) for: {query}")
+            collection = self.collection
+            limit = max(top_k, config["candidates"]) if mode == "hybrid" else top_k
             
             query_embedding = await EmbeddingService.generate_query_embedding(query)
             
-            results = self.vector_store.search(
-                collection=self.collection,
-                query_embedding=query_embedding,
-                top_k=top_k
-            )
+            async def dense() -> Dict[str, Any]:
+                if mode == "bm25":
+                    return {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
+                return await run_io(
+                    self.vector_store.search,
+                    collection=collection,
+                    query_embedding=query_embedding,
+                    top_k=limit,
+                    filter_metadata=self._source_filter(sources)
+                )
             
-            if not results['documents'][0]:
-                logger.warning("No results found in RAG")
-                return {
-                    "found": False,
-                    "documents": [],
-                    "metadatas": [],
-                    "scores": []
-                }
+            async def keyword() -> List[str]:
+                if mode == "dense":
+                    return []
+                return await run_cpu(self._keyword_search, collection, query, limit, sources)
             
-            documents = results['documents'][0]
-            metadatas = results['metadatas'][0]
-            distances = results['distances'][0]
+            dense_results, keyword_ids = await asyncio.gather(dense(), keyword())
             
-            scores = [1 - dist for dist in distances]
+            hits: Dict[str, Dict[str, Any]] = {}
+            for doc_id, doc, metadata, dist in zip(
+                dense_results['ids'][0],
+                dense_results['documents'][0],
+                dense_results['metadatas'][0],
+                dense_results['distances'][0]
+            ):
+                hits[doc_id] = {"document": doc, "metadata": metadata, "score": 1 - dist}
             
-            logger.success(f"Found {len(documents)} relevant documents")
+            # Reciprocal-rank fusion over both ranked lists
+            fused: Dict[str, float] = {}
+            for ranking in (dense_results['ids'][0], keyword_ids):
+                for rank, doc_id in enumerate(ranking):
+                    fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (config["rrf_k"] + rank + 1)
+            
+            ranked = sorted(fused, key=fused.get, reverse=True)[:top_k]
+            
+            # Keyword-only hits: fetch text/metadata and score them like dense hits
+            missing = [doc_id for doc_id in ranked if doc_id not in hits]
+            if missing:
+                fetched = collection.get(ids=missing, include=["documents", "metadatas", "embeddings"])
+                for doc_id, doc, metadata, embedding in zip(
+                    fetched["ids"], fetched["documents"], fetched["metadatas"], fetched["embeddings"]
+                ):
+                    dist = sum((q - e) ** 2 for q, e in zip(query_embedding, embedding))
+                    hits[doc_id] = {"document": doc, "metadata": metadata, "score": 1 - dist}
+            
+            ranked = [doc_id for doc_id in ranked if doc_id in hits]
+            if not ranked:
+                logger.warning("No results found in RAG")
+                return self._empty_result()
+            
+            logger.success(f"Found {len(ranked)} relevant documents ({len(keyword_ids)} keyword candidates)")
             
             return {
                 "found": True,
-                "documents": documents,
-                "metadatas": metadatas,
-                "scores": scores
+                "ids": ranked,
+                "documents": [hits[doc_id]["document"] for doc_id in ranked],
+                "metadatas": [hits[doc_id]["metadata"] for doc_id in ranked],
+                "scores": [hits[doc_id]["score"] for doc_id in ranked],
+                "rrf_scores": [round(fused[doc_id], 5) for doc_id in ranked],
+                "mode": mode
             }
         
         except Exception as e:
             logger.error(f"RAG search error: {str(e)}")
-            return {
-                "found": False,
-                "documents": [],
-                "metadatas": [],
-                "scores": []
-            }
+            return self._empty_result()
     
-    def build_context(self, search_results: Dict[str, Any], max_length: int = 2000) -> str:
+    def build_context(
+        self,
+        search_results: Dict[str, Any],
+        max_length: int = 2000,
+        min_score: float = 0.3
+    ) -> str:
         if not search_results["found"]:
             return ""
         
-        context_parts = []
-        current_length = 0
-        
-        for doc, metadata, score in zip(
+        # Collapse chunks back to their parent document (best score first,
+        # sibling chunks in document order)
+        parents: Dict[str, Dict[str, Any]] = {}
+        for doc_id, doc, metadata, score in zip(
+            search_results.get("ids") or [None] * len(search_results["documents"]),
             search_results["documents"],
             search_results["metadatas"],
             search_results["scores"]
         ):
-            if score < 0.3:
+            if score < min_score:
                 continue
             
-            source_type = metadata.get("source", "unknown")
+            parent_id = metadata.get("parent_id") or doc_id or doc
+            parent = parents.setdefault(parent_id, {"score": score, "metadata": metadata, "chunks": {}})
+            parent["score"] = max(parent["score"], score)
+            parent["chunks"].setdefault(metadata.get("chunk_index", 0), doc)
+        
+        context_parts = []
+        current_length = 0
+        
+        for parent in sorted(parents.values(), key=lambda p: p["score"], reverse=True):
+            source_type = parent["metadata"].get("source", "unknown")
+            doc = " ... ".join(text for _, text in sorted(parent["chunks"].items()))
             doc_text = f"[Source: {source_type}] {doc}"
             
             if current_length + len(doc_text) > max_length:
@@ -85,13 +223,34 @@ class RAGRetriever:
         
         return context
     
-    async def search_and_build_context(self, query: str, top_k: int = 5) -> Dict[str, Any]:
-        search_results = await self.search(query, top_k)
-        context = self.build_context(search_results)
+    async def search_and_build_context(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        intent: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Search the sources routed for this intent (college_query -> colleges,
+        exam_query -> entrance exams, ...) with the route's top_k / min_score;
+        falls back to the whole collection when the route finds nothing relevant
+        """
+        route = self.get_route(intent)
+        search_results = await self.search(query, top_k or route["top_k"], sources=route["sources"])
+        context = self.build_context(search_results, min_score=route["min_score"])
+        
+        if not context and route["sources"] and route["fallback"]:
+            logger.info(f"Route '{route['name']}' found nothing relevant, searching all sources")
+            route = self.get_route(None)
+            search_results = await self.search(query, top_k or route["top_k"])
+            context = self.build_context(search_results, min_score=route["min_score"])
+        
+        # Retrieved learned answers stay in the knowledge base longer (LRU)
+        LearnedDocWriter.touch(search_results["ids"])
         
         return {
             "context": context,
-            "found": search_results["found"],
+            "found": search_results["found"] and bool(context),
+            "route": route["name"],
             "num_documents": len(search_results["documents"]),
             "sources": [m.get("source", "unknown") for m in search_results["metadatas"]],
             "scores": search_results["scores"]
@@ -111,9 +270,6 @@ class RAGRetriever:
             logger.info(f"Saving to RAG: {query[:50]}...")
             
             
-            response_embedding = await EmbeddingService.generate_query_embedding(response)
-            
-            
             if metadata is None:
                 metadata = {}
             
@@ -125,11 +281,22 @@ class RAGRetriever:
             import uuid
             doc_id = f"llm_{str(uuid.uuid4())}"
             
-            self.collection.add(
-                ids=[doc_id],
-                embeddings=[response_embedding],
-                documents=[response],
-                metadatas=[metadata]
+            # Long answers are stored as chunks so every part stays retrievable
+            chunks = await run_cpu(
+                DocumentChunker.chunk_documents,
+                [{"id": doc_id, "content": response, "metadata": metadata}]
+            )
+            embeddings = await EmbeddingService.generate_batch_embeddings([c["content"] for c in chunks])
+            
+            collection = self.collection
+            collection.add(
+                ids=[c["id"] for c in chunks],
+                embeddings=embeddings,
+                documents=[c["content"] for c in chunks],
+                metadatas=[c["metadata"] for c in chunks]
+            )
+            KeywordIndexRegistry.get(self.vector_store.persist_directory, collection).upsert(
+                (c["id"], c["content"], c["metadata"]["source"]) for c in chunks
             )
             
             logger.success(f"Saved to RAG with ID: {doc_id}")
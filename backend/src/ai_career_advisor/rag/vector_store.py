@@ -1,8 +1,12 @@
 import chromadb
 from chromadb.config import Settings
+from ai_career_advisor.RAG.bm25_index import KeywordIndexRegistry
 from ai_career_advisor.core.logger import logger
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime
+import json
 import os
+import re
 
 class VectorStore:
     """
@@ -30,6 +34,11 @@ class VectorStore:
             )
         )
         
+        # Alias -> versioned collection pointer (blue/green reindexing)
+        self.alias_file = os.path.join(self.persist_directory, "collection_aliases.json")
+        # (file identity, parsed aliases): re-parsed only when the file changes
+        self._alias_cache: Optional[Tuple[Tuple[int, int, int], Dict[str, Dict[str, Any]]]] = None
+        
         logger.info(f"ChromaDB initialized at: {self.persist_directory}")
     
     def get_or_create_collection(self, collection_name: str = "career_knowledge"):
@@ -103,6 +112,47 @@ class VectorStore:
             logger.error(f"Error adding documents: {str(e)}")
             raise
     
+    def upsert_documents(
+        self,
+        collection,
+        documents: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str]
+    ):
+        """Insert new documents or overwrite existing ids (incremental sync)"""
+        valid_items = [
+            (doc, emb, meta, id_)
+            for doc, emb, meta, id_ in zip(documents, embeddings, metadatas, ids)
+            if emb is not None
+        ]
+        
+        if not valid_items:
+            return
+        
+        docs, embs, metas, ids_ = zip(*valid_items)
+        collection.upsert(
+            documents=list(docs),
+            embeddings=list(embs),
+            metadatas=list(metas),
+            ids=list(ids_)
+        )
+        logger.success(f"Upserted {len(docs)} documents")
+    
+    def delete_documents(self, collection, ids: List[str]):
+        """Delete documents by id"""
+        if ids:
+            collection.delete(ids=ids)
+            logger.info(f"Deleted {len(ids)} documents")
+    
+    def get_content_hashes(self, collection) -> Dict[str, Optional[str]]:
+        """Map of every stored id -> metadata["content_hash"] (None for unhashed docs)"""
+        stored = collection.get(include=["metadatas"])
+        return {
+            id_: (meta or {}).get("content_hash")
+            for id_, meta in zip(stored["ids"], stored["metadatas"])
+        }
+    
     def search(
         self,
         collection,
@@ -140,10 +190,131 @@ class VectorStore:
         """Delete entire collection (use with caution!)"""
         try:
             self.client.delete_collection(name=collection_name)
+            KeywordIndexRegistry.drop(self.persist_directory, collection_name)
             logger.warning(f"Collection '{collection_name}' deleted")
         except Exception as e:
             logger.error(f"Delete error: {str(e)}")
     
+    # =============================
+    # ALIASES (blue/green collections)
+    # =============================
+    
+    def _read_aliases(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.alias_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    def _alias_file_key(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.alias_file)
+        except FileNotFoundError:
+            return None
+        # os.replace() gives the file a new inode, so this catches same-tick rewrites too
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    def _cached_aliases(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aliases for readers (resolved on every query): the file is parsed again only
+        after set_alias()/rollback_alias() or when another process rewrote it
+        """
+        key = self._alias_file_key()
+        if key is None:
+            return {}
+        if self._alias_cache is None or self._alias_cache[0] != key:
+            self._alias_cache = (key, self._read_aliases())
+        return self._alias_cache[1]
+    
+    def _write_aliases(self, aliases: Dict[str, Dict[str, Any]]):
+        # Temp file + os.replace, so readers never see a partial file
+        tmp_path = f"{self.alias_file}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(aliases, f, indent=2)
+        os.replace(tmp_path, self.alias_file)
+        self._alias_cache = None
+    
+    def get_alias_info(self, alias: str = "career_knowledge") -> Dict[str, Any]:
+        """{"current": ..., "previous": ..., "switched_at": ...} (empty if never switched)"""
+        return dict(self._cached_aliases().get(alias, {}))
+    
+    def resolve_alias(self, alias: str = "career_knowledge") -> str:
+        """
+        Collection name the alias points to
+        Falls back to the alias itself (pre-versioning single collection)
+        """
+        return self.get_alias_info(alias).get("current") or alias
+    
+    def set_alias(self, alias: str, collection_name: str):
+        """
+        Atomically point alias at collection_name, keeping the old target as previous
+        """
+        aliases = self._read_aliases()
+        info = aliases.get(alias, {})
+        current = self.resolve_alias(alias)
+        previous = current if current != collection_name else info.get("previous")
+        
+        # Targets pushed out of the rollback window, deleted by drop_old_versions()
+        retired = [
+            name for name in info.get("retired", []) + [info.get("previous")]
+            if name and name not in (collection_name, previous)
+        ]
+        aliases[alias] = {
+            "current": collection_name,
+            "previous": previous,
+            "retired": list(dict.fromkeys(retired)),
+            "switched_at": datetime.now().isoformat()
+        }
+        
+        self._write_aliases(aliases)
+        logger.success(f"Alias '{alias}' → '{collection_name}'")
+    
+    def rollback_alias(self, alias: str = "career_knowledge") -> Optional[str]:
+        """Point alias back at its previous collection (returns it, or None)"""
+        previous = self.get_alias_info(alias).get("previous")
+        if not previous:
+            logger.warning(f"No previous collection to roll back '{alias}' to")
+            return None
+        self.set_alias(alias, previous)
+        return previous
+    
+    def _collection_names(self) -> List[str]:
+        # chromadb < 0.6 returns Collection objects, newer versions return names
+        return [getattr(collection, "name", collection) for collection in self.client.list_collections()]
+    
+    def list_versions(self, alias: str = "career_knowledge") -> List[str]:
+        """Versioned collections for an alias, oldest first"""
+        pattern = re.compile(rf"^{re.escape(alias)}_v(\d+)$")
+        names = [name for name in self._collection_names() if pattern.match(name)]
+        return sorted(names, key=lambda n: int(pattern.match(n).group(1)))
+    
+    def next_version_name(self, alias: str = "career_knowledge") -> str:
+        versions = self.list_versions(alias)
+        last = int(versions[-1].rsplit("_v", 1)[1]) if versions else 0
+        return f"{alias}_v{last + 1}"
+    
+    def drop_old_versions(self, alias: str = "career_knowledge"):
+        """
+        Delete old targets of the alias other than the current and previous ones:
+        versioned collections, retired targets with other names, and the original
+        unversioned collection once it has left the rollback window
+        """
+        info = self.get_alias_info(alias)
+        if not info:
+            return
+        keep = {info.get("current"), info.get("previous")}
+        existing = set(self._collection_names())
+        candidates = self.list_versions(alias) + info.get("retired", []) + [alias]
+        
+        for name in dict.fromkeys(candidates):
+            if name not in keep and name in existing:
+                self.delete_collection(name)
+        
+        if info.get("retired"):
+            aliases = self._read_aliases()
+            aliases[alias] = {k: v for k, v in aliases[alias].items() if k != "retired"}
+            self._write_aliases(aliases)
+    
     def reset_database(self):
         """Reset entire database (use with caution!)"""
         self.client.reset()
@@ -0,0 +1,193 @@
+"""
+Semantic Answer Cache
+Final chatbot answers keyed by query embedding: a near-duplicate question
+("fees of IIT Bombay" / "IIT Bombay fee structure") in the same language is
+served from memory instead of running RAG + an LLM call again
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.logger import logger
+
+
+@dataclass
+class AnswerEntry:
+    query: str
+    partition: str
+    response: str
+    sources: List[str]
+    confidence: float
+    response_type: str
+    generation_time: float
+    expires_at: float
+    hits: int = 0
+    created_at: float = field(default_factory=time.time)
+
+
+class SemanticAnswerCache:
+    """
+    In-process cache of (normalized query embedding -> final answer)
+    - Lookup: cosine similarity against every live entry (one matrix product),
+      best match above SEMANTIC_CACHE_THRESHOLD with the same language/model wins
+    - Web-search answers expire sooner than knowledge-base answers
+    - invalidate() drops everything; called after a reindex changed the knowledge
+      base and when the embedding model/backend changes
+    """
+
+    # Answers worth caching (greetings/rejections are already instant)
+    CACHEABLE_TYPES = {"agent", "rag_verified", "perplexity_search"}
+    WEB_TYPES = {"perplexity_search"}
+
+    _entries: "OrderedDict[int, AnswerEntry]" = OrderedDict()
+    _matrix: Optional[np.ndarray] = None
+    _free_slots: List[int] = []
+    _embedding_version: Optional[str] = None
+    _stats: Dict[str, float] = {
+        "lookups": 0, "hits": 0, "misses": 0, "expired": 0,
+        "stores": 0, "evictions": 0, "invalidations": 0, "latency_saved_seconds": 0.0
+    }
+
+    @staticmethod
+    def _partition(language: str, model_preference: str) -> str:
+        return f"{language}:{model_preference or 'auto'}"
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+    @classmethod
+    def _check_version(cls, embedding_version: str):
+        # Vectors from another model are not comparable
+        if cls._embedding_version != embedding_version:
+            if cls._entries:
+                cls.invalidate("embedding model changed")
+            cls._embedding_version = embedding_version
+
+    @classmethod
+    def _release(cls, slot: int):
+        cls._entries.pop(slot, None)
+        cls._free_slots.append(slot)
+
+    @classmethod
+    def lookup(
+        cls,
+        embedding: List[float],
+        *,
+        language: str,
+        model_preference: str,
+        embedding_version: str
+    ) -> Optional[AnswerEntry]:
+        """Best live entry above the threshold in the same partition, or None"""
+        if not settings.SEMANTIC_CACHE_ENABLED:
+            return None
+        cls._check_version(embedding_version)
+        cls._stats["lookups"] += 1
+
+        if not cls._entries:
+            cls._stats["misses"] += 1
+            return None
+
+        similarities = cls._matrix @ cls._normalize(embedding)
+        partition = cls._partition(language, model_preference)
+        now = time.time()
+
+        for slot in np.argsort(-similarities):
+            similarity = float(similarities[slot])
+            if similarity < settings.SEMANTIC_CACHE_THRESHOLD:
+                break
+            entry = cls._entries.get(int(slot))
+            if entry is None or entry.partition != partition:
+                continue
+            if entry.expires_at <= now:
+                cls._release(int(slot))
+                cls._stats["expired"] += 1
+                continue
+
+            entry.hits += 1
+            cls._entries.move_to_end(int(slot))
+            cls._stats["hits"] += 1
+            logger.info(f"🎯 Semantic cache hit ({similarity:.3f}): '{entry.query}'")
+            return entry
+
+        cls._stats["misses"] += 1
+        return None
+
+    @classmethod
+    def store(
+        cls,
+        embedding: List[float],
+        *,
+        query: str,
+        language: str,
+        model_preference: str,
+        embedding_version: str,
+        response: str,
+        sources: List[str],
+        confidence: float,
+        response_type: str,
+        generation_time: float
+    ):
+        if not settings.SEMANTIC_CACHE_ENABLED or response_type not in cls.CACHEABLE_TYPES:
+            return
+        cls._check_version(embedding_version)
+
+        vector = cls._normalize(embedding)
+        if cls._matrix is None or cls._matrix.shape[1] != vector.shape[0]:
+            cls._matrix = np.zeros((settings.SEMANTIC_CACHE_MAX_ENTRIES, vector.shape[0]), dtype=np.float32)
+            cls._entries.clear()
+            cls._free_slots = list(range(settings.SEMANTIC_CACHE_MAX_ENTRIES - 1, -1, -1))
+
+        if not cls._free_slots:
+            oldest = next(iter(cls._entries))
+            cls._release(oldest)
+            cls._stats["evictions"] += 1
+
+        ttl = settings.SEMANTIC_CACHE_WEB_TTL if response_type in cls.WEB_TYPES else settings.SEMANTIC_CACHE_TTL
+        slot = cls._free_slots.pop()
+        cls._matrix[slot] = vector
+        cls._entries[slot] = AnswerEntry(
+            query=query,
+            partition=cls._partition(language, model_preference),
+            response=response,
+            sources=list(sources),
+            confidence=confidence,
+            response_type=response_type,
+            generation_time=generation_time,
+            expires_at=time.time() + ttl
+        )
+        cls._stats["stores"] += 1
+
+    @classmethod
+    def record_saving(cls, entry: AnswerEntry, served_in: float):
+        cls._stats["latency_saved_seconds"] += max(0.0, entry.generation_time - served_in)
+
+    @classmethod
+    def invalidate(cls, reason: str = "manual"):
+        """Drop every cached answer (the knowledge behind them changed)"""
+        dropped = len(cls._entries)
+        cls._entries.clear()
+        if cls._matrix is not None:
+            cls._matrix[:] = 0.0
+            cls._free_slots = list(range(cls._matrix.shape[0] - 1, -1, -1))
+        cls._stats["invalidations"] += 1
+        logger.info(f"🧹 Semantic answer cache invalidated ({reason}, {dropped} entries)")
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        lookups = cls._stats["lookups"]
+        return {
+            "enabled": settings.SEMANTIC_CACHE_ENABLED,
+            "threshold": settings.SEMANTIC_CACHE_THRESHOLD,
+            "entries": len(cls._entries),
+            "max_entries": settings.SEMANTIC_CACHE_MAX_ENTRIES,
+            **cls._stats,
+            "latency_saved_seconds": round(cls._stats["latency_saved_seconds"], 2),
+            "hit_rate": round(cls._stats["hits"] / lookups, 4) if lookups else 0.0
+        }
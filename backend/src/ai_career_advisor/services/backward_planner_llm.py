@@ -1,7 +1,8 @@
-import json
 import asyncio
 from ai_career_advisor.core.logger import logger
 from ai_career_advisor.core.model_manager import ModelManager
+from ai_career_advisor.core.structured_output import StructuredOutputError
+from ai_career_advisor.Schemas.backward_planner import RoadmapLLMOutput
 
 
 class BackwardPlannerLLM:
@@ -9,6 +10,10 @@ class BackwardPlannerLLM:
     Generates complete backward career roadmap using Gemini AI
     """
     
+    # LLM cache TTLs (roadmaps change slowly; bad outputs are retried sooner)
+    CACHE_TTL = 7 * 24 * 3600
+    NEGATIVE_CACHE_TTL = 30 * 60
+    
     @staticmethod
     def _validate_roadmap(data: dict) -> tuple[bool, list]:
         """
@@ -72,7 +77,6 @@ class BackwardPlannerLLM:
         logger.info(f"🤖 Generating roadmap for '{career_name}' ({category})")
         
         MAX_RETRIES = 3
-        base_delay = 5
         
         for attempt in range(1, MAX_RETRIES + 1):
             
@@ -232,34 +236,24 @@ IMPORTANT RULES:
 """
             
             try:
-                # Rate limit delay
-                await asyncio.sleep(base_delay)
-                
-                # Call ModelManager with smart fallback
+                # Structured output: schema-validated JSON, missing mandatory
+                # fields are repaired with a small follow-up call
                 logger.info(f"   📤 Calling AI model with smart fallback...")
-                text = await ModelManager.generate_smart(prompt)
-                text = text.strip()
-                
-                # Clean markdown
-                if text.startswith("```"):
-                    text = text.replace("```json", "").replace("```", "").strip()
-                
-                # Parse JSON
                 try:
-                    roadmap = json.loads(text)
-                except json.JSONDecodeError as e:
-                    logger.error(f"   🔴 JSON parse error: {str(e)[:100]}")
-                    if attempt < MAX_RETRIES:
-                        await asyncio.sleep(base_delay * attempt)
-                        continue
-                    else:
-                        logger.error(f"   ❌ Failed to generate valid JSON after {MAX_RETRIES} attempts")
-                        return {
-                            "error": "invalid_json_after_retries",
-                            "message": "Could not generate valid roadmap structure"
-                        }
+                    result = await ModelManager.generate_structured(
+                        prompt,
+                        RoadmapLLMOutput,
+                        # Optional sections are free-form; JSON mode only
+                        response_schema=False,
+                        cache_ttl=BackwardPlannerLLM.CACHE_TTL,
+                        negative_ttl=BackwardPlannerLLM.NEGATIVE_CACHE_TTL,
+                        cache_namespace="backward_planner"
+                    )
+                    roadmap = result.model_dump()
+                except StructuredOutputError as e:
+                    logger.error(f"   🔴 Invalid roadmap JSON: {str(e)[:100]}")
+                    roadmap = e.partial
                 
-            
                 is_complete, missing = BackwardPlannerLLM._validate_roadmap(roadmap)
                 
                 if is_complete:
@@ -318,9 +312,7 @@ IMPORTANT RULES:
                     logger.warning(f"   ⚠️ INCOMPLETE: Missing mandatory fields → {missing}")
                     
                     if attempt < MAX_RETRIES:
-                        retry_delay = base_delay * (attempt + 1)
-                        logger.info(f"   ⏳ Waiting {retry_delay}s before retry...")
-                        await asyncio.sleep(retry_delay)
+                        logger.info(f"   🔁 Retrying (attempt {attempt + 1}/{MAX_RETRIES})...")
                         continue
                     else:
                         logger.error(f"   ❌ Incomplete roadmap after {MAX_RETRIES} attempts")
@@ -344,9 +336,8 @@ IMPORTANT RULES:
             except Exception as e:
                 logger.error(f"   🔴 Error: {str(e)[:150]}")
                 if "quota" in str(e).lower() or "rate limit" in str(e).lower():
-                    logger.warning(f"   🟡 Rate limiting detected, trying next approach...")
+                    logger.warning(f"   🟡 Rate limiting detected, next attempt waits for a permit...")
                     if attempt < MAX_RETRIES:
-                        await asyncio.sleep(60)
                         continue
                     else:
                         logger.error(f"   ❌ All models quota exhausted")
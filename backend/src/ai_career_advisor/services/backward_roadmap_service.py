@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from ai_career_advisor.models.backward_roadmap import BackwardRoadmap
 from ai_career_advisor.core.logger import logger
 from typing import Optional
@@ -90,9 +91,7 @@ class BackwardRoadmapService:
             confidence_score=0.85  # Default confidence for LLM generation
         )
         
-        db.add(roadmap)
-        await db.commit()
-        await db.refresh(roadmap)
+        roadmap = await BackwardRoadmapService._insert_or_get_existing(db, roadmap)
         
         logger.success(f"   ✅ Roadmap saved to database (ID: {roadmap.id})")
         return roadmap
@@ -143,9 +142,33 @@ class BackwardRoadmapService:
             confidence_score=1.0  # Templates are verified, so high confidence
         )
         
-        db.add(roadmap)
-        await db.commit()
-        await db.refresh(roadmap)
+        roadmap = await BackwardRoadmapService._insert_or_get_existing(db, roadmap)
         
         logger.success(f"   ✅ Template roadmap saved (ID: {roadmap.id})")
         return roadmap
+    
+    @staticmethod
+    async def _insert_or_get_existing(
+        db: AsyncSession,
+        roadmap: BackwardRoadmap
+    ) -> BackwardRoadmap:
+        """
+        Insert a roadmap; if a concurrent request already stored the shared
+        roadmap for this career (unique index violation), return that row instead
+        """
+        db.add(roadmap)
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            existing = await BackwardRoadmapService.get_by_career(
+                db,
+                career_name=roadmap.normalized_career
+            )
+            if existing is None:
+                raise
+            logger.info(f"   🔁 Roadmap for '{roadmap.normalized_career}' inserted concurrently, reusing ID {existing.id}")
+            return existing
+        
+        await db.refresh(roadmap)
+        return roadmap
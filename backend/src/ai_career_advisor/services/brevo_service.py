@@ -2,7 +2,7 @@
 Brevo Email Service for sending admission alerts
 """
 import os
-import httpx
+from ai_career_advisor.core.http_client import get_http_client
 from datetime import datetime
 from typing import Optional
 from ai_career_advisor.core.logger import logger
@@ -75,20 +75,21 @@ class BrevoService:
                 "htmlContent": html_content
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    cls.API_URL,
-                    headers=headers,
-                    json=payload
-                )
+            client = get_http_client(cls.API_URL)
+            response = await client.post(
+                cls.API_URL,
+                headers=headers,
+                json=payload,
+                timeout=30.0
+            )
+            
+            if response.status_code == 201:
+                logger.success(f"✅ Email sent to {to_email} for {alert_type}")
+                return True
+            else:
+                logger.error(f"❌ Failed to send email: {response.status_code} - {response.text}")
+                return False
                 
-                if response.status_code == 201:
-                    logger.success(f"✅ Email sent to {to_email} for {alert_type}")
-                    return True
-                else:
-                    logger.error(f"❌ Failed to send email: {response.status_code} - {response.text}")
-                    return False
-                    
         except Exception as e:
             logger.error(f"❌ Error sending email via Brevo: {str(e)}")
             return False
@@ -1,7 +1,8 @@
-import json
 import asyncio
 from ai_career_advisor.core.logger import logger
 from ai_career_advisor.core.model_manager import ModelManager  
+from ai_career_advisor.core.structured_output import StructuredOutputError
+from ai_career_advisor.Schemas.career_insight import CareerInsightLLMOutput
 
 
 def _normalize_projects(projects):
@@ -30,6 +31,11 @@ def _normalize_projects(projects):
     }
 
 
+# LLM cache TTLs for insight prompts
+INSIGHT_CACHE_TTL = 7 * 24 * 3600
+INSIGHT_NEGATIVE_CACHE_TTL = 30 * 60
+
+
 def generate_career_insight_sync(career_name: str) -> dict:
     """Synchronous wrapper for generate_career_insight"""
     return asyncio.run(generate_career_insight(career_name))
@@ -67,35 +73,24 @@ Rules:
 """
 
     try:
-        logger.info("📤 Using ModelManager with smart fallback...")
-        raw_text = await ModelManager.generate_smart(prompt)
-        
-        logger.info(f"📦 Raw LLM Response: {raw_text[:200]}...")
-
-        
-        if raw_text.startswith("```json"):
-            raw_text = raw_text.replace("```json", "").replace("```", "").strip()
-        elif raw_text.startswith("```"):
-            raw_text = raw_text.replace("```", "").strip()
-
-        
-        data = json.loads(raw_text)
-
-        
-        required_keys = ["skills", "internships", "projects", "programs", "top_salary"]
-        for key in required_keys:
-            if key not in data:
-                raise ValueError(f"Missing required key: {key}")
-
-        
+        logger.info("📤 Using ModelManager structured output with smart fallback...")
+        insight = await ModelManager.generate_structured(
+            prompt,
+            CareerInsightLLMOutput,
+            cache_ttl=INSIGHT_CACHE_TTL,
+            negative_ttl=INSIGHT_NEGATIVE_CACHE_TTL,
+            cache_namespace="career_insight"
+        )
+
+        data = insight.model_dump()
         data["projects"] = _normalize_projects(data.get("projects"))
 
         logger.success(f"✅ Career insight generated for {career_name}")
         return data
 
-    except json.JSONDecodeError as e:
-        logger.error(f"❌ JSON parsing failed for {career_name}: {e}")
-        logger.error(f"Raw response was: {raw_text if 'raw_text' in locals() else 'No response'}")
+    except StructuredOutputError as e:
+        logger.error(f"❌ Invalid insight JSON for {career_name}: {e}")
+        logger.error(f"Partial response was: {e.partial}")
         raise
     except Exception as e:
         logger.error(f"❌ LLM failed for {career_name}: {e}")
@@ -1,14 +1,13 @@
-import json
-import google.generativeai as genai
-from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
+from ai_career_advisor.core.llm_cache import LLMCache
+from ai_career_advisor.core.circuit_breaker import CircuitOpenError
+from ai_career_advisor.core.model_manager import ModelManager, ModelUnavailableError
+from ai_career_advisor.core.structured_output import StructuredOutputError
+from ai_career_advisor.Schemas.backward_planner import CareerNormalizationLLMOutput
 import asyncio
-from functools import partial
-from google.api_core.exceptions import ResourceExhausted, GoogleAPIError
 
 
-genai.configure(api_key=settings.GEMINI_API_KEY)
-model = genai.GenerativeModel("gemini-2.5-flash-lite")
+NORMALIZER_MODEL = "gemini-2.5-flash-lite"
 
 
 class CareerNormalizerService:
@@ -17,6 +16,10 @@ class CareerNormalizerService:
     Converts variations to standard career names
     """
     
+    # LLM cache TTLs: valid careers are stable, rejected inputs are re-checked sooner
+    CACHE_TTL = 30 * 24 * 3600
+    NEGATIVE_CACHE_TTL = 60 * 60
+    
     @staticmethod
     async def normalize_and_validate(user_input: str) -> dict:
         """
@@ -106,25 +109,23 @@ Output: {{"is_valid": false, "normalized_career": null, "category": null, "confi
 NOW PROCESS: "{user_input}"
 """
         
+        cache_key = LLMCache.make_key(NORMALIZER_MODEL, prompt)
+        cached = await LLMCache.get(cache_key, namespace="career_normalizer")
+        if cached is not None:
+            logger.info(f"   💾 Normalization cache hit for '{user_input}'")
+            return dict(cached.value)
+        
         try:
-            # Call Gemini API
-            loop = asyncio.get_event_loop()
-            response = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    partial(model.generate_content, prompt)
+            # Gemini JSON mode constrained to the verdict schema (repairs invalid fields)
+            verdict = await asyncio.wait_for(
+                ModelManager.generate_structured(
+                    prompt,
+                    CareerNormalizationLLMOutput,
+                    preference=NORMALIZER_MODEL
                 ),
                 timeout=30.0
             )
-            
-            text = response.text.strip()
-            
-            # Clean markdown
-            if text.startswith("```"):
-                text = text.replace("```json", "").replace("```", "").strip()
-            
-            # Parse JSON
-            result = json.loads(text)
+            result = verdict.model_dump()
             
             # Log result
             if result.get("is_valid"):
@@ -132,6 +133,16 @@ NOW PROCESS: "{user_input}"
             else:
                 logger.warning(f"   ❌ Invalid career: {result.get('reason')}")
             
+            # Rejections are cached as negative entries with a shorter TTL
+            is_valid = bool(result.get("is_valid"))
+            await LLMCache.set(
+                cache_key,
+                result,
+                ttl=CareerNormalizerService.CACHE_TTL if is_valid else CareerNormalizerService.NEGATIVE_CACHE_TTL,
+                negative=not is_valid,
+                namespace="career_normalizer"
+            )
+            
             return result
         
         except asyncio.TimeoutError:
@@ -144,7 +155,8 @@ NOW PROCESS: "{user_input}"
                 "reason": "Request timeout. Please try again."
             }
         
-        except (ResourceExhausted, GoogleAPIError) as e:
+        except (ModelUnavailableError, CircuitOpenError) as e:
+            # Quota, outage or open circuit on every model generate_structured tried
             logger.error(f"    API Error: {str(e)}")
             return {
                 "is_valid": False,
@@ -154,9 +166,9 @@ NOW PROCESS: "{user_input}"
                 "reason": "Service temporarily unavailable. Please try again."
             }
         
-        except json.JSONDecodeError as e:
-            logger.error(f"    JSON parse error: {str(e)}")
-            logger.error(f"   Raw response: {text[:200]}")
+        except StructuredOutputError as e:
+            logger.error(f"    JSON validation error: {str(e)}")
+            logger.error(f"   Partial response: {str(e.partial)[:200]}")
             return {
                 "is_valid": False,
                 "normalized_career": None,
@@ -3,8 +3,15 @@ from ai_career_advisor.core.logger import logger
 from ai_career_advisor.services.intentfilter import IntentFilter
 from ai_career_advisor.models.chatconversation import ChatConversation
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict, Any, List, Tuple
-import httpx
+from typing import Dict, Any, List, Tuple, AsyncIterator, Optional
+from ai_career_advisor.core.http_client import get_http_client, PERPLEXITY_CHAT_URL
+from ai_career_advisor.core.rate_limiter import RateLimiter
+from ai_career_advisor.core.hedging import Hedger
+from ai_career_advisor.core.model_manager import ModelManager
+from ai_career_advisor.core.database import AsyncSessionLocal
+from ai_career_advisor.services.answer_cache import SemanticAnswerCache
+from ai_career_advisor.services import query_keywords
+import asyncio
 import time
 import uuid
 import re
@@ -25,31 +32,14 @@ class ChatbotService:
     - Never crashes - all errors handled gracefully
     """
     
-    # Feature patterns for recommending app features
-    FEATURE_PATTERNS = {
-        "stream": {
-            "keywords": ["stream", "which stream", "science or commerce", "arts or science", "10th ke baad", "after 10th", "stream select", "konsa stream"],
-            "link": "/stream-finder",
-            "message": "\n\n🎯 **Want personalized stream recommendation?**\n👉 [Click here to use our Stream Finder](/stream-finder)"
-        },
-        "roadmap": {
-            "keywords": [
-                "roadmap", "how to become", "become a ", "become an ", "want to become",
-                "kaise bane", "kaise banu", "banna hai", "banna chahta",
-                "career path", "step by step", "guide to become", "steps to become",
-                "what after 12th", "12th ke baad", "after 12th", "after graduation",
-                "software engineer", "data scientist", "doctor", "lawyer", "ca ", "chartered accountant",
-                "engineer", "developer", "designer", "manager"
-            ],
-            "link": "/roadmap/backward",
-            "message": "\n\n🗺️ **Get a detailed career roadmap!**\n👉 [Generate your personalized roadmap here](/roadmap/backward)"
-        },
-        "college": {
-            "keywords": ["college find", "find college", "best college", "top college", "college for", "iit admission", "nit admission", "bits", "college recommendation"],
-            "link": "/colleges",
-            "message": "\n\n🏫 **Looking for the perfect college?**\n👉 [Use our College Finder tool](/colleges)"
-        }
-    }
+    # Keeps references to post-stream persistence tasks
+    _background_tasks: set = set()
+    
+    SEARCH_DISCLAIMER = "\n\n💡 *Please verify from official sources before making decisions.*"
+    
+    # Keyword lists live in query_keywords (one compiled matcher for all of them)
+    ROADMAP_KEYWORDS = query_keywords.ROADMAP_KEYWORDS
+    FEATURE_PATTERNS = query_keywords.FEATURE_PATTERNS
     
     # Hindi detection patterns
     HINDI_PATTERNS = [
@@ -64,12 +54,8 @@ class ChatbotService:
         if re.search(r'[\u0900-\u097F]', query):
             return True
         
-        # Check for common Hindi words (Hinglish)
-        hindi_words = ['kya', 'kaise', 'hai', 'hoon', 'mujhe', 'batao', 'bata', 'karo', 
-                       'chahiye', 'karenge', 'hoga', 'hogi', 'karna', 'padhna', 'padhai',
-                       'kaun', 'konsa', 'kaunsa', 'baad', 'pehle', 'accha', 'theek', 'sahi']
-        query_lower = query.lower()
-        hindi_count = sum(1 for word in hindi_words if word in query_lower)
+        # Check for common Hindi words (Hinglish, whole words: "bata" is not in "database")
+        hindi_count = len(query_keywords.scan_query(query).patterns("hindi"))
         
         # If 2+ Hindi words found, treat as Hindi
         return hindi_count >= 2
@@ -97,6 +83,21 @@ class ChatbotService:
         # Detect language preference
         use_hindi = ChatbotService._is_hindi_query(query)
         logger.info(f"🌐 Language: {'Hindi/Hinglish' if use_hindi else 'English'}")
+        language = "hi" if use_hindi else "en"
+        
+        # Near-duplicate of a recently answered question: skip RAG + LLM
+        query_embedding = await ChatbotService._safe_query_embedding(query)
+        if query_embedding is not None:
+            cached = SemanticAnswerCache.lookup(
+                query_embedding,
+                language=language,
+                model_preference=model_preference,
+                embedding_version=ChatbotService._embedding_version()
+            )
+            if cached:
+                return await ChatbotService._serve_cached_answer(
+                    cached, query, session_id, user_email, db, start_time
+                )
         
         # Phase 4: Use LangGraph Agent if enabled
         if USE_AGENT_GRAPH:
@@ -108,7 +109,7 @@ class ChatbotService:
                     query=query,
                     user_email=user_email or "anonymous",
                     session_id=session_id,
-                    language="hi" if use_hindi else "en",
+                    language=language,
                     model_preference=model_preference
                 )
                 
@@ -133,6 +134,12 @@ class ChatbotService:
                         "agent", 0.9, response_time, sources
                     )
                     
+                    if result.get("intent") not in ("greeting", "rejected") and "error" not in result.get("tool_outputs", {}):
+                        ChatbotService._cache_answer(
+                            query_embedding, query, language, model_preference,
+                            response_text, sources, 0.9, "agent", response_time
+                        )
+                    
                     return {
                         "session_id": session_id,
                         "query": query,
@@ -148,7 +155,7 @@ class ChatbotService:
         
         try:
             # Step 1: Check intent (greetings, career, or blocked)
-            intent_result = IntentFilter.is_career_related(query)
+            intent_result = await IntentFilter.is_career_related_async(query)
             
             # Handle greetings instantly (no API calls)
             if intent_result.get("is_greeting"):
@@ -168,14 +175,7 @@ class ChatbotService:
             
             # KEYWORD OVERRIDE: Force roadmap routing for "I want to become X" queries
             # (ML model sometimes classifies these as career_query instead of roadmap_request)
-            query_lower = query.lower()
-            roadmap_keywords = [
-                "want to become", "wanna become", "become a ", "become an ",
-                "how to become", "kaise bane", "kaise banu", "banna hai",
-                "banna chahta", "banna chahti", "roadmap for", "path to become",
-                "steps to become", "guide to become"
-            ]
-            if any(kw in query_lower for kw in roadmap_keywords):
+            if "roadmap" in query_keywords.scan_query(query):
                 detected_intent = "roadmap_request"
                 logger.info(f"🔀 Keyword override: treating as roadmap_request")
             
@@ -187,24 +187,30 @@ class ChatbotService:
                     return feature_response
             
             # Step 3: Try RAG for other queries (with error handling)
-            rag_result = await ChatbotService._safe_rag_search(query)
+            rag_result = await ChatbotService._safe_rag_search(query, detected_intent)
             
             # Step 3: Generate response with sources
             if rag_result["found"] and rag_result.get("context"):
                 # RAG has data - use it
-                response_text, sources = await ChatbotService._generate_with_rag(
+                response_text, sources, generated = await ChatbotService._generate_with_rag(
                     query, rag_result["context"], rag_result.get("sources", []), use_hindi
                 )
                 response_type = "rag_verified"
                 confidence = max(rag_result.get("scores", [0.5]))
             else:
                 # Use Perplexity Sonar with web search - ALWAYS get sources
-                response_text, sources = await ChatbotService._generate_with_perplexity(query, use_hindi)
+                response_text, sources, generated = await ChatbotService._generate_with_perplexity(query, use_hindi)
                 response_type = "perplexity_search"
                 confidence = 0.8
                 
-                # Try to save to RAG for future (non-blocking)
-                await ChatbotService._save_to_rag(query, response_text, session_id)
+                # Remember for future queries (write-behind, non-blocking)
+                if generated:
+                    ChatbotService._save_to_rag(query, response_text, session_id)
+            
+            if not generated:
+                # Fallback message, not an answer: never cached or learned
+                response_type = "error"
+                confidence = 0.0
             
             # Step 4: Detect features and add redirect links
             feature_links = ChatbotService._detect_features(query)
@@ -224,6 +230,12 @@ class ChatbotService:
                 response_type, confidence, response_time, sources
             )
             
+            if generated:
+                ChatbotService._cache_answer(
+                    query_embedding, query, language, model_preference,
+                    response_text, sources, confidence, response_type, response_time
+                )
+            
             logger.success(f"✅ Response generated in {response_time:.2f}s ({response_type})")
             
             return {
@@ -249,6 +261,263 @@ class ChatbotService:
                 "response_time": time.time() - start_time
             }
     
+    @staticmethod
+    def _embedding_version() -> str:
+        from ai_career_advisor.RAG.embeddings import EmbeddingService
+        return EmbeddingService.cache_version()
+    
+    @staticmethod
+    async def _safe_query_embedding(query: str) -> Optional[List[float]]:
+        """Query embedding for the answer cache (None if caching is off or it fails)"""
+        if not settings.SEMANTIC_CACHE_ENABLED:
+            return None
+        try:
+            from ai_career_advisor.RAG.embeddings import EmbeddingService
+            # Memory-cached, so the RAG search below reuses this vector
+            return await EmbeddingService.generate_query_embedding(query)
+        except Exception as e:
+            logger.warning(f"Semantic cache skipped: {e}")
+            return None
+    
+    @staticmethod
+    def _cache_answer(
+        query_embedding: Optional[List[float]],
+        query: str,
+        language: str,
+        model_preference: str,
+        response_text: str,
+        sources: List[str],
+        confidence: float,
+        response_type: str,
+        response_time: float
+    ):
+        if query_embedding is None:
+            return
+        try:
+            SemanticAnswerCache.store(
+                query_embedding,
+                query=query,
+                language=language,
+                model_preference=model_preference,
+                embedding_version=ChatbotService._embedding_version(),
+                response=response_text,
+                sources=sources,
+                confidence=confidence,
+                response_type=response_type,
+                generation_time=response_time
+            )
+        except Exception as e:
+            logger.warning(f"Could not cache answer: {e}")
+    
+    @staticmethod
+    async def _serve_cached_answer(
+        entry, query: str, session_id: str, user_email: str,
+        db: AsyncSession, start_time: float
+    ) -> Dict[str, Any]:
+        """Response from the semantic answer cache (still saved to chat history)"""
+        response_time = time.time() - start_time
+        SemanticAnswerCache.record_saving(entry, response_time)
+        
+        await ChatbotService._save_conversation(
+            db, session_id, user_email, query, entry.response,
+            entry.response_type, entry.confidence, response_time, entry.sources
+        )
+        
+        return {
+            "session_id": session_id,
+            "query": query,
+            "response": entry.response,
+            "sources": entry.sources,
+            "confidence": entry.confidence,
+            "response_type": entry.response_type,
+            "response_time": response_time,
+            "cached": True
+        }
+    
+    @staticmethod
+    async def ask_stream(
+        query: str,
+        session_id: str = None,
+        user_email: str = None,
+        model_preference: str = "auto"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of ask()
+        Yields events: start → token* → done (trailer with sources + metadata)
+        
+        - Tokens come straight from Gemini / Perplexity streaming via ModelManager
+        - Conversation persistence runs in the background after the stream ends
+        - The LangGraph agent is not used here (its tool loop cannot stream tokens)
+        """
+        start_time = time.time()
+        
+        if not session_id:
+            session_id = str(uuid.uuid4())
+        
+        logger.info(f"💬 Chatbot stream: {query} (session: {session_id})")
+        use_hindi = ChatbotService._is_hindi_query(query)
+        
+        yield {"event": "start", "data": {"session_id": session_id}}
+        
+        time_to_first_token = None
+        meta: Dict[str, Any] = {}
+        chunks: List[str] = []
+        
+        try:
+            # Instant answers (greetings, rejections, stored roadmaps) are sent as one chunk
+            intent_result = await IntentFilter.is_career_related_async(query)
+            instant = None
+            async with AsyncSessionLocal() as db:
+                if intent_result.get("is_greeting"):
+                    instant = await ChatbotService._handle_greeting(
+                        query, session_id, user_email, db, start_time, use_hindi
+                    )
+                elif not intent_result["is_career"]:
+                    instant = await ChatbotService._handle_rejection(
+                        query, session_id, user_email, db, start_time, use_hindi
+                    )
+                else:
+                    detected_intent = intent_result.get("intent", "")
+                    if "roadmap" in query_keywords.scan_query(query):
+                        detected_intent = "roadmap_request"
+                    if detected_intent == "roadmap_request":
+                        instant = await ChatbotService._handle_roadmap_request(
+                            query, session_id, user_email, db, start_time, use_hindi
+                        )
+            
+            if instant:
+                yield {"event": "token", "data": {"text": instant["response"]}}
+                yield {"event": "done", "data": {
+                    "session_id": session_id,
+                    "sources": instant["sources"],
+                    "confidence": instant["confidence"],
+                    "response_type": instant["response_type"],
+                    "response_time": time.time() - start_time,
+                    "time_to_first_token": time.time() - start_time
+                }}
+                return
+            
+            rag_result = await ChatbotService._safe_rag_search(query, intent_result.get("intent"))
+            
+            if rag_result["found"] and rag_result.get("context"):
+                system_prompt, prompt = ChatbotService._build_rag_prompt(query, rag_result["context"], use_hindi)
+                stream = ModelManager.generate_stream(
+                    prompt, model_preference or "auto", system_prompt=system_prompt, meta=meta
+                )
+                response_type = "rag_verified"
+                confidence = max(rag_result.get("scores", [0.5]))
+                sources = rag_result.get("sources") or ["Knowledge Base - Verified Data"]
+            else:
+                system_prompt, prompt = ChatbotService._build_search_prompt(query, use_hindi)
+                stream = ChatbotService._stream_search(prompt, system_prompt, model_preference, meta)
+                response_type = "perplexity_search"
+                confidence = 0.8
+                sources = None
+            
+            async for text in stream:
+                if time_to_first_token is None:
+                    time_to_first_token = time.time() - start_time
+                    logger.info(f"⚡ First token after {time_to_first_token:.2f}s")
+                chunks.append(text)
+                yield {"event": "token", "data": {"text": text}}
+            
+            tail = ""
+            if sources is None:
+                citations = meta.get("citations") or []
+                sources = citations[:5] if citations else ["Web Search - Official Sources"]
+                tail += ChatbotService.SEARCH_DISCLAIMER
+            tail += ChatbotService._detect_features(query)
+            tail += ChatbotService._format_sources(sources, response_type)
+        
+        except Exception as e:
+            logger.error(f"❌ Streaming error: {str(e)}")
+            tail = "I apologize, but I'm having technical difficulties. Please try again in a moment."
+            if chunks:
+                tail = "\n\n" + tail
+            sources = ["System Error"]
+            confidence = 0.0
+            response_type = "error"
+        
+        if tail:
+            yield {"event": "token", "data": {"text": tail}}
+        
+        response_time = time.time() - start_time
+        response_text = "".join(chunks) + tail
+        
+        ChatbotService._persist_in_background(
+            session_id, user_email, query, response_text, response_type,
+            confidence, response_time, sources,
+            save_to_rag=response_type == "perplexity_search"
+        )
+        
+        logger.success(
+            f"✅ Stream finished in {response_time:.2f}s "
+            f"(first token {time_to_first_token or response_time:.2f}s, {response_type})"
+        )
+        
+        yield {"event": "done", "data": {
+            "session_id": session_id,
+            "sources": sources,
+            "confidence": confidence,
+            "response_type": response_type,
+            "response_time": response_time,
+            "time_to_first_token": time_to_first_token,
+            "model": meta.get("model")
+        }}
+    
+    @staticmethod
+    async def _stream_search(
+        prompt: str,
+        system_prompt: str,
+        model_preference: str,
+        meta: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Perplexity Sonar web search stream; ModelManager chain if Sonar fails before the first token"""
+        started = False
+        try:
+            async for text in ModelManager.stream_with_perplexity(
+                prompt, model="sonar", system_prompt=system_prompt, meta=meta
+            ):
+                started = True
+                yield text
+            meta["model"] = "sonar"
+            return
+        except Exception as e:
+            if started:
+                raise
+            logger.warning(f"Sonar stream failed, falling back: {e}")
+        
+        async for text in ModelManager.generate_stream(
+            prompt, model_preference or "auto", system_prompt=system_prompt, meta=meta
+        ):
+            yield text
+    
+    @staticmethod
+    def _persist_in_background(
+        session_id: str,
+        user_email: str,
+        query: str,
+        response: str,
+        response_type: str,
+        confidence: float,
+        response_time: float,
+        sources: list,
+        save_to_rag: bool = False
+    ):
+        """Save a streamed conversation after the stream ends (own DB session)"""
+        async def persist():
+            async with AsyncSessionLocal() as db:
+                await ChatbotService._save_conversation(
+                    db, session_id, user_email, query, response,
+                    response_type, confidence, response_time, sources
+                )
+            if save_to_rag:
+                ChatbotService._save_to_rag(query, response, session_id)
+        
+        task = asyncio.create_task(persist())
+        ChatbotService._background_tasks.add(task)
+        task.add_done_callback(ChatbotService._background_tasks.discard)
+    
     @staticmethod
     def _format_sources(sources: List[str], response_type: str = "") -> str:
         """Format sources into a readable string with clickable links"""
@@ -482,15 +751,16 @@ Please ask a career or education-related question! 😊"""
 
     
     @staticmethod
-    async def _safe_rag_search(query: str) -> Dict[str, Any]:
+    async def _safe_rag_search(query: str, intent: str = None) -> Dict[str, Any]:
         """
         RAG search with full error handling
+        The intent picks the retrieval route (which sources, top_k, threshold)
         Never raises exceptions - returns empty result on failure
         """
         try:
             from ai_career_advisor.RAG.retriever import retriever
             logger.info("🔍 Searching RAG database...")
-            result = await retriever.search_and_build_context(query, top_k=5)
+            result = await retriever.search_and_build_context(query, intent=intent)
             
             if result["found"]:
                 logger.success(f"✅ RAG found {result.get('num_documents', 0)} documents")
@@ -510,13 +780,8 @@ Please ask a career or education-related question! 😊"""
             }
     
     @staticmethod
-    async def _generate_with_rag(query: str, context: str, rag_sources: List[str], use_hindi: bool) -> Tuple[str, List[str]]:
-        """Generate response using RAG context with Perplexity - returns (text, sources)"""
-        PERPLEXITY_API_KEY = settings.PERPLEXITY_API_KEY or ""
-        
-        if not PERPLEXITY_API_KEY:
-            return ("Configuration error. Please contact support.", ["System Error"])
-        
+    def _build_rag_prompt(query: str, context: str, use_hindi: bool) -> Tuple[str, str]:
+        """(system prompt, user prompt) for answering from verified RAG context"""
         lang_instruction = "Answer in Hindi/Hinglish." if use_hindi else "Answer in English only."
         
         prompt = f"""You are an AI Career Counselor for Indian students. Answer using the verified context below.
@@ -533,10 +798,46 @@ RULES:
 - Include specific details (fees, dates, etc.) if available
 - Do NOT mix languages unless user asked in mixed language"""
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+        system_prompt = f"You are a helpful career counselor. {lang_instruction} Use only the provided context."
+        return system_prompt, prompt
+    
+    @staticmethod
+    def _build_search_prompt(query: str, use_hindi: bool) -> Tuple[str, str]:
+        """(system prompt, user prompt) for Perplexity web search answers"""
+        lang_instruction = "Answer in Hindi/Hinglish." if use_hindi else "Answer in English only. Do not use Hindi words."
+        
+        prompt = f"""You are an AI Career Counselor for Indian students.
+
+QUESTION: {query}
+
+INSTRUCTIONS:
+- Search for current, accurate information about Indian education and careers
+- {lang_instruction}
+- Provide specific details: fees, eligibility, dates, salary ranges
+- Keep response under 250 words
+- Be factual and cite official sources"""
+
+        system_prompt = f"You are an expert Indian education and career counselor. {lang_instruction} Always cite your sources."
+        return system_prompt, prompt
+    
+    @staticmethod
+    async def _generate_with_rag(query: str, context: str, rag_sources: List[str], use_hindi: bool) -> Tuple[str, List[str], bool]:
+        """
+        Generate response using RAG context with Perplexity
+        Returns (text, sources, generated); generated=False means text is a fallback error message
+        """
+        PERPLEXITY_API_KEY = settings.PERPLEXITY_API_KEY or ""
+        
+        if not PERPLEXITY_API_KEY:
+            return ("Configuration error. Please contact support.", ["System Error"], False)
+        
+        system_prompt, prompt = ChatbotService._build_rag_prompt(query, context, use_hindi)
+        
+        async def perplexity_answer() -> str:
+            client = get_http_client(PERPLEXITY_CHAT_URL)
+            async with RateLimiter.permit("perplexity", PERPLEXITY_API_KEY, "sonar") as permit:
                 response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
+                    PERPLEXITY_CHAT_URL,
                     headers={
                         "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
                         "Content-Type": "application/json"
@@ -544,50 +845,58 @@ RULES:
                     json={
                         "model": "sonar",
                         "messages": [
-                            {"role": "system", "content": f"You are a helpful career counselor. {lang_instruction} Use only the provided context."},
+                            {"role": "system", "content": system_prompt},
                             {"role": "user", "content": prompt}
                         ]
-                    }
+                    },
+                    timeout=30.0
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    answer = data["choices"][0]["message"]["content"].strip()
-                    sources = rag_sources if rag_sources else ["Knowledge Base - Verified Data"]
-                    return (answer, sources)
-                else:
-                    logger.error(f"Perplexity API error: {response.status_code}")
-                    return await ChatbotService._generate_with_perplexity(query, use_hindi)
+                permit.observe_status(response.status_code, response.headers.get("retry-after"))
+            
+            if response.status_code != 200:
+                raise Exception(f"Perplexity API error: {response.status_code}")
+            data = response.json()
+            return data["choices"][0]["message"]["content"].strip()
+        
+        async def gemini_answer() -> str:
+            return await ModelManager.generate_with_gemini(f"{system_prompt}\n\n{prompt}", model="gemini-2.5-flash")
+        
+        try:
+            if settings.LLM_HEDGING_ENABLED:
+                # Race Gemini when Perplexity is slower than its p95
+                answer = await Hedger.race(
+                    "chatbot",
+                    "perplexity:sonar", perplexity_answer,
+                    "gemini:gemini-2.5-flash", gemini_answer
+                )
+            else:
+                answer = await Hedger.timed("perplexity:sonar", perplexity_answer)
+            
+            sources = rag_sources if rag_sources else ["Knowledge Base - Verified Data"]
+            return (answer, sources, True)
         
         except Exception as e:
             logger.error(f"RAG generation error: {e}")
             return await ChatbotService._generate_with_perplexity(query, use_hindi)
     
     @staticmethod
-    async def _generate_with_perplexity(query: str, use_hindi: bool) -> Tuple[str, List[str]]:
-        """Generate response using Perplexity Sonar with web search - returns (text, sources)"""
+    async def _generate_with_perplexity(query: str, use_hindi: bool) -> Tuple[str, List[str], bool]:
+        """
+        Generate response using Perplexity Sonar with web search
+        Returns (text, sources, generated); generated=False means text is a fallback error message
+        """
         PERPLEXITY_API_KEY = settings.PERPLEXITY_API_KEY or ""
         
         if not PERPLEXITY_API_KEY:
-            return ("Configuration error. Please contact support.", ["System Error"])
-        
-        lang_instruction = "Answer in Hindi/Hinglish." if use_hindi else "Answer in English only. Do not use Hindi words."
+            return ("Configuration error. Please contact support.", ["System Error"], False)
         
-        prompt = f"""You are an AI Career Counselor for Indian students.
-
-QUESTION: {query}
-
-INSTRUCTIONS:
-- Search for current, accurate information about Indian education and careers
-- {lang_instruction}
-- Provide specific details: fees, eligibility, dates, salary ranges
-- Keep response under 250 words
-- Be factual and cite official sources"""
+        system_prompt, prompt = ChatbotService._build_search_prompt(query, use_hindi)
 
         try:
-            async with httpx.AsyncClient(timeout=45.0) as client:
+            client = get_http_client(PERPLEXITY_CHAT_URL)
+            async with RateLimiter.permit("perplexity", PERPLEXITY_API_KEY, "sonar") as permit:
                 response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
+                    PERPLEXITY_CHAT_URL,
                     headers={
                         "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
                         "Content-Type": "application/json"
@@ -595,54 +904,55 @@ INSTRUCTIONS:
                     json={
                         "model": "sonar",
                         "messages": [
-                            {"role": "system", "content": f"You are an expert Indian education and career counselor. {lang_instruction} Always cite your sources."},
+                            {"role": "system", "content": system_prompt},
                             {"role": "user", "content": prompt}
                         ]
-                    }
+                    },
+                    timeout=45.0
                 )
+                permit.observe_status(response.status_code, response.headers.get("retry-after"))
+            
+            if response.status_code == 200:
+                data = response.json()
+                answer = data["choices"][0]["message"]["content"].strip()
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    answer = data["choices"][0]["message"]["content"].strip()
-                    
-                    # Extract citations from Perplexity response
-                    citations = data.get("citations", [])
-                    if citations:
-                        sources = citations[:5]
-                    else:
-                        sources = ["Web Search - Official Sources"]
-                    
-                    # Add disclaimer
-                    answer += "\n\n💡 *Please verify from official sources before making decisions.*"
-                    
-                    return (answer, sources)
+                # Extract citations from Perplexity response
+                citations = data.get("citations", [])
+                if citations:
+                    sources = citations[:5]
                 else:
-                    logger.error(f"Perplexity API error: {response.status_code}")
-                    return ("I'm having trouble connecting. Please try again.", ["Connection Error"])
+                    sources = ["Web Search - Official Sources"]
+                
+                # Add disclaimer
+                answer += ChatbotService.SEARCH_DISCLAIMER
+                
+                return (answer, sources, True)
+            else:
+                logger.error(f"Perplexity API error: {response.status_code}")
+                return ("I'm having trouble connecting. Please try again.", ["Connection Error"], False)
         
         except Exception as e:
             logger.error(f"Perplexity error: {e}")
-            return ("I'm experiencing technical difficulties. Please try again.", ["Technical Error"])
+            return ("I'm experiencing technical difficulties. Please try again.", ["Technical Error"], False)
     
     @staticmethod
     def _detect_features(query: str) -> str:
         """Detect if query relates to a feature and return redirect link"""
-        query_lower = query.lower()
+        hits = query_keywords.scan_query(query)
         
         for feature_name, feature_config in ChatbotService.FEATURE_PATTERNS.items():
-            for keyword in feature_config["keywords"]:
-                if keyword in query_lower:
-                    logger.info(f"🔗 Feature detected: {feature_name}")
-                    return feature_config["message"]
+            if query_keywords.feature_category(feature_name) in hits:
+                logger.info(f"🔗 Feature detected: {feature_name}")
+                return feature_config["message"]
         
         return ""
     
     @staticmethod
-    async def _save_to_rag(query: str, response: str, session_id: str):
-        """Try to save response to RAG for future use (non-blocking)"""
+    def _save_to_rag(query: str, response: str, session_id: str):
+        """Queue the response for the knowledge base (written in the background)"""
         try:
-            from ai_career_advisor.RAG.retriever import retriever
-            await retriever.add_to_knowledge_base(
+            from ai_career_advisor.RAG.learned_writer import LearnedDocWriter
+            if LearnedDocWriter.enqueue(
                 query=query,
                 response=response,
                 metadata={
@@ -650,10 +960,10 @@ INSTRUCTIONS:
                     "session_id": session_id,
                     "timestamp": time.time()
                 }
-            )
-            logger.success("💾 Response saved to RAG")
+            ):
+                logger.debug("💾 Response queued for RAG")
         except Exception as e:
-            logger.warning(f"Could not save to RAG: {e}")
+            logger.warning(f"Could not queue response for RAG: {e}")
     
     @staticmethod
     async def _save_conversation(
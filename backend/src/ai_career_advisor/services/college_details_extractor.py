@@ -1,9 +1,8 @@
-import json
-import asyncio
-from functools import partial
 from ai_career_advisor.core.logger import logger
 from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.model_manager import ModelManager
+from ai_career_advisor.core.structured_output import StructuredOutputError
+from ai_career_advisor.Schemas.college import CollegeDetailsLLMOutput
 
 
 class CollegeStrictGeminiExtractor:
@@ -52,12 +51,7 @@ class CollegeStrictGeminiExtractor:
         Extract college details with retry logic
         """
         
-        # Perplexity configuration
-        PERPLEXITY_API_KEY = settings.PERPLEXITY_API_KEY or ""
-        PERPLEXITY_MODEL = "sonar-pro"
-
-
-        if not PERPLEXITY_API_KEY:
+        if not settings.PERPLEXITY_API_KEY:
             logger.error("❌ Perplexity API key missing")
             return {"error": "api_key_missing"}
 
@@ -149,66 +143,38 @@ IMPORTANT: Return ONLY the JSON object, no additional text.
 
 
         try:
-            import httpx
-
-
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": PERPLEXITY_MODEL,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are a precise data extraction assistant. Return ONLY valid JSON."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ]
-                    }
+            # Perplexity (web search) with its JSON-schema output; missing or empty
+            # critical fields get one repair call instead of a full re-extraction
+            try:
+                details = await ModelManager.generate_structured(
+                    prompt,
+                    CollegeDetailsLLMOutput,
+                    preference="sonar-pro",
+                    cache_namespace="college_details"
                 )
-                
-                if response.status_code != 200:
-                    logger.error(f"❌ Perplexity API error: {response.status_code} - {response.text}")
-                    return {"error": f"perplexity_api_error_{response.status_code}"}
-
-
-                data = response.json()
-                text = data["choices"][0]["message"]["content"].strip()
-                
-                # Clean markdown
-                if text.startswith("```"):
-                    text = text.replace("```json", "").replace("```", "").strip()
-
-
-                try:
-                    extracted = json.loads(text)
-                except json.JSONDecodeError:
+                extracted = details.model_dump(exclude_none=True)
+            except StructuredOutputError as e:
+                if not e.partial:
                     logger.error(f"❌ JSON parse failed for {college_name}")
                     return {"error": "invalid_json_after_retries", "partial_data": {}}
+                extracted = e.partial
 
 
-                # Validate completeness
-                is_complete, missing = CollegeStrictGeminiExtractor._is_data_complete(extracted)
-                
-                # Always return data, even if incomplete
-                if not is_complete:
-                    logger.warning(f"⚠️ Missing fields: {missing}")
-                    return {
-                        "warning": "incomplete_data",
-                        "missing_fields": missing, 
-                        "partial_data": extracted
-                    }
-
-
-                logger.success(f"✅ Success: Extracted all details for {college_name}")
-                return extracted
+            # Validate completeness
+            is_complete, missing = CollegeStrictGeminiExtractor._is_data_complete(extracted)
+            
+            # Always return data, even if incomplete
+            if not is_complete:
+                logger.warning(f"⚠️ Missing fields: {missing}")
+                return {
+                    "warning": "incomplete_data",
+                    "missing_fields": missing, 
+                    "partial_data": extracted
+                }
+
+
+            logger.success(f"✅ Success: Extracted all details for {college_name}")
+            return extracted
 
 
         except Exception as e:
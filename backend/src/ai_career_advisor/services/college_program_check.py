@@ -4,8 +4,11 @@ import asyncio
 from functools import partial
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from ai_career_advisor.models.college_program_cache import CollegeProgramCache
-import httpx
+from ai_career_advisor.core.single_flight import SingleFlight
+from ai_career_advisor.core.http_client import get_http_client, PERPLEXITY_CHAT_URL
+from ai_career_advisor.core.rate_limiter import RateLimiter
 import os
 
 
@@ -21,6 +24,9 @@ class CollegeProgramCheckService:
     PERPLEXITY_API_KEY = settings.PERPLEXITY_API_KEY or ""
     PERPLEXITY_MODEL = "sonar-pro"
     
+    # Concurrent checks for the same (college, degree, branch) share one LLM call
+    _check_flight = SingleFlight("college_program_check")
+    
     @classmethod
     async def check_with_cache(
         cls,
@@ -34,6 +40,56 @@ class CollegeProgramCheckService:
         Check if college offers program, using cache first
         """
         # Check cache first
+        cached = await cls._get_cached(db, college_id, college_name, degree, branch)
+        if cached is not None:
+            return cached
+        
+        # Not in cache, check using LLM
+        offers_program = await cls._check_coalesced(college_id, college_name, degree, branch)
+        
+        # Save to cache (will be committed at endpoint level)
+        await cls._save_result(db, college_id, college_name, degree, branch, offers_program)
+        return offers_program
+    
+    @classmethod
+    async def check_many_with_cache(
+        cls,
+        db: AsyncSession,
+        colleges: list,
+        degree: str,
+        branch: str
+    ) -> list[bool]:
+        """
+        Check several colleges for the same program, using cache first
+        
+        The LLM checks run concurrently, but the session is only touched
+        sequentially (lookups before, inserts after the gather): an AsyncSession
+        must not be shared by concurrent coroutines.
+        """
+        results: list[bool | None] = []
+        for college in colleges:
+            results.append(await cls._get_cached(db, college.id, college.name, degree, branch))
+        
+        misses = [i for i, cached in enumerate(results) if cached is None]
+        checked = await asyncio.gather(*[
+            cls._check_coalesced(colleges[i].id, colleges[i].name, degree, branch)
+            for i in misses
+        ])
+        
+        for i, offers_program in zip(misses, checked):
+            results[i] = offers_program
+            await cls._save_result(db, colleges[i].id, colleges[i].name, degree, branch, offers_program)
+        
+        return results
+    
+    @staticmethod
+    async def _get_cached(
+        db: AsyncSession,
+        college_id: int,
+        college_name: str,
+        degree: str,
+        branch: str
+    ) -> bool | None:
         result = await db.execute(
             select(CollegeProgramCache).where(
                 CollegeProgramCache.college_id == college_id,
@@ -46,26 +102,44 @@ class CollegeProgramCheckService:
         if cached:
             logger.debug(f"💾 Cache hit: {college_name} - {degree} {branch} = {cached.offers_program}")
             return cached.offers_program
-        
-        # Not in cache, check using LLM
+        return None
+    
+    @classmethod
+    async def _check_coalesced(cls, college_id: int, college_name: str, degree: str, branch: str) -> bool:
         logger.debug(f"🔍 Cache miss: Checking {college_name} - {degree} {branch}")
-        offers_program = await cls.check(
-            college_name=college_name,
-            degree=degree,
-            branch=branch
-        )
-        
-        # Save to cache (will be committed at endpoint level)
-        cache_entry = CollegeProgramCache(
-            college_id=college_id,
-            degree=degree,
-            branch=branch,
-            offers_program=offers_program
+        return await cls._check_flight.do(
+            (college_id, degree, branch),
+            lambda: cls.check(
+                college_name=college_name,
+                degree=degree,
+                branch=branch
+            )
         )
-        db.add(cache_entry)
+    
+    @staticmethod
+    async def _save_result(
+        db: AsyncSession,
+        college_id: int,
+        college_name: str,
+        degree: str,
+        branch: str,
+        offers_program: bool
+    ):
+        # Savepoint + unique constraint: another request may have inserted it already.
+        # Callers must not run this concurrently on one session.
+        try:
+            async with db.begin_nested():
+                db.add(CollegeProgramCache(
+                    college_id=college_id,
+                    degree=degree,
+                    branch=branch,
+                    offers_program=offers_program
+                ))
+        except IntegrityError:
+            logger.debug(f"💾 Cache row already exists: {college_name} - {degree} {branch}")
+            return
         
         logger.success(f"💾 Cached result: {college_name} - {offers_program}")
-        return offers_program
     
     @classmethod
     async def check(cls, *, college_name: str, degree: str, branch: str) -> bool:
@@ -108,9 +182,10 @@ Answer:"""
             return None
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            client = get_http_client(PERPLEXITY_CHAT_URL)
+            async with RateLimiter.permit("perplexity", cls.PERPLEXITY_API_KEY, cls.PERPLEXITY_MODEL) as permit:
                 response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
+                    PERPLEXITY_CHAT_URL,
                     headers={
                         "Authorization": f"Bearer {cls.PERPLEXITY_API_KEY}",
                         "Content-Type": "application/json"
@@ -127,19 +202,21 @@ Answer:"""
                                 "content": prompt
                             }
                         ]
-                    }
+                    },
+                    timeout=30.0
                 )
+                permit.observe_status(response.status_code, response.headers.get("retry-after"))
+            
+            if response.status_code == 200:
+                data = response.json()
+                answer = data["choices"][0]["message"]["content"].strip().lower()
+                result = "true" in answer
+                logger.debug(f"✅ Perplexity Sonar Pro: {result}")
+                return result
+            else:
+                logger.error(f"❌ Perplexity API error: {response.status_code}")
+                return None
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    answer = data["choices"][0]["message"]["content"].strip().lower()
-                    result = "true" in answer
-                    logger.debug(f"✅ Perplexity Sonar Pro: {result}")
-                    return result
-                else:
-                    logger.error(f"❌ Perplexity API error: {response.status_code}")
-                    return None
-                    
         except Exception as e:
             logger.error(f"❌ Perplexity error: {e}")
             return None
@@ -1,7 +1,8 @@
 import json
 from ai_career_advisor.core.config import settings
 from ai_career_advisor.core.logger import logger
-import httpx
+from ai_career_advisor.core.http_client import get_http_client, PERPLEXITY_CHAT_URL
+from ai_career_advisor.core.rate_limiter import RateLimiter
 from datetime import datetime
 
 
@@ -74,9 +75,10 @@ RULES:
 """
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            client = get_http_client(PERPLEXITY_CHAT_URL)
+            async with RateLimiter.permit("perplexity", PERPLEXITY_API_KEY, PERPLEXITY_MODEL) as permit:
                 response = await client.post(
-                    "https://api.perplexity.ai/chat/completions",
+                    PERPLEXITY_CHAT_URL,
                     headers={
                         "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
                         "Content-Type": "application/json"
@@ -93,23 +95,25 @@ RULES:
                                 "content": prompt
                             }
                         ]
-                    }
+                    },
+                    timeout=60.0
                 )
-                
-                if response.status_code != 200:
-                    logger.error(f"❌ Perplexity API error: {response.status_code}")
-                    return {"error": f"api_error_{response.status_code}"}
-                
-                data = response.json()
-                text = data["choices"][0]["message"]["content"].strip()
-                
-                # Clean markdown
-                if text.startswith("```"):
-                    text = text.replace("```json", "").replace("```", "").strip()
-                
-                exam_data = json.loads(text)
-                logger.success(f"Found exam: {exam_data.get('exam_name')}")
-                return exam_data
+                permit.observe_status(response.status_code, response.headers.get("retry-after"))
+            
+            if response.status_code != 200:
+                logger.error(f"❌ Perplexity API error: {response.status_code}")
+                return {"error": f"api_error_{response.status_code}"}
+            
+            data = response.json()
+            text = data["choices"][0]["message"]["content"].strip()
+            
+            # Clean markdown
+            if text.startswith("```"):
+                text = text.replace("```json", "").replace("```", "").strip()
+            
+            exam_data = json.loads(text)
+            logger.success(f"Found exam: {exam_data.get('exam_name')}")
+            return exam_data
         
         except Exception as e:
             logger.error(f"Error fetching exam data: {e}")
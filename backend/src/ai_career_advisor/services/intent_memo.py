@@ -0,0 +1,108 @@
+"""
+Intent Result Memo
+Bounded LRU of IntentFilterML results keyed by normalized query text, so repeated
+short messages ("hi", "best iit", "jee mains cutoff") skip the greeting/blacklist
+scans and the transformer forward pass
+"""
+
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from ai_career_advisor.core.config import settings
+
+
+# Zero-width joiners/spaces are common in Devanagari input and change nothing
+_ZERO_WIDTH = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff"), None)
+_REPEATED_CHARS = re.compile(r"(\w)\1{2,}")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.,।]+$")
+
+# Romanized Hindi spelling variants -> one spelling (only words with no English meaning)
+HINGLISH_VARIANTS = {
+    "kese": "kaise", "kaisey": "kaise", "kaisay": "kaise",
+    "kyaa": "kya", "kyu": "kyun", "kyon": "kyun",
+    "bnu": "banu", "bnna": "banna",
+    "krna": "karna", "krne": "karne", "krke": "karke",
+    "padai": "padhai", "parhai": "padhai",
+    "chahie": "chahiye", "chaiye": "chahiye", "chahiya": "chahiye",
+    "lye": "liye",
+    "konsa": "kaunsa", "konsi": "kaunsi", "kon": "kaun",
+}
+
+
+def normalize_query(query: str) -> str:
+    """
+    Memo key for a query
+    NFKC + casefold, zero-width characters removed, "hiiii" -> "hii",
+    trailing punctuation dropped, whitespace collapsed, Hinglish spellings unified
+    """
+    text = unicodedata.normalize("NFKC", query or "").translate(_ZERO_WIDTH).casefold()
+    text = _REPEATED_CHARS.sub(r"\1\1", text)
+    text = _TRAILING_PUNCTUATION.sub("", text)
+    return " ".join(HINGLISH_VARIANTS.get(word, word) for word in text.split())
+
+
+class IntentMemo:
+    """
+    Thread-safe LRU (sync callers run on the intent pool, async ones on the loop)
+    - Entries belong to one model version; storing under a new version clears the rest
+    - Hits/misses are reported to ModelMonitor as the "intent_memo" cache
+    """
+
+    CACHE_NAME = "intent_memo"
+
+    _entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    _version: Optional[str] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _report(hit: bool):
+        from ai_career_advisor.services.monitoring_service import monitor
+        monitor.log_cache_lookup(IntentMemo.CACHE_NAME, hit)
+
+    @classmethod
+    def get(cls, query: str, version: str) -> Optional[Dict[str, Any]]:
+        if not settings.INTENT_MEMO_ENABLED:
+            return None
+
+        key = normalize_query(query)
+        with cls._lock:
+            result = cls._entries.get(key) if version == cls._version else None
+            if result is not None:
+                cls._entries.move_to_end(key)
+        cls._report(result is not None)
+        return dict(result) if result is not None else None
+
+    @classmethod
+    def put(cls, query: str, version: str, result: Dict[str, Any]):
+        if not settings.INTENT_MEMO_ENABLED:
+            return
+
+        key = normalize_query(query)
+        with cls._lock:
+            if version != cls._version:
+                cls._entries.clear()
+                cls._version = version
+            cls._entries[key] = dict(result)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > settings.INTENT_MEMO_MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._version = None
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        from ai_career_advisor.services.monitoring_service import monitor
+        return {
+            "enabled": settings.INTENT_MEMO_ENABLED,
+            "entries": len(cls._entries),
+            "max_entries": settings.INTENT_MEMO_MAX_ENTRIES,
+            "model_version": cls._version,
+            **monitor.get_cache_metrics().get(cls.CACHE_NAME, {})
+        }
@@ -23,9 +23,13 @@ are understood as similar queries even though they use different words."
 """
 
 from ai_career_advisor.core.config import settings
+from ai_career_advisor.core.executors import run_intent
 from ai_career_advisor.core.logger import logger
-from typing import Dict, Any, Optional
+from ai_career_advisor.services.intent_memo import IntentMemo, normalize_query
+from ai_career_advisor.services import query_keywords
+from typing import Dict, Any, List, Optional, Tuple
 import os
+import threading
 from pathlib import Path
 
 
@@ -33,6 +37,10 @@ from pathlib import Path
 _ml_model_available = False
 _intent_classifier = None
 
+# Concurrent first requests must not load the model twice
+_load_lock = threading.Lock()
+_load_attempted = False
+
 
 def _load_ml_model():
     """
@@ -43,23 +51,40 @@ def _load_ml_model():
     - Loading takes time (1-2 seconds)
     - Only load when first needed
     - Faster server startup
+    - Attempted once per process (under a lock); a failed load keeps the
+      rule-based fallback instead of retrying on every message
     """
-    global _ml_model_available, _intent_classifier
+    global _ml_model_available, _intent_classifier, _load_attempted
     
-    try:
-        from ai_career_advisor.ml_models.intent_classifier import get_intent_classifier
-        model_path = Path(__file__).parent.parent / "models" / "intent_classifier"
-        
-        if model_path.exists():
-            _intent_classifier = get_intent_classifier()
-            _ml_model_available = True
-            logger.info("✅ ML Intent Classifier loaded successfully")
-        else:
-            logger.warning("⚠️ No trained ML model found, using rule-based fallback")
+    with _load_lock:
+        if _load_attempted:
+            return
+        
+        try:
+            from ai_career_advisor.ml_models.intent_classifier import get_intent_classifier
+            model_path = Path(__file__).parent.parent / "models" / "intent_classifier"
+            
+            if model_path.exists():
+                _intent_classifier = get_intent_classifier()
+                _ml_model_available = True
+                logger.info("✅ ML Intent Classifier loaded successfully")
+            else:
+                logger.warning("⚠️ No trained ML model found, using rule-based fallback")
+                _ml_model_available = False
+        except Exception as e:
+            logger.error(f"❌ Failed to load ML model: {e}")
             _ml_model_available = False
-    except Exception as e:
-        logger.error(f"❌ Failed to load ML model: {e}")
-        _ml_model_available = False
+        finally:
+            _load_attempted = True
+
+
+def _model_version() -> str:
+    """Version tag for memoized results ("rules" when the model is unavailable)"""
+    if not _load_attempted:
+        return "unloaded"
+    if _ml_model_available and _intent_classifier is not None:
+        return getattr(_intent_classifier, "version", "ml")
+    return "rules"
 
 
 class IntentFilterML:
@@ -90,17 +115,10 @@ class IntentFilterML:
     └───────────────┘
     """
     
-    # Greetings that should get a friendly response
-    GREETINGS = [
-        "hi", "hello", "hey", "namaste", "hii", "helo", "hola",
-        "good morning", "good afternoon", "good evening",
-        "kaise ho", "how are you", "what's up", "sup"
-    ]
-    
-    # Inappropriate content blocklist
-    BLACKLIST_KEYWORDS = [
-        "porn", "sex", "nude", "adult", "xxx", "nsfw",
-    ]
+    # Keyword lists live in query_keywords (one compiled matcher for all of them)
+    GREETINGS = query_keywords.GREETINGS
+    BLACKLIST_KEYWORDS = query_keywords.BLACKLIST_KEYWORDS
+    CAREER_KEYWORDS = query_keywords.CAREER_KEYWORDS
     
     # ML intent to career-related mapping
     CAREER_INTENTS = [
@@ -114,11 +132,16 @@ class IntentFilterML:
     
     NON_CAREER_INTENTS = ["off_topic"]
     
+    # Shared by concurrent async callers (see is_career_related_async)
+    _batcher = None
+    
     @staticmethod
     def is_career_related(query: str) -> Dict[str, Any]:
         """
         Main intent classification using ML model with rule-based fallback
         
+        Results are memoized by normalized query text (see intent_memo)
+        
         Returns: {
             "is_career": bool,
             "confidence": float,
@@ -127,10 +150,165 @@ class IntentFilterML:
             "intent": str (optional, only with ML)
         }
         """
+        cached = IntentMemo.get(query, _model_version())
+        if cached is not None:
+            return cached
+        
+        result, memoizable = IntentFilterML._classify(query)
+        if memoizable:
+            IntentMemo.put(query, _model_version(), result)
+        return result
+    
+    @staticmethod
+    def _classify(query: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        is_career_related() without the memo
+        
+        Returns (result, memoizable); a rule result that stands in for a failed
+        ML prediction is not memoizable (it would outlive the transient error)
+        """
+        global _ml_model_available, _intent_classifier
+        
+        # Rules see the same normalized text the memo is keyed by
+        query_lower = normalize_query(query)
+        
+        # STEP 1-2: validation, greetings, blacklist (no model needed)
+        quick = IntentFilterML._quick_check(query_lower)
+        if quick is not None:
+            return quick, True
+        
+        # STEP 3: Try ML classification
+        if not _ml_model_available and _intent_classifier is None:
+            _load_ml_model()
+        
+        if _ml_model_available and _intent_classifier is not None:
+            try:
+                intent, confidence = _intent_classifier.predict(query)
+                return IntentFilterML._from_prediction(query_lower, intent, confidence), True
+            except Exception as e:
+                logger.error(f"❌ ML prediction failed: {e}")
+                return IntentFilterML._rule_based_check(query_lower), False
+        
+        # STEP 4: Rule-based fallback (same as original IntentFilter)
+        return IntentFilterML._rule_based_check(query_lower), True
+    
+    @staticmethod
+    def _get_batcher():
+        if IntentFilterML._batcher is None:
+            from ai_career_advisor.core.micro_batcher import MicroBatcher
+            IntentFilterML._batcher = MicroBatcher(
+                IntentFilterML._classify_batch,
+                max_batch_size=settings.INTENT_BATCH_SIZE,
+                max_wait_ms=settings.INTENT_BATCH_MAX_WAIT_MS,
+                name="intent",
+                runner=run_intent
+            )
+        return IntentFilterML._batcher
+    
+    @staticmethod
+    async def is_career_related_async(query: str) -> Dict[str, Any]:
+        """
+        is_career_related() for async code - never blocks the event loop
+        
+        - Validation / greeting / blacklist checks run inline (no model)
+        - Model loading and DistilBERT inference run on the dedicated intent pool
+        - Concurrent requests are micro-batched into one forward pass
+        - Memo hits return without leaving the event loop
+        """
+        cached = IntentMemo.get(query, _model_version())
+        if cached is not None:
+            return cached
+        
+        result, memoizable = IntentFilterML._quick_check(normalize_query(query)), True
+        if result is None:
+            if settings.INTENT_BATCHING_ENABLED:
+                result, memoizable = await IntentFilterML._get_batcher().submit(query)
+            else:
+                result, memoizable = await run_intent(IntentFilterML._classify, query)
+        if memoizable:
+            IntentMemo.put(query, _model_version(), result)
+        # Identical concurrent queries share one result dict
+        return dict(result)
+    
+    @staticmethod
+    def get_batcher_stats() -> Dict[str, Any]:
+        return {
+            "enabled": settings.INTENT_BATCHING_ENABLED,
+            "model_loaded": _ml_model_available,
+            **(IntentFilterML._batcher.get_stats() if IntentFilterML._batcher else {})
+        }
+    
+    @staticmethod
+    def classify_batch(queries: List[str], batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        is_career_related() for many queries with one batched model pass
+        
+        Memoized queries are answered first; the rest go through _classify_batch
+        together. Results are in the same order as queries.
+        """
+        version = _model_version()
+        results: List[Optional[Dict[str, Any]]] = [IntentMemo.get(query, version) for query in queries]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+        
+        classified = IntentFilterML._classify_batch([queries[i] for i in missing], batch_size)
+        version = _model_version()
+        for i, (result, memoizable) in zip(missing, classified):
+            if memoizable:
+                IntentMemo.put(queries[i], version, result)
+            results[i] = result
+        return results
+    
+    @staticmethod
+    def _classify_batch(queries: List[str], batch_size: Optional[int] = None) -> List[Tuple[Dict[str, Any], bool]]:
+        """
+        classify_batch() without the memo
+        
+        Greetings/blacklist/validation are resolved per query; the remaining
+        queries go through IntentClassifier.predict_batch together.
+        Returns (result, memoizable) pairs, as _classify() does.
+        """
         global _ml_model_available, _intent_classifier
         
-        query_lower = query.lower().strip()
+        results: List[Optional[Tuple[Dict[str, Any], bool]]] = []
+        pending: List[int] = []
+        for query in queries:
+            quick = IntentFilterML._quick_check(normalize_query(query))
+            results.append(None if quick is None else (quick, True))
+            if quick is None:
+                pending.append(len(results) - 1)
+        
+        if not pending:
+            return results
+        
+        if not _ml_model_available and _intent_classifier is None:
+            _load_ml_model()
         
+        predictions = None
+        ml_failed = False
+        if _ml_model_available and _intent_classifier is not None:
+            try:
+                predictions = _intent_classifier.predict_batch(
+                    [queries[i] for i in pending], batch_size=batch_size
+                )
+            except Exception as e:
+                logger.error(f"❌ ML batch prediction failed: {e}")
+                ml_failed = True
+        
+        for n, i in enumerate(pending):
+            query_lower = normalize_query(queries[i])
+            if predictions is not None:
+                intent, confidence = predictions[n]
+                results[i] = (IntentFilterML._from_prediction(query_lower, intent, confidence), True)
+            else:
+                results[i] = (IntentFilterML._rule_based_check(query_lower), not ml_failed)
+        
+        return results
+    
+    @staticmethod
+    def _quick_check(query_lower: str) -> Optional[Dict[str, Any]]:
+        """Validation, greeting and blacklist checks (None = needs classification)"""
         # Basic validation
         if len(query_lower) < 2:
             return {
@@ -140,10 +318,12 @@ class IntentFilterML:
                 "reason": "Query too short"
             }
         
-        # STEP 1: Check for greetings (quick check before ML)
-        for greeting in IntentFilterML.GREETINGS:
-            if query_lower == greeting or query_lower.startswith(greeting + " "):
-                logger.info(f"✋ Greeting detected: {greeting}")
+        hits = query_keywords.scan(query_lower)
+        
+        # Check for greetings (quick check before ML): the query starts with one
+        for hit in hits.get("greeting"):
+            if hit.start == 0 and (hit.end == len(query_lower) or query_lower[hit.end] == " "):
+                logger.info(f"✋ Greeting detected: {hit.pattern}")
                 return {
                     "is_career": True,
                     "confidence": 1.0,
@@ -153,81 +333,59 @@ class IntentFilterML:
                     "intent": "greeting"
                 }
         
-        # STEP 2: Check blacklist (safety check)
-        for keyword in IntentFilterML.BLACKLIST_KEYWORDS:
-            if keyword in query_lower:
-                logger.warning(f"🚫 Blacklist keyword found: {keyword}")
-                return {
-                    "is_career": False,
-                    "confidence": 1.0,
-                    "method": "blacklist",
-                    "reason": f"Blocked keyword: {keyword}",
-                    "intent": "blocked"
-                }
+        # Check blacklist (safety check, whole words: "Sussex" is not blocked)
+        keyword = hits.first("blacklist")
+        if keyword:
+            logger.warning(f"🚫 Blacklist keyword found: {keyword}")
+            return {
+                "is_career": False,
+                "confidence": 1.0,
+                "method": "blacklist",
+                "reason": f"Blocked keyword: {keyword}",
+                "intent": "blocked"
+            }
         
-        # STEP 3: Try ML classification
-        if not _ml_model_available and _intent_classifier is None:
-            _load_ml_model()
+        return None
+    
+    @staticmethod
+    def _from_prediction(query_lower: str, intent: str, confidence: float) -> Dict[str, Any]:
+        """Turn an ML prediction into a result (rule-based fallback if not confident)"""
+        logger.info(f"🤖 ML prediction: {intent} ({confidence:.2%})")
         
-        if _ml_model_available and _intent_classifier is not None:
-            try:
-                intent, confidence = _intent_classifier.predict(query)
-                
-                logger.info(f"🤖 ML prediction: {intent} ({confidence:.2%})")
-                
-                # High confidence ML prediction
-                if confidence >= 0.7:
-                    is_career = intent in IntentFilterML.CAREER_INTENTS
-                    is_greeting = intent == "greeting"
-                    is_farewell = intent == "farewell"
-                    
-                    return {
-                        "is_career": is_career or is_greeting or is_farewell,
-                        "confidence": confidence,
-                        "method": "ml",
-                        "reason": f"ML classified as {intent}",
-                        "intent": intent,
-                        "is_greeting": is_greeting,
-                        "is_farewell": is_farewell
-                    }
-                else:
-                    # Low confidence - fall through to rule-based
-                    logger.info(f"⚠️ ML confidence low ({confidence:.2%}), using rules")
-                    
-            except Exception as e:
-                logger.error(f"❌ ML prediction failed: {e}")
+        # High confidence ML prediction
+        if confidence >= 0.7:
+            is_career = intent in IntentFilterML.CAREER_INTENTS
+            is_greeting = intent == "greeting"
+            is_farewell = intent == "farewell"
+            
+            return {
+                "is_career": is_career or is_greeting or is_farewell,
+                "confidence": confidence,
+                "method": "ml",
+                "reason": f"ML classified as {intent}",
+                "intent": intent,
+                "is_greeting": is_greeting,
+                "is_farewell": is_farewell
+            }
         
-        # STEP 4: Rule-based fallback (same as original IntentFilter)
+        # Low confidence - fall through to rule-based
+        logger.info(f"⚠️ ML confidence low ({confidence:.2%}), using rules")
         return IntentFilterML._rule_based_check(query_lower)
     
     @staticmethod
     def _rule_based_check(query_lower: str) -> Dict[str, Any]:
         """Rule-based fallback classification"""
         
-        CAREER_KEYWORDS = [
-            "college", "university", "iit", "nit", "aiims", "school", "degree",
-            "btech", "bsc", "mba", "mbbs", "engineering", "medical", "commerce",
-            "science", "arts", "diploma", "phd", "masters", "bachelor",
-            "jee", "neet", "gate", "cat", "upsc", "ssc", "exam", "entrance",
-            "cuet", "clat", "nda", "cds", "ias", "ips", "test", "cutoff",
-            "career", "job", "salary", "placement", "package", "internship",
-            "engineer", "doctor", "teacher", "lawyer", "ca", "cs", "software",
-            "developer", "data scientist", "analyst", "manager", "consultant",
-            "course", "stream", "branch", "admission", "eligibility", "fees",
-            "scholarship", "counseling", "guidance", "roadmap", "preparation",
-            "study", "skill", "training", "certification", "after 10th", "after 12th"
-        ]
-        
-        for keyword in CAREER_KEYWORDS:
-            if keyword in query_lower:
-                logger.info(f"✅ Rule matched keyword: {keyword}")
-                return {
-                    "is_career": True,
-                    "confidence": 0.85,
-                    "method": "keyword",
-                    "reason": f"Career keyword: {keyword}",
-                    "intent": "career_query"
-                }
+        keyword = query_keywords.scan(query_lower).first("career")
+        if keyword:
+            logger.info(f"✅ Rule matched keyword: {keyword}")
+            return {
+                "is_career": True,
+                "confidence": 0.85,
+                "method": "keyword",
+                "reason": f"Career keyword: {keyword}",
+                "intent": "career_query"
+            }
         
         # Default - allow (better to answer than reject)
         logger.info(f"🤔 No clear match, allowing as potential career query")
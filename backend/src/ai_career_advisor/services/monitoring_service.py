@@ -1,13 +1,14 @@
 import statistics
-from typing import List, Deque
+import threading
+from typing import Any, Dict, List, Deque
 from collections import deque
 from ai_career_advisor.core.logger import logger
-import mlflow
 
 class ModelMonitor:
     """
     MLOps Monitoring Service
     Tracks model performance in production (Confidence Drift)
+    and hit rates of the in-process caches in front of the models
     """
     
     # Singleton instance
@@ -28,6 +29,10 @@ class ModelMonitor:
         self.CONFIDENCE_THRESHOLD = 0.75
         self.UNKNOWN_RATIO_THRESHOLD = 0.15
         
+        # cache name -> {"hits": n, "misses": n}
+        self.cache_stats: Dict[str, Dict[str, int]] = {}
+        self._cache_lock = threading.Lock()
+        
         logger.info("🛡️ Model Monitor Service Initialized")
 
     def log_prediction(self, intent: str, confidence: float, query_length: int):
@@ -68,15 +73,33 @@ class ModelMonitor:
             logger.warning(f"⚠️ MLOps ALERT: Unknown Intent Spike! Ratio: {unknown_ratio:.2%} (Threshold: {self.UNKNOWN_RATIO_THRESHOLD})")
             logger.warning("   -> Action: Analyze rejected queries for new features")
             
+    def log_cache_lookup(self, name: str, hit: bool):
+        """Count a hit or miss for a named cache"""
+        with self._cache_lock:
+            stats = self.cache_stats.setdefault(name, {"hits": 0, "misses": 0})
+            stats["hits" if hit else "misses"] += 1
+    
+    def get_cache_metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._cache_lock:
+            return {
+                name: {
+                    **stats,
+                    "hit_rate": round(stats["hits"] / (stats["hits"] + stats["misses"]), 4)
+                    if stats["hits"] + stats["misses"] else 0.0
+                }
+                for name, stats in self.cache_stats.items()
+            }
+    
     def get_metrics(self):
         """Get current metrics for admin dashboard"""
         if not self.confidence_window:
-            return {"status": "waiting_for_data"}
+            return {"status": "waiting_for_data", "caches": self.get_cache_metrics()}
             
         return {
             "avg_confidence": statistics.mean(self.confidence_window),
             "sample_size": len(self.confidence_window),
-            "unknown_ratio": (self.intent_window.count("unknown") / len(self.intent_window)) if self.intent_window else 0
+            "unknown_ratio": (self.intent_window.count("unknown") / len(self.intent_window)) if self.intent_window else 0,
+            "caches": self.get_cache_metrics()
         }
 
 # Global instance
@@ -0,0 +1,113 @@
+"""
+Query Keyword Lists
+Every keyword list the chatbot routes on (greetings, blocklist, career rules,
+roadmap override, Hinglish detection, feature links), compiled into ONE
+Aho–Corasick automaton at import. scan() returns all category hits of a
+query in a single pass and is cached, so the intent filter and the chatbot
+share the work for the same message.
+"""
+
+from functools import lru_cache
+
+from ai_career_advisor.core.keyword_matcher import KeywordHits, KeywordMatcher
+from ai_career_advisor.services.intent_memo import normalize_query
+
+
+# Greetings that should get a friendly response
+GREETINGS = [
+    "hi", "hello", "hey", "namaste", "hii", "helo", "hola",
+    "good morning", "good afternoon", "good evening",
+    "kaise ho", "how are you", "what's up", "sup"
+]
+
+# Inappropriate content blocklist (prefix match: "porn" also blocks "pornography")
+BLACKLIST_KEYWORDS = [
+    "porn", "sex", "nude", "adult", "xxx", "nsfw",
+]
+
+# Rule-based fallback: any of these makes a query career-related
+CAREER_KEYWORDS = [
+    "college", "university", "iit", "nit", "aiims", "school", "degree",
+    "btech", "bsc", "mba", "mbbs", "engineering", "medical", "commerce",
+    "science", "arts", "diploma", "phd", "masters", "bachelor",
+    "jee", "neet", "gate", "cat", "upsc", "ssc", "exam", "entrance",
+    "cuet", "clat", "nda", "cds", "ias", "ips", "test", "cutoff",
+    "career", "job", "salary", "placement", "package", "internship",
+    "engineer", "doctor", "teacher", "lawyer", "ca", "cs", "software",
+    "developer", "data scientist", "analyst", "manager", "consultant",
+    "course", "stream", "branch", "admission", "eligibility", "fees",
+    "scholarship", "counseling", "guidance", "roadmap", "preparation",
+    "study", "skill", "training", "certification", "after 10th", "after 12th"
+]
+
+# "I want to become X" queries are routed to the roadmap feature
+# (ML model sometimes classifies these as career_query instead of roadmap_request)
+ROADMAP_KEYWORDS = [
+    "want to become", "wanna become", "become a", "become an",
+    "how to become", "kaise bane", "kaise banu", "banna hai",
+    "banna chahta", "banna chahti", "roadmap", "path to become",
+    "steps to become", "guide to become"
+]
+
+# Romanized Hindi words; 2+ of them = Hinglish query
+HINDI_WORDS = [
+    "kya", "kaise", "hai", "hoon", "mujhe", "batao", "bata", "karo",
+    "chahiye", "karenge", "hoga", "hogi", "karna", "padhna", "padhai",
+    "kaun", "konsa", "kaunsa", "baad", "pehle", "accha", "theek", "sahi"
+]
+
+# Feature patterns for recommending app features (checked in this order)
+FEATURE_PATTERNS = {
+    "stream": {
+        "keywords": ["stream", "which stream", "science or commerce", "arts or science", "10th ke baad", "after 10th", "stream select", "konsa stream"],
+        "link": "/stream-finder",
+        "message": "\n\n🎯 **Want personalized stream recommendation?**\n👉 [Click here to use our Stream Finder](/stream-finder)"
+    },
+    "roadmap": {
+        "keywords": [
+            "roadmap", "how to become", "become a", "become an", "want to become",
+            "kaise bane", "kaise banu", "banna hai", "banna chahta",
+            "career path", "step by step", "guide to become", "steps to become",
+            "what after 12th", "12th ke baad", "after 12th", "after graduation",
+            "software engineer", "data scientist", "doctor", "lawyer", "ca", "chartered accountant",
+            "engineer", "developer", "designer", "manager"
+        ],
+        "link": "/roadmap/backward",
+        "message": "\n\n🗺️ **Get a detailed career roadmap!**\n👉 [Generate your personalized roadmap here](/roadmap/backward)"
+    },
+    "college": {
+        "keywords": ["college find", "find college", "best college", "top college", "college for", "iit admission", "nit admission", "bits", "college recommendation"],
+        "link": "/colleges",
+        "message": "\n\n🏫 **Looking for the perfect college?**\n👉 [Use our College Finder tool](/colleges)"
+    }
+}
+
+
+def feature_category(feature_name: str) -> str:
+    return f"feature:{feature_name}"
+
+
+MATCHER = KeywordMatcher(
+    {
+        "greeting": GREETINGS,
+        "blacklist": BLACKLIST_KEYWORDS,
+        "career": CAREER_KEYWORDS,
+        "roadmap": ROADMAP_KEYWORDS,
+        "hindi": HINDI_WORDS,
+        **{feature_category(name): config["keywords"] for name, config in FEATURE_PATTERNS.items()}
+    },
+    prefix_categories=["blacklist"],
+    # Same normalization as the text being scanned (and the intent memo key)
+    normalize=normalize_query
+)
+
+
+@lru_cache(maxsize=1024)
+def scan(normalized_text: str) -> KeywordHits:
+    """All keyword hits for text already passed through normalize_query()"""
+    return MATCHER.scan(normalized_text)
+
+
+def scan_query(query: str) -> KeywordHits:
+    """All keyword hits for a raw user query"""
+    return scan(normalize_query(query))
@@ -6,89 +6,79 @@ from datetime import datetime
 
 class KnowledgeBaseScheduler:
     """
-    Automated weekly knowledge base re-indexing
-    Runs every Sunday at 2:00 AM IST
+    Automated knowledge base re-indexing
+    - Nightly incremental sync at 2:00 AM IST (rows changed since the last run)
+    - Blue/green full rebuild every Sunday at 3:00 AM IST
     """
     
     def __init__(self):
         self.scheduler = AsyncIOScheduler(timezone="Asia/Kolkata")
         self.is_running = False
+        self.last_result: dict = {}
+        self.progress: dict = {}
     
-    async def reindex_knowledge_base(self):
-        """Re-index entire knowledge base with latest data"""
+    async def reindex_knowledge_base(self, full: bool = False):
+        """
+        Re-index the knowledge base without taking RAG offline
+        - Incremental (default): only new/changed documents are re-embedded into
+          the live collection, deleted rows are removed, llm_* documents are kept
+        - Full: blue/green rebuild into career_knowledge_v{n}, smoke test, then
+          the alias used by RAGRetriever flips (previous version kept for rollback)
+        """
+        if self.progress.get("status") == "running":
+            logger.warning(" Re-indexing already in progress, skipping")
+            return
+        
+        self.progress = {
+            "status": "running",
+            "mode": "blue_green" if full else "incremental",
+            "stage": "starting",
+            "started_at": datetime.now().isoformat()
+        }
         try:
             logger.info("=" * 60)
-            logger.info(" SCHEDULED RE-INDEXING STARTED")
+            logger.info(f" SCHEDULED {'FULL ' if full else ''}RE-INDEXING STARTED")
             logger.info(f" Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S IST')}")
             logger.info("=" * 60)
             
             
-            from ai_career_advisor.RAG.knowledge_loader import KnowledgeLoader
-            from ai_career_advisor.RAG.embeddings import EmbeddingService
             from ai_career_advisor.RAG.vector_store import VectorStore
+            from ai_career_advisor.RAG.index_sync import KnowledgeIndexSync
             
-            logger.info("\n  Deleting old index...")
             vs = VectorStore()
-            try:
-                vs.delete_collection("career_knowledge")
-                logger.success(" Old index deleted")
-            except:
-                logger.info(" No old index found")
-            
-            
-            logger.info("\n Loading latest data from database...")
-            documents = await KnowledgeLoader.load_all()
-            
-            if not documents:
-                logger.error(" No documents found!")
-                return
-            
-            logger.success(f" Loaded {len(documents)} documents")
-            
-            
-            logger.info("\n Generating embeddings...")
-            texts = [doc["content"] for doc in documents]
-            embeddings = await EmbeddingService.generate_batch_embeddings(texts)
-            
-            valid_count = len([e for e in embeddings if e is not None])
-            logger.success(f" Generated {valid_count}/{len(texts)} embeddings")
-            
-            
-            logger.info("\n Storing in ChromaDB...")
-            collection = vs.get_or_create_collection("career_knowledge")
-            
-            ids = [doc["id"] for doc in documents]
-            metadatas = [doc["metadata"] for doc in documents]
-            
-            vs.add_documents(
-                collection=collection,
-                documents=texts,
-                embeddings=embeddings,
-                metadatas=metadatas,
-                ids=ids
-            )
-            
-            logger.success(f" Stored {valid_count} documents")
             
-            
-            logger.info("\n Testing...")
-            test_query = "IIT Bombay fees"
-            query_emb = await EmbeddingService.generate_query_embedding(test_query)
-            results = vs.search(collection, query_emb, top_k=1)
-            
-            if results['documents'][0]:
-                logger.success(" Search test passed")
+            if full:
+                stats = await KnowledgeIndexSync.rebuild(vs, "career_knowledge", progress=self.progress)
+            else:
+                collection = vs.get_or_create_collection(vs.resolve_alias("career_knowledge"))
+                self.progress["collection"] = collection.name
+                stats = await KnowledgeIndexSync.sync(vs, collection, progress=self.progress)
+                
+                logger.info("\n Testing...")
+                if await KnowledgeIndexSync.smoke_test(vs, collection):
+                    logger.success(" Search test passed")
+            
+            if full or stats["upserted"] or stats["deleted"]:
+                # Cached chatbot answers may quote documents that just changed
+                from ai_career_advisor.services.answer_cache import SemanticAnswerCache
+                SemanticAnswerCache.invalidate("knowledge base reindexed")
+            
+            self.last_result = {**stats, "finished_at": datetime.now().isoformat()}
+            self.progress.update({"status": "completed", "stage": "done"})
             
             logger.info("\n" + "=" * 60)
             logger.success(" SCHEDULED RE-INDEXING COMPLETE!")
             logger.info("=" * 60)
-            logger.info(f" Documents indexed: {valid_count}")
-            logger.info(f" Next re-index: Next Sunday 2:00 AM IST")
+            logger.info(f" Documents upserted: {stats['upserted']} (unchanged: {stats['unchanged']})")
+            logger.info(f" Documents deleted: {stats['deleted']}")
+            logger.info(f" Serving collection: {vs.resolve_alias('career_knowledge')}")
             logger.info("=" * 60)
         
         except Exception as e:
             logger.error(f" Re-indexing failed: {str(e)}")
             logger.exception(e)
+            self.last_result = {"error": str(e), "finished_at": datetime.now().isoformat()}
+            self.progress.update({"status": "failed", "error": str(e)})
     
     def start(self):
         """Start the scheduler"""
@@ -100,13 +90,26 @@ class KnowledgeBaseScheduler:
         self.scheduler.add_job(
             self.reindex_knowledge_base,
             trigger=CronTrigger(
-                day_of_week='sun',
                 hour=2,
                 minute=0,
                 timezone='Asia/Kolkata'
             ),
+            id='nightly_sync',
+            name='Nightly Incremental Knowledge Base Sync',
+            replace_existing=True
+        )
+        
+        self.scheduler.add_job(
+            self.reindex_knowledge_base,
+            trigger=CronTrigger(
+                day_of_week='sun',
+                hour=3,
+                minute=0,
+                timezone='Asia/Kolkata'
+            ),
+            kwargs={"full": True},
             id='weekly_reindex',
-            name='Weekly Knowledge Base Re-indexing',
+            name='Weekly Full Knowledge Base Re-indexing',
             replace_existing=True
         )
         
@@ -114,10 +117,10 @@ class KnowledgeBaseScheduler:
         self.is_running = True
         
         logger.success(" Scheduler started!")
-        logger.info("Schedule: Every Sunday 2:00 AM IST")
+        logger.info("Schedule: Nightly sync 2:00 AM IST, full re-index Sunday 3:00 AM IST")
         
         
-        job = self.scheduler.get_job('weekly_reindex')
+        job = self.scheduler.get_job('nightly_sync')
         if job:
             next_run = job.next_run_time
             logger.info(f" Next run: {next_run.strftime('%Y-%m-%d %H:%M:%S %Z')}")
@@ -129,9 +132,12 @@ class KnowledgeBaseScheduler:
             self.is_running = False
             logger.info("Scheduler stopped")
     
-    def trigger_manual_reindex(self):
-        """Manual trigger (for admin)"""
-        logger.info(" Manual re-index triggered")
-        asyncio.create_task(self.reindex_knowledge_base())
+    def trigger_manual_reindex(self, full: bool = False) -> bool:
+        """Manual trigger (for admin); False if a re-index is already running"""
+        if self.progress.get("status") == "running":
+            return False
+        logger.info(f" Manual {'full ' if full else ''}re-index triggered")
+        asyncio.create_task(self.reindex_knowledge_base(full=full))
+        return True
 
 scheduler = KnowledgeBaseScheduler()
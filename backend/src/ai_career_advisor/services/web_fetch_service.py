@@ -1,5 +1,5 @@
 from typing import List, Dict
-import httpx
+from ai_career_advisor.core.http_client import get_http_client
 from bs4 import BeautifulSoup
 
 
@@ -20,31 +20,33 @@ class WebFetchService:
 
         results = []
 
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            for url in urls:
-                try:
-                    response = await client.get(url)
+        # Arbitrary college sites share the default pooled client
+        client = get_http_client()
 
-                    if response.status_code != 200:
-                        continue
+        for url in urls:
+            try:
+                response = await client.get(url, timeout=10.0)
 
-                    soup = BeautifulSoup(response.text, "html.parser")
+                if response.status_code != 200:
+                    continue
 
-                    # remove scripts & styles
-                    for tag in soup(["script", "style", "noscript"]):
-                        tag.decompose()
+                soup = BeautifulSoup(response.text, "html.parser")
 
-                    text = soup.get_text(separator=" ", strip=True)
+                # remove scripts & styles
+                for tag in soup(["script", "style", "noscript"]):
+                    tag.decompose()
 
-                    if len(text) < 300:
-                        continue  # skip useless pages
+                text = soup.get_text(separator=" ", strip=True)
 
-                    results.append({
-                        "url": url,
-                        "text": text[:8000]  # limit size for LLM
-                    })
+                if len(text) < 300:
+                    continue  # skip useless pages
 
-                except Exception:
-                    continue  # fail-safe, never crash
+                results.append({
+                    "url": url,
+                    "text": text[:8000]  # limit size for LLM
+                })
+
+            except Exception:
+                continue  # fail-safe, never crash
 
         return results
@@ -0,0 +1,44 @@
+from ai_career_advisor.rag.bm25_index import BM25Index, tokenize
+
+
+def build_index():
+    index = BM25Index()
+    index.upsert([
+        ("iit-bombay", "IIT Bombay fees are around 2.5 lakh per year", "colleges"),
+        ("jee-cutoff", "JEE Advanced cutoff for IIT admission", "exams"),
+        ("doctor", "How to become a doctor after 12th: NEET and MBBS", "careers"),
+    ])
+    return index
+
+
+def test_tokenize_drops_stopwords_and_lowercases():
+    assert tokenize("What is the JEE Advanced cutoff?") == ["jee", "advanced", "cutoff"]
+
+
+def test_exact_terms_rank_first():
+    results = build_index().search("IIT Bombay fees")
+
+    assert results[0][0] == "iit-bombay"
+    assert {doc_id for doc_id, _ in results} == {"iit-bombay", "jee-cutoff"}
+
+
+def test_search_can_be_restricted_to_sources():
+    results = build_index().search("IIT", sources=["exams"])
+    assert [doc_id for doc_id, _ in results] == ["jee-cutoff"]
+
+
+def test_upsert_replaces_and_remove_deletes():
+    index = build_index()
+    index.upsert([("doctor", "Chartered accountant roadmap", "careers")])
+
+    assert index.search("NEET") == []
+    assert index.search("chartered")[0][0] == "doctor"
+
+    index.remove(["doctor"])
+    assert len(index) == 2
+    assert index.search("chartered") == []
+
+
+def test_no_terms_or_no_documents():
+    assert BM25Index().search("IIT") == []
+    assert build_index().search("the of and") == []
@@ -0,0 +1,118 @@
+import pytest
+
+from ai_career_advisor.core import circuit_breaker
+from ai_career_advisor.core.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("test", failure_rate=0.5, window_seconds=60, min_calls=3, cooldown_seconds=30)
+
+
+def test_stays_closed_below_min_calls(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_opens_at_failure_rate(breaker):
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.is_open()
+    assert not breaker.allow_request()
+    assert breaker.get_stats()["rejected"] == 1
+
+
+def test_failures_outside_the_window_are_forgotten(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.advance(61)
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_allows_a_single_probe(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.advance(30)
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.is_open()
+    assert breaker.allow_request()
+    assert breaker.is_open()
+    assert not breaker.allow_request()
+
+
+def test_successful_probe_closes(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.advance(30)
+    assert breaker.allow_request()
+
+    breaker.record_success()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.get_stats()["window_calls"] == 1
+
+
+def test_failed_probe_reopens(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.advance(30)
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.get_stats()["opened"] == 2
+
+
+def test_lost_probe_is_replaced_after_cooldown(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.advance(30)
+    assert breaker.allow_request()
+
+    clock.advance(30)
+
+    assert breaker.allow_request()
+
+
+def test_retry_after_opens_immediately(breaker, clock):
+    breaker.record_failure(retry_after=5)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.advance(5)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_registry_scopes_key_breakers_by_model(clock):
+    key_breaker = CircuitBreakerRegistry.for_key("gemini", "secret-key", "gemini-2.5-flash")
+
+    assert key_breaker is CircuitBreakerRegistry.for_key("gemini", "secret-key", "gemini-2.5-flash")
+    assert key_breaker is not CircuitBreakerRegistry.for_key("gemini", "secret-key", "gemini-2.5-flash-lite")
+    assert "secret-key" not in key_breaker.name
@@ -0,0 +1,83 @@
+import pytest
+
+from ai_career_advisor.core.keyword_matcher import KeywordMatcher
+from ai_career_advisor.services import query_keywords
+
+
+@pytest.fixture
+def matcher():
+    return KeywordMatcher(
+        {
+            "blacklist": ["porn", "sex"],
+            "career": ["iit", "ca", "data scientist", "college"],
+        },
+        prefix_categories=["blacklist"],
+    )
+
+
+@pytest.mark.parametrize("text", ["colleges in sussex", "middlesex", "essex university"])
+def test_keyword_inside_a_word_does_not_match(matcher, text):
+    assert "blacklist" not in matcher.scan(text)
+
+
+def test_keyword_must_end_on_a_word_boundary(matcher):
+    hits = matcher.scan("my cat likes canada")
+    assert "career" not in hits
+
+
+@pytest.mark.parametrize("text", ["best iits in india", "iit bombay", "top iit.", "iit-jee coaching"])
+def test_keyword_and_plural_match(matcher, text):
+    assert matcher.scan(text).first("career") == "iit"
+
+
+def test_prefix_category_matches_longer_words(matcher):
+    hits = matcher.scan("pornography sites")
+    assert hits.patterns("blacklist") == {"porn"}
+
+
+def test_prefix_category_still_needs_a_word_start(matcher):
+    assert "blacklist" not in matcher.scan("unisex hostel")
+
+
+def test_hits_are_grouped_and_ordered_by_position(matcher):
+    hits = matcher.scan("how to become a data scientist or ca after college")
+
+    assert [hit.pattern for hit in hits.get("career")] == ["data scientist", "ca", "college"]
+    assert hits.first("career") == "data scientist"
+    assert hits.categories() == ["career"]
+    assert hits.first("blacklist") is None
+
+
+def test_overlapping_keywords_are_all_reported():
+    matcher = KeywordMatcher({"roadmap": ["become a", "how to become", "to become"]})
+    hits = matcher.scan("how to become a doctor")
+
+    assert hits.patterns("roadmap") == {"become a", "how to become", "to become"}
+    assert hits.first("roadmap") == "how to become"
+
+
+def test_keywords_are_normalized_at_build_time():
+    matcher = KeywordMatcher({"greeting": ["Good Morning"]})
+    assert matcher.scan("good morning sir").first("greeting") == "good morning"
+
+
+@pytest.mark.parametrize("query, category", [
+    ("University of Sussex", "career"),
+    ("Best IITs for CSE", "career"),
+    ("I want to become a pilot", "roadmap"),
+    ("mujhe batao konsa stream lu", "hindi"),
+    ("Hello!", "greeting"),
+])
+def test_query_keywords_scan(query, category):
+    assert category in query_keywords.scan_query(query)
+
+
+def test_query_keywords_blacklist():
+    assert "blacklist" not in query_keywords.scan_query("University of Sussex")
+    assert "blacklist" in query_keywords.scan_query("show me pornographic images")
+
+
+def test_feature_categories():
+    hits = query_keywords.scan_query("Which stream after 10th?")
+    assert query_keywords.feature_category("stream") in hits
+    assert query_keywords.feature_category("college") not in hits
@@ -0,0 +1,80 @@
+import asyncio
+
+from ai_career_advisor.core.rate_limiter import AIMDConcurrency, TokenBucket
+
+
+def test_token_bucket_allows_a_burst_then_paces():
+    async def run():
+        bucket = TokenBucket(rate=50, capacity=2)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(3):
+            await bucket.acquire()
+        return loop.time() - started
+
+    # Two tokens are there at once, the third needs 1/50 s of refill
+    assert 0.015 <= asyncio.run(run()) < 0.5
+
+
+def test_token_bucket_drain_empties_it():
+    bucket = TokenBucket(rate=1, capacity=5)
+    bucket.drain()
+    assert bucket.tokens < 1
+
+
+def test_aimd_grows_on_success_and_halves_on_throttle():
+    async def run():
+        window = AIMDConcurrency(max_limit=8, initial_limit=4)
+        await window.acquire()
+        await window.release("success")
+        grown = window.limit
+        await window.acquire()
+        await window.release("throttled")
+        return grown, window.limit, window.in_flight
+
+    grown, throttled, in_flight = asyncio.run(run())
+    assert grown == 4.25
+    assert throttled == 2.125
+    assert in_flight == 0
+
+
+def test_aimd_limit_bounds():
+    async def run():
+        window = AIMDConcurrency(max_limit=2, initial_limit=2)
+        for _ in range(5):
+            await window.acquire()
+            await window.release("success")
+        high = window.limit
+        for _ in range(5):
+            await window.acquire()
+            await window.release("throttled")
+        return high, window.limit
+
+    assert asyncio.run(run()) == (2.0, 1.0)
+
+
+def test_aimd_blocks_beyond_the_limit():
+    async def run():
+        window = AIMDConcurrency(max_limit=1, initial_limit=1)
+        await window.acquire()
+        waiter = asyncio.ensure_future(window.acquire())
+        await asyncio.sleep(0.01)
+        blocked = not waiter.done()
+        await window.release("success")
+        await asyncio.wait_for(waiter, timeout=1)
+        return blocked, window.in_flight
+
+    assert asyncio.run(run()) == (True, 1)
+
+
+def test_aimd_throttle_blocks_new_permits_until_retry_after():
+    async def run():
+        window = AIMDConcurrency(max_limit=4, initial_limit=4)
+        await window.acquire()
+        await window.release("throttled", retry_after=0.05)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await window.acquire()
+        return loop.time() - started
+
+    assert asyncio.run(run()) >= 0.04
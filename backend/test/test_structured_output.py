@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+# Builds real SDK generation configs; skipped where google-generativeai is not installed
+generation_types = pytest.importorskip("google.generativeai.types.generation_types")
+
+from ai_career_advisor.core.circuit_breaker import CircuitBreakerRegistry
+from ai_career_advisor.core.model_manager import ModelManager
+from ai_career_advisor.Schemas.backward_planner import CareerNormalizationLLMOutput, RoadmapLLMOutput
+from ai_career_advisor.Schemas.career_insight import CareerInsightLLMOutput
+from ai_career_advisor.Schemas.college import CollegeDetailsLLMOutput
+
+
+STRUCTURED_SCHEMAS = [
+    CareerNormalizationLLMOutput,
+    CareerInsightLLMOutput,
+    RoadmapLLMOutput,
+    CollegeDetailsLLMOutput,
+]
+
+
+@pytest.mark.parametrize("schema", STRUCTURED_SCHEMAS, ids=lambda s: s.__name__)
+def test_generation_config_builds_for_schema(schema):
+    """The SDK must accept the response_schema we send (no network involved)"""
+    config = ModelManager.structured_generation_config(schema)
+
+    assert config["response_mime_type"] == "application/json"
+    assert "response_schema" in config
+    converted = generation_types.to_generation_config_dict(dict(config))
+    assert converted["response_schema"].properties
+
+
+def test_nullable_fields_and_required():
+    schema = ModelManager.structured_generation_config(CareerNormalizationLLMOutput)["response_schema"]
+
+    assert schema["required"] == ["is_valid"]
+    assert schema["properties"]["normalized_career"] == {"type": "string", "nullable": True}
+    assert "default" not in str(schema)
+
+
+def test_local_request_error_does_not_trip_breakers(monkeypatch):
+    """A config the SDK rejects is raised as-is and never counted against the model/key"""
+    model = "gemini-2.5-flash-lite"
+    monkeypatch.setattr(ModelManager, "GEMINI_API_KEYS", ["fake-key"])
+    CircuitBreakerRegistry.reset_all()
+    failures = CircuitBreakerRegistry.for_model("gemini", model).get_stats()["failures"]
+
+    with pytest.raises(ValueError):
+        asyncio.run(ModelManager.generate_with_gemini(
+            "hello", model=model, generation_config={"response_schema": CareerNormalizationLLMOutput}
+        ))
+
+    assert not CircuitBreakerRegistry.for_model("gemini", model).is_open()
+    assert CircuitBreakerRegistry.for_model("gemini", model).get_stats()["failures"] == failures